@@ -0,0 +1,54 @@
+"""
+Сравнение точечных запросов DominanceIndex с линейным просмотром всей матрицы.
+
+Запуск: python benchmarks/bench_dominance_index.py [--queries N]
+"""
+import argparse
+import time
+
+import numpy as np
+
+from t_ordering import DominanceIndex
+
+SIZES = [(100_000, 3), (1_000_000, 4)]
+
+
+def scan_count(matrix: np.ndarray, row: np.ndarray) -> int:
+    return int((np.all(matrix >= row, axis=1) & np.any(matrix > row, axis=1)).sum())
+
+
+def scan_any(matrix: np.ndarray, row: np.ndarray) -> bool:
+    return bool((np.all(matrix >= row, axis=1) & np.any(matrix > row, axis=1)).any())
+
+
+def measure(function, queries: np.ndarray) -> float:
+    """
+    Возвращает среднее время (в секундах) одного запроса.
+    """
+    start = time.perf_counter()
+    for row in queries:
+        function(row)
+    return (time.perf_counter() - start) / len(queries)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--queries", type=int, default=50)
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(0)
+    for num_alternatives, num_criteria in SIZES:
+        matrix = rng.random((num_alternatives, num_criteria))
+        queries = rng.random((args.queries, num_criteria))
+        index = DominanceIndex(matrix)
+        for name, indexed, scan in [
+            ("count_dominators", index.count_dominators, lambda row: scan_count(matrix, row)),
+            ("is_dominated", index.is_dominated, lambda row: scan_any(matrix, row)),
+        ]:
+            indexed_time, scan_time = measure(indexed, queries), measure(scan, queries)
+            print(f"{num_alternatives}x{num_criteria} {name:<17} индекс {indexed_time * 1000:7.2f} мс, "
+                  f"просмотр {scan_time * 1000:7.2f} мс (x{scan_time / indexed_time:.1f})")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,49 @@
+"""
+Замер времени импорта пакета t_ordering и запуска решения небольшой задачи.
+
+Каждый замер выполняется в отдельном процессе интерпретатора, чтобы исключить кэш модулей.
+Запуск: python benchmarks/bench_import.py [--repeat N]
+"""
+import argparse
+import statistics
+import subprocess
+import sys
+import time
+
+SCENARIOS = {
+    "python": "pass",
+    "import t_ordering": "import t_ordering",
+    "import t_ordering + solve": (
+        "from t_ordering import Criterion, DecisionModel\n"
+        "criterion = Criterion(name='c', absolute=True, maximize=True, min_value=0, max_value=1)\n"
+        "DecisionModel([criterion], {'c': [0.1, 0.5]}, []).t_ordering()\n"
+    ),
+    "import pandas": "import pandas",
+}
+
+
+def measure(code: str, repeat: int) -> float:
+    """
+    Возвращает медианное время (в секундах) запуска интерпретатора с указанным кодом.
+    """
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        subprocess.run([sys.executable, "-c", code], check=True, stdout=subprocess.DEVNULL)
+        timings.append(time.perf_counter() - start)
+    return statistics.median(timings)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--repeat", type=int, default=10)
+    args = parser.parse_args()
+
+    baseline = measure(SCENARIOS["python"], args.repeat)
+    for name, code in SCENARIOS.items():
+        elapsed = measure(code, args.repeat)
+        print(f"{name:<28} {elapsed * 1000:8.1f} мс  (+{(elapsed - baseline) * 1000:.1f} мс к запуску python)")
+
+
+if __name__ == "__main__":
+    main()
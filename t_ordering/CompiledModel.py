@@ -0,0 +1,158 @@
+import numpy as np
+from typing import List, Mapping, Optional
+from t_ordering import Preference
+from t_ordering import backends, core
+from t_ordering.DominanceIndex import DominanceIndex
+
+
+def _frozen(array) -> np.ndarray:
+    array = np.array(array)
+    array.setflags(write=False)
+    return array
+
+
+class CompiledModel:
+    def __init__(self, model):
+        """
+        Создает неизменяемый скомпилированный снимок модели DecisionModel.
+
+        Все этапы (нормализация, множество Парето, группы, отношения важности,
+        t-упорядочение, индекс доминирования) выполняются при создании, а их результаты
+        копируются в массивы только для чтения. Методы запросов не меняют объект и
+        возвращают результаты, поэтому один экземпляр можно использовать из многих потоков
+        одновременно; массивы хранятся один раз на процесс. Последующие изменения модели
+        на снимок не влияют.
+
+        Тяжелые операции выполняются над числовыми массивами NumPy (и ядрами Numba без
+        блокировки GIL, если выбран бэкенд "numba"), поэтому пул потоков использует несколько ядер.
+
+        Параметры:
+        - model: Объект DecisionModel.
+        """
+        model.compile()
+        criteria = list(model.criteria.values())
+        assign = object.__setattr__
+        assign(self, "criteria", tuple(criteria))
+        assign(self, "criterion_names", tuple(criterion.name for criterion in criteria))
+        assign(self, "preferences", tuple(model.preferences))
+        assign(self, "labels", _frozen(model.labels))
+        assign(self, "normalized_matrix", _frozen(np.asarray(model.normalized_matrix, dtype=float)))
+        assign(self, "pareto_index", _frozen(model.pareto_index))
+        assign(self, "group_of", _frozen(model.group_of))
+        assign(self, "importance_closure", _frozen(model.importance_closure))
+        assign(self, "pareto_t_index", _frozen(model.pareto_t_index))
+        assign(self, "backend", backends.get_backend(model.backend))
+        assign(self, "_front", _frozen(self.normalized_matrix[self.pareto_index]))
+        assign(self, "_dominance_index", DominanceIndex(self.normalized_matrix))
+        try:
+            default_weights = _frozen(model.criterion_weights())
+        except ValueError:
+            # Веса заданы не у всех критериев: запросы без явных весов завершатся ошибкой
+            default_weights = None
+        assign(self, "_default_weights", default_weights)
+
+    @classmethod
+    def from_model(cls, model) -> "CompiledModel":
+        """
+        Создает скомпилированный снимок модели (см. __init__).
+        """
+        return cls(model)
+
+    def __setattr__(self, name, value):
+        raise AttributeError("CompiledModel неизменяем; для изменений используйте DecisionModel и создайте новый снимок")
+
+    def __delattr__(self, name):
+        raise AttributeError("CompiledModel неизменяем; для изменений используйте DecisionModel и создайте новый снимок")
+
+    def __len__(self):
+        """
+        Возвращает число альтернатив.
+        """
+        return len(self.labels)
+
+    def pareto_front(self) -> np.ndarray:
+        """
+        Возвращает метки альтернатив множества Парето.
+        """
+        return self.labels[self.pareto_index]
+
+    def t_ordering(self, preferences_list: Optional[List[Preference]] = None) -> np.ndarray:
+        """
+        Возвращает метки альтернатив, оставшихся после t-упорядочения.
+
+        Параметры:
+        - preferences_list: Предпочтения запроса. По умолчанию — предпочтения модели
+          (результат вычислен при создании снимка); иначе t-упорядочение выполняется
+          для переданных предпочтений над множеством Парето снимка.
+        """
+        return self.labels[self.t_ordering_index(preferences_list)]
+
+    def t_ordering_index(self, preferences_list: Optional[List[Preference]] = None) -> np.ndarray:
+        """
+        Возвращает позиции альтернатив, оставшихся после t-упорядочения (см. t_ordering).
+        """
+        if preferences_list is None:
+            return self.pareto_t_index
+        group_of, closure = self._preference_structure(preferences_list)
+        sums = core.group_sums(self._front, group_of, closure.shape[0])
+        representatives, classes = core.row_classes(sums)
+        keep = core.t_ordering_mask(sums[representatives], closure, backend=self.backend)[classes]
+        return self.pareto_index[keep]
+
+    def _preference_structure(self, preferences_list: List[Preference]):
+        preference_pairs = [(pref.criterion1.name, pref.criterion2.name, pref.equivalent) for pref in preferences_list]
+        return core.preference_structure(self.criterion_names, preference_pairs)
+
+    def criterion_weights(self, weights=None) -> np.ndarray:
+        """
+        Возвращает веса критериев в порядке критериев, нормированные к сумме 1
+        (см. DecisionModel.criterion_weights).
+        """
+        if weights is not None:
+            return core.resolve_weights(self.criterion_names, weights)
+        if self._default_weights is None:
+            missing = [criterion.name for criterion in self.criteria if criterion.weight is None]
+            raise ValueError(f"Веса не заданы для критериев: {missing}")
+        return self._default_weights
+
+    def top_k(self, k: int, weights=None, among: str = "all") -> np.ndarray:
+        """
+        Находит метки k альтернатив с наибольшей взвешенной суммой (см. DecisionModel.top_k).
+        """
+        weights = self.criterion_weights(weights)
+        if among == "all":
+            positions = None
+        elif among == "pareto":
+            positions = self.pareto_index
+        elif among == "pareto_t":
+            positions = self.pareto_t_index
+        else:
+            raise ValueError(f"Неизвестное множество альтернатив: '{among}'")
+        matrix = self.normalized_matrix if positions is None else self.normalized_matrix[positions]
+        selected = core.top_k(core.weighted_scores(matrix, weights), k)
+        return self.labels[selected if positions is None else positions[selected]]
+
+    def normalize_values(self, values: Mapping) -> np.ndarray:
+        """
+        Нормализует значения одной альтернативы, не входящей в модель.
+        """
+        return core.normalize_row(values, self.criteria)
+
+    def is_dominated(self, values: Mapping) -> bool:
+        """
+        Проверяет, доминирует ли над альтернативой values хотя бы одна альтернатива снимка.
+        """
+        return self._dominance_index.is_dominated(self.normalize_values(values))
+
+    def dominators(self, values: Mapping) -> np.ndarray:
+        """
+        Возвращает метки альтернатив снимка, доминирующих над альтернативой values.
+        """
+        return self.labels[self._dominance_index.dominators(self.normalize_values(values))]
+
+    def __str__(self):
+        """
+        Возвращает строковое представление объекта CompiledModel.
+        """
+        return (f"CompiledModel: {len(self)} альтернатив, {len(self.criteria)} критериев, "
+                f"{len(self.pareto_index)} в множестве Парето, {len(self.pareto_t_index)} после t-упорядочения")
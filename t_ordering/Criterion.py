@@ -9,6 +9,7 @@ class Criterion:
         valid_values: List[str] = None,
         min_value: float = None,
         max_value: float = None,
+        weight: float = None,
     ):
         """
         Инициализирует объект Критерия.
@@ -20,11 +21,15 @@ class Criterion:
         - valid_values: Для порядковых критериев — упорядоченный список допустимых строковых значений.
         - min_value: Для абсолютных критериев — минимальное допустимое значение.
         - max_value: Для абсолютных критериев — максимальное допустимое значение.
+        - weight: Вес критерия для ранжирования по взвешенной сумме (см. DecisionModel.top_k);
+          если веса не заданы, они выводятся из предпочтений.
         """
         self.name = name
         self.absolute = absolute
         self.maximize = maximize
-        self.weight = None  # Вес критерия, заполняется позже
+        if weight is not None and not weight > 0:
+            raise ValueError(f"Вес критерия '{self.name}' должен быть положительным")
+        self.weight = weight  # Вес критерия для взвешенной суммы
 
         if self.is_ordinal():
             if valid_values is None or not isinstance(valid_values, list):
@@ -64,6 +69,35 @@ class Criterion:
         else:
             return False
 
+    def to_dict(self):
+        """
+        Возвращает описание критерия в виде словаря, пригодного для сериализации в JSON.
+        """
+        data = {"name": self.name, "absolute": self.absolute, "maximize": self.maximize}
+        if self.is_ordinal():
+            data["valid_values"] = list(self.valid_values)
+        else:
+            data["min_value"] = self.min_value
+            data["max_value"] = self.max_value
+        if self.weight is not None:
+            data["weight"] = self.weight
+        return data
+
+    @classmethod
+    def from_dict(cls, data):
+        """
+        Создает объект Criterion из словаря с описанием критерия (см. to_dict).
+        """
+        return cls(
+            name=data["name"],
+            absolute=data["absolute"],
+            maximize=data["maximize"],
+            valid_values=data.get("valid_values"),
+            min_value=data.get("min_value"),
+            max_value=data.get("max_value"),
+            weight=data.get("weight"),
+        )
+
     def __str__(self):
         """
         Возвращает строковое представление объекта Criterion.
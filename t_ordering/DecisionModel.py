@@ -1,199 +1,561 @@
-import pandas as pd
-from typing import List, Dict, Tuple
+import itertools
+import numpy as np
+from typing import List, Dict, Mapping, Tuple
 from t_ordering import Criterion, Preference
+from t_ordering import backends, core
+from t_ordering.DominanceIndex import DominanceIndex
+from t_ordering.DominanceRelation import DominanceRelation
+from t_ordering.ingest import is_pandas_frame, read_alternatives
+from t_ordering.storage import load_arrays, save_arrays
+
+# Формат и версия файлов, создаваемых DecisionModel.save
+MODEL_FORMAT = "t_ordering.DecisionModel"
+MODEL_FORMAT_VERSION = 1
+
+# Наибольшее число критериев, предпочтений и групп, выводимых полностью; при большем
+# числе (например, тысячах сгенерированных критериев) выводятся первые и общее число
+DISPLAY_LIMIT = 20
+
+# Входы модели; каждое изменение входа увеличивает его версию
+MODEL_INPUTS = ("criteria", "data", "preferences")
+# Этапы вычислений: этап -> входы и этапы, результаты которых он использует
+STAGE_DEPENDENCIES = {
+    "normalized": ("criteria", "data"),
+    "pareto": ("normalized",),
+    "front_ranks": ("normalized",),
+    "dominance_index": ("normalized",),
+    "groups": ("criteria", "preferences"),
+    "importance": ("groups",),
+    "front_sums": ("pareto", "groups"),
+    "pareto_t": ("pareto", "front_sums", "importance"),
+    "t_relation": ("pareto", "front_sums", "importance"),
+}
+
+
+class _StageOutput:
+    """
+    Результат этапа вычислений. При чтении этап выполняется, если результата еще нет
+    или изменилось то, от чего он зависит; значение хранится в атрибуте "_<имя>".
+    """
+
+    def __init__(self, stage: str, doc: str):
+        self.stage = stage
+        self.__doc__ = doc
+
+    def __set_name__(self, owner, name):
+        self.attribute = "_" + name
+
+    def __get__(self, model, owner=None):
+        if model is None:
+            return self
+        model._require_stage(self.stage)
+        return getattr(model, self.attribute)
+
+
+def _shorten(items, total: int, limit: int = DISPLAY_LIMIT) -> List[str]:
+    """
+    Возвращает строки первых limit элементов и строку с числом остальных.
+    """
+    lines = [str(item) for item in itertools.islice(items, limit)]
+    if total > limit:
+        lines.append(f"... (всего {total})")
+    return lines
+
 
 class DecisionModel:
-    def __init__(self, criteria_list: List[Criterion], alternatives_df: pd.DataFrame, preferences_list: List[Preference]):
+    normalized_matrix = _StageOutput("normalized", "Матрица нормализованных значений (альтернативы x критерии).")
+    pareto_index = _StageOutput("pareto", "Позиции альтернатив из множества Парето.")
+    front_ranks = _StageOutput("front_ranks", "Ранги фронтов Парето (1 — множество Парето).")
+    dominance_index = _StageOutput(
+        "dominance_index", "Пространственный индекс доминирования над нормализованными альтернативами (см. DominanceIndex)."
+    )
+    groups = _StageOutput("groups", "Группы эквивалентных критериев (список множеств имен).")
+    group_of = _StageOutput("groups", "Номер группы для каждого критерия.")
+    criterion_to_group = _StageOutput("groups", "Группа каждого критерия.")
+    importance_closure = _StageOutput("importance", "Замыкание отношения важности групп.")
+    group_ids = _StageOutput("importance", "Группы по целочисленным номерам.")
+    group_importance_graph = _StageOutput("importance", "Номера более важных групп для каждой группы.")
+    front_sums = _StageOutput("front_sums", "Групповые суммы альтернатив множества Парето.")
+    pareto_t_index = _StageOutput("pareto_t", "Позиции альтернатив, оставшихся после t-упорядочения.")
+    t_dominance_relation = _StageOutput(
+        "t_relation", "Отношение t-доминирования между альтернативами множества Парето (см. DominanceRelation)."
+    )
+
+    def __init__(self, criteria_list: List[Criterion], alternatives_df, preferences_list: List[Preference], index=None,
+                 backend=None):
         """
         Инициализирует объект DecisionModel.
 
+        Этапы вычислений (нормализация, множество Парето, группы, отношения важности,
+        t-упорядочение) выполняются при первом обращении к их результатам и повторно —
+        только после изменения входов, от которых они зависят (см. update).
+
         Параметры:
         - criteria_list: Список объектов Criterion.
-        - alternatives_df: DataFrame с альтернативами и значениями критериев.
+        - alternatives_df: DataFrame с альтернативами и значениями критериев либо словарь
+          {имя столбца: значения}. Для словаря pandas не импортируется, а результаты
+          возвращаются массивами NumPy вместо DataFrame.
         - preferences_list: Список объектов Preference.
+        - index: Для словаря — имя столбца с метками альтернатив или последовательность меток.
+        - backend: Набор вычислительных ядер доминирования ("python", "numpy", "numba" или
+          объект backends.Backend); по умолчанию — набор процесса (см. backends.set_backend).
+          Результаты от набора не зависят, поэтому его можно менять в любой момент.
+        """
+        self._init_stages()
+        self.backend = backend  # Набор ядер доминирования (None — набор процесса)
+        self.pareto_epsilon = None  # epsilon приближенного множества Парето (None — точное)
+        self._pareto_options = {}  # Параметры последнего поиска множества Парето
+        self.update(criteria_list, alternatives_df, preferences_list, index)
+
+    def _init_stages(self):
+        self._versions = dict.fromkeys(MODEL_INPUTS + tuple(STAGE_DEPENDENCIES), 0)
+        self._stage_inputs: Dict[str, Tuple[int, ...]] = {}  # Версии зависимостей, по которым выполнен этап
+        self._frames = {}  # DataFrame-представления результатов, строятся по запросу
+
+    def _dependency_versions(self, stage: str) -> Tuple[int, ...]:
+        return tuple(self._versions[dependency] for dependency in STAGE_DEPENDENCIES[stage])
+
+    def _stage_is_current(self, stage: str) -> bool:
+        """
+        Проверяет, что этап выполнен и с тех пор не изменилось ничего, от чего он зависит.
+        """
+        return self._stage_inputs.get(stage) == self._dependency_versions(stage) and all(
+            self._stage_is_current(dependency) for dependency in STAGE_DEPENDENCIES[stage]
+            if dependency in STAGE_DEPENDENCIES
+        )
+
+    def _stage_done(self, stage: str):
+        self._versions[stage] += 1
+        self._stage_inputs[stage] = self._dependency_versions(stage)
+
+    def _require_stage(self, stage: str):
+        if self._stage_is_current(stage):
+            return
+        for dependency in STAGE_DEPENDENCIES[stage]:
+            if dependency in STAGE_DEPENDENCIES:
+                self._require_stage(dependency)
+        if stage == "normalized":
+            self.normalize_data()
+        elif stage == "pareto":
+            self.find_pareto_front(**self._pareto_options)
+        elif stage == "front_ranks":
+            self.sort_fronts()
+        elif stage == "dominance_index":
+            self._dominance_index = DominanceIndex(self._normalized_matrix)
+            self._stage_done(stage)
+        elif stage == "groups":
+            self._get_equivalent_groups()
+        elif stage == "importance":
+            self._assign_importance_relations()
+        elif stage == "front_sums":
+            self._front_sums = core.group_sums(self.normalized_matrix[self.pareto_index], self.group_of, len(self.groups))
+            self._stage_done(stage)
+        elif stage == "pareto_t":
+            self._apply_t_ordering()
+        elif stage == "t_relation":
+            self._t_dominance_relation = DominanceRelation.from_sums(
+                self.front_sums, self.importance_closure, self.pareto_index, backend=self.backend
+            )
+            self._stage_done(stage)
+
+    @property
+    def criteria(self) -> Dict[str, Criterion]:
+        """
+        Критерии модели по именам. Присваивание списка критериев равносильно update(criteria_list=...).
+        """
+        return self._criteria
+
+    @criteria.setter
+    def criteria(self, criteria_list):
+        self.update(criteria_list=criteria_list)
+
+    @property
+    def preferences(self) -> List[Preference]:
+        """
+        Предпочтения модели. Присваивание списка равносильно update(preferences_list=...);
+        изменения списка на месте не отслеживаются.
+        """
+        return self._preferences
+
+    @preferences.setter
+    def preferences(self, preferences_list):
+        self.update(preferences_list=preferences_list)
+
+    def update(self, criteria_list=None, alternatives=None, preferences_list=None, index=None):
+        """
+        Заменяет входы модели и проверяет модель. Результаты этапов, зависящих от измененных
+        входов, пересчитываются при следующем обращении; остальные результаты сохраняются.
+
+        Параметры:
+        - criteria_list: Новый список объектов Criterion (или словарь по именам).
+        - alternatives: Новые альтернативы (см. __init__); index задает их метки.
+        - preferences_list: Новый список объектов Preference.
+
+        Возвращает:
+        - Сам объект DecisionModel.
+        """
+        # При ошибке валидации модель остается в прежнем состоянии
+        previous_state, previous_versions = dict(self.__dict__), dict(getattr(self, "_versions", {}))
+        try:
+            self._set_inputs(criteria_list, alternatives, preferences_list, index)
+        except Exception:
+            self.__dict__.clear()
+            self.__dict__.update(previous_state)
+            self._versions.clear()
+            self._versions.update(previous_versions)
+            raise
+        return self
+
+    def _set_inputs(self, criteria_list, alternatives, preferences_list, index):
+        if criteria_list is not None:
+            if isinstance(criteria_list, Mapping):
+                criteria_list = list(criteria_list.values())
+            self._criteria = {criterion.name: criterion for criterion in criteria_list}
+            self._positions = {name: position for position, name in enumerate(self._criteria)}
+            self._versions["criteria"] += 1
+        if alternatives is not None:
+            self.as_frame = is_pandas_frame(alternatives)
+            self.alternatives = alternatives.copy() if self.as_frame else alternatives
+            self.labels, self.columns = read_alternatives(self.alternatives, index)
+            self._index_name = self.alternatives.index.name if self.as_frame else None
+            self._versions["data"] += 1
+        if preferences_list is not None:
+            self._preferences = list(preferences_list)
+            self._versions["preferences"] += 1
+
+        if criteria_list is not None or alternatives is not None:
+            self.validate_model()
+        else:
+            self._validate_preferences()
+
+    @property
+    def normalized_alternatives(self):
         """
-        self.pareto_front = None
-        self.criteria = {criterion.name: criterion for criterion in criteria_list}
-        self.alternatives = alternatives_df.copy()
-        self.preferences = preferences_list
-        self.normalized_alternatives = None  # DataFrame с нормализованными значениями
-        self.validate_model()
-        self.normalize_data()
+        Нормализованные альтернативы: DataFrame для входного DataFrame, иначе матрица NumPy.
+        """
+        if not self.as_frame:
+            return self.normalized_matrix
+        return self._frame("normalized", "normalized", self._build_normalized_frame)
+
+    def _build_normalized_frame(self):
+        if self.alternatives is None:
+            # Модель загружена из файла: исходных столбцов нет, только критерии
+            import pandas as pd
+
+            normalized_df = pd.DataFrame(self.normalized_matrix, index=self.labels, columns=list(self.criteria))
+            normalized_df.index.name = self._index_name
+        else:
+            normalized_df = self.alternatives.copy()
+            for position, name in enumerate(self.criteria):
+                normalized_df[name] = self.normalized_matrix[:, position]
+        return normalized_df
+
+    @property
+    def pareto_front(self):
+        """
+        Множество Парето: DataFrame для входного DataFrame, иначе массив меток альтернатив.
+        """
+        return self._select("pareto_front", "pareto", "pareto_index")
+
+    @property
+    def pareto_t(self):
+        """
+        Альтернативы после t-упорядочения: DataFrame для входного DataFrame, иначе массив меток.
+        """
+        return self._select("pareto_t", "pareto_t", "pareto_t_index")
+
+    def _frame(self, key, stage, build):
+        """
+        Возвращает DataFrame-представление результата этапа, построенное для его текущей версии.
+        """
+        self._require_stage(stage)
+        version = self._versions[stage]
+        if key not in self._frames or self._frames[key][0] != version:
+            self._frames[key] = (version, build())
+        return self._frames[key][1]
+
+    def _select(self, key, stage, attribute):
+        positions = getattr(self, attribute)
+        if not self.as_frame:
+            return self.labels[positions]
+        return self._frame(key, stage, lambda: self.normalized_alternatives.iloc[getattr(self, attribute)])
 
     def validate_model(self):
         """
         Выполняет валидацию модели: проверяет корректность данных и отсутствие циклов в предпочтениях.
         """
-        # Проверка, что все критерии присутствуют в DataFrame альтернатив
-        for criterion in self.criteria.values():
-            if criterion.name not in self.alternatives.columns:
-                raise ValueError(
-                    f"Критерий '{criterion.name}' отсутствует в DataFrame альтернатив"
-                )
-            # Проверка типа данных столбца
-            if criterion.is_absolute():
-                if not pd.api.types.is_numeric_dtype(self.alternatives[criterion.name]):
-                    raise ValueError(
-                        f"Критерий '{criterion.name}' должен иметь числовой тип данных"
-                    )
-                # Проверка допустимых значений
-                if not self.alternatives[criterion.name].between(
-                    criterion.min_value, criterion.max_value
-                ).all():
-                    invalid_values = self.alternatives[
-                        ~self.alternatives[criterion.name].between(
-                            criterion.min_value, criterion.max_value
-                        )
-                    ][criterion.name]
-                    raise ValueError(
-                        f"Значения {invalid_values.tolist()} для критерия '{criterion.name}' выходят за допустимый диапазон [{criterion.min_value}, {criterion.max_value}]"
-                    )
-            elif criterion.is_ordinal():
-                if not pd.api.types.is_object_dtype(self.alternatives[criterion.name]):
-                    raise ValueError(
-                        f"Критерий '{criterion.name}' должен иметь строковый тип данных для порядковых значений"
-                    )
-                # Проверка допустимых значений
-                if not self.alternatives[criterion.name].isin(criterion.valid_values).all():
-                    invalid_values = self.alternatives[
-                        ~self.alternatives[criterion.name].isin(criterion.valid_values)
-                    ][criterion.name]
-                    raise ValueError(
-                        f"Значения {invalid_values.tolist()} для критерия '{criterion.name}' не входят в допустимые значения {criterion.valid_values}"
-                    )
+        self._require_source_data()
+        # Проверка, что все критерии присутствуют в альтернативах, и проверка типов и значений столбцов
+        core.validate_columns(self.columns, list(self.criteria.values()))
+        self._validate_preferences()
+
+    def _validate_preferences(self):
         # Проверка, что все критерии из предпочтений присутствуют в списке критериев
-        criterion_names = set(self.criteria.keys())
         for pref in self.preferences:
-            if pref.criterion1.name not in criterion_names:
+            if pref.criterion1.name not in self._positions:
                 raise ValueError(f"Критерий '{pref.criterion1.name}' из предпочтений отсутствует в списке критериев")
-            if pref.criterion2.name not in criterion_names:
+            if pref.criterion2.name not in self._positions:
                 raise ValueError(f"Критерий '{pref.criterion2.name}' из предпочтений отсутствует в списке критериев")
         # Проверка на циклы в предпочтениях
         self.check_for_cycles()
+        self._set_preference_ids()
+
+    def _set_preference_ids(self):
+        # Предпочтения по целочисленным позициям критериев: пары (первый, второй) и признак эквивалентности
+        self._preference_ids = np.array(
+            [(self._positions[pref.criterion1.name], self._positions[pref.criterion2.name]) for pref in self.preferences],
+            dtype=np.int64,
+        ).reshape(-1, 2)
+        self._preference_equivalent = np.array([bool(pref.equivalent) for pref in self.preferences], dtype=bool)
 
     def check_for_cycles(self):
         """
         Проверяет наличие циклов в предпочтениях критериев.
         Если цикл найден, выбрасывает исключение ValueError с подробной информацией о цикле.
         """
-        # Построение графа предпочтений
-        graph: Dict[str, List[Tuple[str, bool]]] = {}
-        for criterion in self.criteria.values():
-            graph[criterion.name] = []
-
-        # Добавляем ребра в граф
-        for pref in self.preferences:
-            c1 = pref.criterion1.name
-            c2 = pref.criterion2.name
-            if pref.equivalent:
-                # Добавляем двунаправленные ребра для эквивалентности
-                graph[c1].append((c2, False))  # False означает, что ребро не строгое
-                graph[c2].append((c1, False))
-            else:
-                # Добавляем направленное ребро для строгого предпочтения
-                graph[c1].append((c2, True))  # True означает, что ребро строгое
-
-        def dfs(node, parent, has_strict_edge, stack):
-            stack.append(node)
-            for neighbor, is_strict in graph[node]:
-                path_has_strict_edge = has_strict_edge or is_strict
-                if (neighbor != stack[0]) and (len(stack) < 3):
-                    if dfs(neighbor, node, path_has_strict_edge, stack):
-                        return True
-                elif neighbor == stack[0] and path_has_strict_edge:
-                    # Если найден цикл, и по пути есть хотя бы одно строгое предпочтение, то собираем цикл
-                    cycle = []
-                    idx = stack.index(neighbor)
-                    cycle_nodes = stack[idx:] + [neighbor]
-                    for i in range(len(cycle_nodes) - 1):
-                        n1 = cycle_nodes[i]
-                        n2 = cycle_nodes[i + 1]
-                        # Найдем отношение между n1 и n2
-                        for neighbor_name, is_strict_edge in graph[n1]:
-                            if neighbor_name == n2:
-                                relation = ">" if is_strict_edge else "="
-                                cycle.append(f"{n1} {relation} {n2}")
-                                break
-                    error_message = "Обнаружен цикл в предпочтениях: " + " -> ".join(cycle)
-                    raise ValueError(error_message)
-            stack.pop()
-            return False
-
-        for node in graph:
-            if dfs(node, None, False, []):
-                return
+        preference_pairs = [(pref.criterion1.name, pref.criterion2.name, pref.equivalent) for pref in self.preferences]
+        core.check_preference_cycles(list(self.criteria), preference_pairs)
 
     def normalize_data(self):
         """
         Нормализует исходные данные альтернатив по каждому критерию.
+        Результаты этапов, использующих нормализованные значения, пересчитываются при следующем обращении.
         """
-        normalized_df = self.alternatives.copy()
-        for criterion in self.criteria.values():
-            if criterion.is_ordinal():
-                if len(criterion.valid_values) == 1:
-                    normalized_df[criterion.name] = 1.0
-                    continue
-                # Кодирование порядковых значений от 0 до n
-                value_to_number = {value: idx for idx, value in enumerate(criterion.valid_values)}
-                normalized_values = normalized_df[criterion.name].map(value_to_number)
-                # Сохраняем минимальное и максимальное значение после кодирования
-                K_min = 0
-                K_max = len(criterion.valid_values) - 1
-                Alt_star = normalized_values.astype(float)
-            else:
-                # Абсолютный критерий
-                if criterion.min_value == criterion.max_value:
-                    normalized_df[criterion.name] = 1.0
-                    continue
-                Alt_star = normalized_df[criterion.name].astype(float)
-                K_min = criterion.min_value
-                K_max = criterion.max_value
-
-            # Применяем нормализацию
-            if criterion.is_maximize():
-                normalized_values = (Alt_star - K_min) / (K_max - K_min)
-            else:
-                normalized_values = (K_max - Alt_star) / (K_max - K_min)
+        self._require_source_data()
+        self._normalized_matrix = core.normalize_matrix(self.columns, list(self.criteria.values()))
+        self._stage_done("normalized")
+        return self.normalized_alternatives
 
-            normalized_df[criterion.name] = normalized_values
+    def update_criterion(self, criterion: Criterion):
+        """
+        Заменяет описание одного критерия (границы, допустимые значения, направление),
+        пересчитывая только его столбец нормализованных значений.
 
-        self.normalized_alternatives = normalized_df
-        return normalized_df
+        Если новые нормализованные значения получены из прежних строго возрастающим
+        преобразованием (например, изменилась граница абсолютного критерия или список
+        допустимых значений расширен без изменения порядка прежних), доминирование не
+        меняется: точное множество Парето и ранги фронтов сохраняются, а перед
+        t-упорядочением пересчитываются только суммы группы этого критерия.
+        Иначе множество Парето и зависящие от него результаты пересчитываются при следующем обращении.
 
-    def find_pareto_front(self):
+        Параметры:
+        - criterion: Новый объект Criterion с именем одного из критериев модели.
+
+        Возвращает:
+        - Сам объект DecisionModel.
+        """
+        name = criterion.name
+        if name not in self.criteria:
+            raise ValueError(f"Критерий '{name}' отсутствует в списке критериев")
+        self._require_source_data()
+        core.validate_column(self.columns[name], criterion)
+        self._criteria[name] = criterion
+        if not self._stage_is_current("normalized"):
+            # Нормализованных значений еще нет или они устарели: они будут построены целиком
+            return self
+
+        position = self._positions[name]
+        keep_front = self._stage_is_current("pareto") and self.pareto_epsilon is None
+        keep_ranks = self._stage_is_current("front_ranks")
+        keep_sums = self._stage_is_current("front_sums")
+        matrix = self._normalized_matrix
+        if not matrix.flags.writeable:
+            matrix = matrix.copy()
+        new_column = core.normalize_column(self.columns[name], criterion)
+        monotone = core.is_order_preserving(matrix[:, position], new_column)
+        matrix[:, position] = new_column
+        self._normalized_matrix = matrix
+        self._stage_done("normalized")
+        if not monotone:
+            return self
+
+        # Отношения доминирования не изменились: прежние результаты остаются верными
+        if keep_ranks:
+            self._stage_done("front_ranks")
+        if keep_front:
+            self._stage_done("pareto")
+            if keep_sums:
+                group = self._group_of[position]
+                self._front_sums[:, group] = core.group_sums(
+                    matrix[self._pareto_index], self._group_of, len(self._groups), groups=[group]
+                )[:, 0]
+                self._stage_done("front_sums")
+        return self
+
+    def find_pareto_front(self, workers: int = None, tree_merge: bool = False, epsilon: float = None,
+                          method: str = "auto", presort: str = "sum"):
         """
         Находит множество Парето среди нормализованных альтернатив.
 
+        Параметры:
+        - workers: число процессов для параллельного поиска (см. t_ordering.parallel);
+          по умолчанию поиск выполняется в текущем процессе.
+        - tree_merge: при параллельном поиске объединять локальные множества Парето деревом.
+        - epsilon: если задан, вместо точного множества Парето строится приближенное по
+          ε-доминированию (см. core.epsilon_pareto_mask): каждая исключенная альтернатива
+          уступает одной из оставленных не более чем на epsilon по каждому критерию.
+        - method: алгоритм точного поиска в текущем процессе: "sfs" — блочная фильтрация
+          с предварительной сортировкой (core.pareto_front_mask), "bitmap" — битовые индексы
+          уровней (t_ordering.bitmap), "auto" — "bitmap", если порядковых критериев не меньше
+          половины, иначе "sfs".
+        - presort: ключ предварительной сортировки алгоритма "sfs": "sum" — сумма значений,
+          "score" — взвешенная сумма (см. criterion_weights); при весах, близких к
+          предпочтениям пользователя, фронт набирается быстрее.
+
+        Параметры запоминаются и используются при пересчете множества Парето после изменения данных.
+
         Результат:
         - Обновляет self.pareto_front с альтернативами из множества Парето.
         """
-        if self.normalized_alternatives is None:
-            raise ValueError("Данные не нормализованы. Пожалуйста, выполните нормализацию перед поиском множества Парето.")
-
-        pareto_front = []
-        dominated = set()
-
-        alternatives = self.normalized_alternatives
-        alternatives_matrix = alternatives.values
-        num_alternatives = alternatives.shape[0]
-        indices = alternatives.index.tolist()
-
-        for i in range(num_alternatives):
-            if i in dominated:
-                continue
-            for j in range(num_alternatives):
-                if i == j or j in dominated:
-                    continue
-                if self._dominates(alternatives_matrix[j], alternatives_matrix[i]):
-                    dominated.add(i)
-                    break
+        normalized_matrix = self.normalized_matrix
+        if epsilon is not None:
+            pareto_index = np.flatnonzero(core.epsilon_pareto_mask(normalized_matrix, epsilon))
+        else:
+            # Доминирование проверяется только для одного представителя каждого класса совпадающих строк
+            representatives, classes = core.row_classes(normalized_matrix)
+            matrix = normalized_matrix[representatives]
+            engine = method
+            if engine == "auto":
+                num_ordinal = sum(criterion.is_ordinal() for criterion in self.criteria.values())
+                engine = "bitmap" if 2 * num_ordinal >= len(self.criteria) else "sfs"
+            if engine not in ("sfs", "bitmap"):
+                raise ValueError(f"Неизвестный алгоритм поиска множества Парето: '{method}'")
+            if presort not in ("sum", "score"):
+                raise ValueError(f"Неизвестный ключ предварительной сортировки: '{presort}'")
+            if workers is not None and workers > 1:
+                from t_ordering.parallel import parallel_pareto_front_mask
+
+                mask = parallel_pareto_front_mask(matrix, workers=workers, tree_merge=tree_merge)
+            elif engine == "bitmap":
+                from t_ordering.bitmap import bitmap_pareto_front_mask
+
+                mask = bitmap_pareto_front_mask(matrix)
             else:
-                pareto_front.append(indices[i])
-
-        self.pareto_front = self.normalized_alternatives.loc[pareto_front]
-        print(f"Найдено {len(self.pareto_front)} альтернатив в множестве Парето.\n")
+                key = core.weighted_scores(matrix, self.criterion_weights()) if presort == "score" else None
+                mask = core.pareto_front_mask(matrix, key=key, backend=self.backend)
+            pareto_index = np.flatnonzero(mask[classes])
+        self._pareto_index = pareto_index
+        self.pareto_epsilon = epsilon
+        self._pareto_options = {"workers": workers, "tree_merge": tree_merge, "epsilon": epsilon, "method": method,
+                                "presort": presort}
+        self._stage_done("pareto")
+        if epsilon is not None:
+            print(f"Найдено {len(pareto_index)} альтернатив в ε-множестве Парето (ε = {epsilon}).\n")
+        else:
+            print(f"Найдено {len(pareto_index)} альтернатив в множестве Парето.\n")
         return self.pareto_front
 
+    def sort_fronts(self, method: str = "auto"):
+        """
+        Разбивает альтернативы на фронты Парето (недоминируемая сортировка).
+
+        Параметры:
+        - method: алгоритм сортировки (см. core.nondominated_ranks).
+
+        Результат:
+        - Обновляет self.front_ranks — массив рангов фронтов в порядке строк
+          normalized_alternatives, и self.pareto_index, если множество Парето еще не найдено.
+        """
+        normalized_matrix = self.normalized_matrix
+        representatives, classes = core.row_classes(normalized_matrix)
+        self._front_ranks = core.nondominated_ranks(normalized_matrix[representatives], method)[classes]
+        self._stage_done("front_ranks")
+        if not self._stage_is_current("pareto"):
+            self._pareto_index = np.flatnonzero(self._front_ranks == 1)
+            self.pareto_epsilon = None
+            self._pareto_options = {}
+            self._stage_done("pareto")
+        num_fronts = int(self._front_ranks.max()) if len(self._front_ranks) else 0
+        print(f"Альтернативы разбиты на {num_fronts} фронтов Парето.\n")
+        return self._front_ranks
+
+    def criterion_weights(self, weights=None) -> np.ndarray:
+        """
+        Возвращает веса критериев в порядке критериев, нормированные к сумме 1.
+
+        Параметры:
+        - weights: Словарь {имя критерия: вес} или последовательность весов в порядке критериев.
+          По умолчанию используются Criterion.weight, а если веса не заданы ни у одного
+          критерия — веса, выведенные из предпочтений (см. core.preference_weights).
+        """
+        if weights is None:
+            given = [criterion.weight for criterion in self.criteria.values()]
+            if all(weight is None for weight in given):
+                return core.preference_weights(self.group_of, self.importance_closure)
+            if any(weight is None for weight in given):
+                missing = [name for name, weight in zip(self.criteria, given) if weight is None]
+                raise ValueError(f"Веса не заданы для критериев: {missing}")
+            weights = given
+        return core.resolve_weights(list(self.criteria), weights)
+
+    def weighted_scores(self, weights=None) -> np.ndarray:
+        """
+        Вычисляет взвешенные суммы нормализованных значений всех альтернатив (в порядке строк).
+
+        Параметры:
+        - weights: веса критериев (см. criterion_weights).
+        """
+        return core.weighted_scores(self.normalized_matrix, self.criterion_weights(weights))
+
+    def top_k(self, k: int, weights=None, among: str = "all"):
+        """
+        Находит k альтернатив с наибольшей взвешенной суммой без полной сортировки.
+
+        Параметры:
+        - k: число альтернатив.
+        - weights: веса критериев (см. criterion_weights).
+        - among: среди каких альтернатив выбирать: "all" — все, "pareto" — множество Парето,
+          "pareto_t" — альтернативы после t-упорядочения.
+
+        Возвращает:
+        - DataFrame для входного DataFrame, иначе массив меток; по убыванию взвешенной суммы.
+        """
+        weights = self.criterion_weights(weights)
+        if among == "all":
+            selected = core.top_k(core.weighted_scores(self.normalized_matrix, weights), k)
+        elif among in ("pareto", "pareto_t"):
+            positions = self.pareto_index if among == "pareto" else self.pareto_t_index
+            selected = positions[core.top_k(core.weighted_scores(self.normalized_matrix[positions], weights), k)]
+        else:
+            raise ValueError(f"Неизвестное множество альтернатив: '{among}'")
+        if not self.as_frame:
+            return self.labels[selected]
+        return self.normalized_alternatives.iloc[selected]
+
+    def normalize_values(self, values: Mapping) -> np.ndarray:
+        """
+        Нормализует значения одной альтернативы, не входящей в модель.
+
+        Параметры:
+        - values: Словарь {имя критерия: исходное значение}.
+
+        Возвращает:
+        - Массив нормализованных значений в порядке критериев.
+        """
+        return core.normalize_row(values, list(self.criteria.values()))
+
+    def is_dominated(self, values: Mapping) -> bool:
+        """
+        Проверяет, доминирует ли над альтернативой values хотя бы одна альтернатива модели,
+        то есть не вошла бы values в множество Парето.
+
+        Параметры:
+        - values: Словарь {имя критерия: исходное значение}.
+        """
+        return self.dominance_index.is_dominated(self.normalize_values(values))
+
+    def dominators(self, values: Mapping):
+        """
+        Находит альтернативы модели, доминирующие над альтернативой values.
+
+        Параметры:
+        - values: Словарь {имя критерия: исходное значение}.
+
+        Возвращает:
+        - Метки доминирующих альтернатив в порядке строк.
+        """
+        return self.labels[self.dominance_index.dominators(self.normalize_values(values))]
+
     def _dominates(self, row1, row2):
         """
         Проверяет, доминирует ли row1 над row2 по критерию Парето.
@@ -204,7 +566,8 @@ class DecisionModel:
         Возвращает:
         - True, если row1 доминирует над row2, иначе False.
         """
-        return all(r1 >= r2 for r1, r2 in zip(row1, row2)) and any(r1 > r2 for r1, r2 in zip(row1, row2))
+        kernels = backends.get_backend(self.backend)
+        return bool(kernels.dominated_by_any(np.asarray(row2, dtype=float)[None, :], np.asarray(row1, dtype=float)[None, :])[0])
 
     def _get_equivalent_groups(self):
         """
@@ -213,67 +576,17 @@ class DecisionModel:
         Возвращает:
         - Список наборов, каждый набор содержит имена эквивалентных критериев.
         """
-        # Initialize variables
-        criterion_to_group = {}
-        groups = []
-
-        # For each criterion
-        for criterion_name in self.criteria.keys():
-            # Skip if already in a group
-            if criterion_name in criterion_to_group:
-                continue
-
-            # Find all equivalence preferences involving this criterion
-            equivalent_criteria = set()
-            to_process = [criterion_name]
-
-            while to_process:
-                current = to_process.pop()
-                if current in equivalent_criteria:
-                    continue
-                equivalent_criteria.add(current)
-
-                for pref in self.preferences:
-                    if pref.equivalent:
-                        if pref.criterion1.name == current:
-                            if pref.criterion2.name not in equivalent_criteria:
-                                to_process.append(pref.criterion2.name)
-                        elif pref.criterion2.name == current:
-                            if pref.criterion1.name not in equivalent_criteria:
-                                to_process.append(pref.criterion1.name)
-
-            # Assign these equivalent criteria to a group
-            existing_groups = [criterion_to_group[c] for c in equivalent_criteria if c in criterion_to_group]
-            if existing_groups:
-                # Merge all existing groups and current equivalent_criteria
-                merged_group = set().union(*existing_groups, equivalent_criteria)
-                # Remove old groups
-                groups = [g for g in groups if g not in existing_groups]
-                groups.append(merged_group)
-                # Update mapping
-                for c in merged_group:
-                    criterion_to_group[c] = merged_group
-            else:
-                # Create a new group
-                new_group = equivalent_criteria
-                groups.append(new_group)
-                for c in new_group:
-                    criterion_to_group[c] = new_group
-
-        # Handle criteria not in any preferences
-        unconnected_criteria = set(self.criteria.keys()) - set(criterion_to_group.keys())
-        if unconnected_criteria:
-            for criterion_name in unconnected_criteria:
-                # Each criterion gets its own group
-                new_group = set([criterion_name])
-                groups.append(new_group)
-                criterion_to_group[criterion_name] = new_group
-
-        # Store the mapping
-        self.criterion_to_group = criterion_to_group
-        self.groups = groups  # Store groups for later use
-
-        return groups
+        self._group_of = core.equivalent_group_of(
+            len(self.criteria), self._preference_ids[self._preference_equivalent].tolist()
+        )
+
+        # Store groups and the mapping
+        self._groups = [set() for _ in range(int(self._group_of.max()) + 1 if len(self._group_of) else 0)]
+        for name, group in zip(self.criteria, self._group_of.tolist()):
+            self._groups[group].add(name)
+        self._criterion_to_group = {name: self._groups[group] for name, group in zip(self.criteria, self._group_of)}
+        self._stage_done("groups")
+        return self._groups
 
     def _assign_importance_relations(self):
         """
@@ -282,246 +595,329 @@ class DecisionModel:
         - Создает и сохраняет граф отношений важности между группами критериев.
         - Учитывает транзитивность отношений важности.
         """
-        # Initialize the graph
-        group_importance_graph = {}
-
-        # Get the groups and their IDs
-        groups = self.groups
-        group_ids = {id(group): group for group in groups}
-
-        # Initialize the graph for each group
-        for group in groups:
-            group_id = id(group)
-            group_importance_graph[group_id] = set()
-
-        # For each preference where criterion1 is more important than criterion2
-        for pref in self.preferences:
-            if not pref.equivalent:
-                c1_group = self.criterion_to_group[pref.criterion1.name]
-                c2_group = self.criterion_to_group[pref.criterion2.name]
-                c1_group_id = id(c1_group)
-                c2_group_id = id(c2_group)
-                if c1_group_id != c2_group_id:
-                    # Group of criterion1 is more important than group of criterion2
-                    group_importance_graph[c2_group_id].add(c1_group_id)  # Edge from less important to more important group
-
-        # Compute transitive closure to include indirect importance relations
-        # For each group, find all more important groups (direct and indirect)
-        def dfs(group_id, visited):
-            for more_important_group_id in group_importance_graph[group_id].copy():
-                if more_important_group_id not in visited:
-                    visited.add(more_important_group_id)
-                    dfs(more_important_group_id, visited)
-                    group_importance_graph[group_id].update(visited)
-
-        for group_id in group_importance_graph:
-            visited = set()
-            dfs(group_id, visited)
-
-        # Store the graph
-        self.group_importance_graph = group_importance_graph
-        self.group_ids = group_ids  # Store group IDs for reference
+        strict_pairs = self._preference_ids[~self._preference_equivalent].tolist()
+        # closure[g, h] = True, если группа h важнее группы g (включая транзитивные отношения)
+        self._importance_closure = core.importance_closure(self.group_of, len(self.groups), strict_pairs)
+        self._set_importance_graph()
 
         # Print out the groups and their importance relations
         print("Группы и их отношения важности (включая транзитивные):")
-        for group_id, more_important_group_ids in group_importance_graph.items():
-            group = self.group_ids[group_id]
-            criteria_in_group = ', '.join(group)
-            more_important_groups = [', '.join(self.group_ids[mid]) for mid in more_important_group_ids]
-            print(f"Группа [{criteria_in_group}] -> более важные группы: {more_important_groups if more_important_groups else 'Нет'}")
+        descriptions = (
+            f"Группа [{', '.join(self._group_ids[group_id])}] -> более важные группы: "
+            f"{[', '.join(self._group_ids[mid]) for mid in more_important] if more_important else 'Нет'}"
+            for group_id, more_important in self._group_importance_graph.items()
+        )
+        for line in _shorten(descriptions, len(self._group_ids)):
+            print(line)
         print("\n")
 
+    def _set_importance_graph(self):
+        # Store the graph with integer group IDs
+        self._group_ids = dict(enumerate(self._groups))
+        self._group_importance_graph = {
+            group_id: set(np.flatnonzero(self._importance_closure[group_id]).tolist())
+            for group_id in self._group_ids
+        }
+        self._stage_done("importance")
+
+    def _group_sums(self, values):
+        """
+        Вычисляет групповые суммы для значений критериев одной альтернативы
+        (ряд pandas с именами критериев или массив в порядке критериев).
+        """
+        if hasattr(values, "index") and not isinstance(values, np.ndarray):
+            values = values[list(self.criteria)].to_numpy(dtype=float)
+        return core.group_sums(np.asarray(values, dtype=float)[None, :], self.group_of, len(self.groups))[0]
+
     def _check_t_dominance(self, Z_values, W_values):
         """
         Проверяет, доминирует ли альтернатива Z над альтернативой W в t-упорядочении.
 
         Параметры:
-        - Z_values: ряд с нормализованными значениями критериев для альтернативы Z.
-        - W_values: ряд с нормализованными значениями критериев для альтернативы W.
+        - Z_values: нормализованные значения критериев для альтернативы Z.
+        - W_values: нормализованные значения критериев для альтернативы W.
 
         Возвращает:
         - True, если Z доминирует над W, иначе False.
         """
-        # Compute group sums for Z and W
-        Z_group_sums = {}
-        W_group_sums = {}
-
-        group_name_to_id = {}  # Map group names to IDs for easy access
-
-        for group in self.groups:
-            group_id = id(group)
-            group_name = ','.join(sorted(group))  # Create a unique name for the group
-            group_name_to_id[group_name] = group_id
-            Z_sum = round(Z_values[list(group)].sum(), 8)
-            W_sum = round(W_values[list(group)].sum(), 8)
-
-            Z_group_sums[group_name] = Z_sum
-            W_group_sums[group_name] = W_sum
-
-        # Check dominance using group sums for WE
-        if self._dominates_group_sums(Z_group_sums, W_group_sums):
-            #print(f'[DEBUG] Dominated by WE, Z = {Z_group_sums}, W = {W_group_sums}')
-            return True
-
-        # Initialize W_adjusted_group_sums with original W_group_sums
-        W_adjusted_group_sums = W_group_sums.copy()
-
-        # Start transferring from groups with the most more important groups to those with none
-        # This effectively starts from the least important groups
-        groups_sorted = sorted(self.group_importance_graph.items(), key=lambda x: len(x[1]), reverse=True)
-        group_id_to_name = {id(group): ','.join(sorted(group)) for group in self.groups}
-
-        transferred = False
-
-        # Start transferring from less important groups to more important ones
-        for group_id, more_important_group_ids in groups_sorted:
-            current_group_name = group_id_to_name[group_id]
-            Z_current = Z_group_sums[current_group_name]
-            W_current = W_adjusted_group_sums[current_group_name]
-
-            # Scenario 1: W_current <= Z_current, no transfer needed
-            if W_current <= Z_current:
-                continue  # Skip this group
-
-            # Scenario 2: W_current > Z_current, need to transfer excess to more important groups
-            excess = round(W_current - Z_current, 8)  # Amount to transfer
-            W_adjusted_group_sums[current_group_name] = Z_current  # Reduce W_current to Z_current
-
-            # Try to transfer excess to more important groups
-            remaining_excess = excess
-
-            # Try to transfer excess to more important groups
-            if not more_important_group_ids:
-                # No more important groups to transfer to
-                return False  # Cannot adjust W to be dominated by Z
-
-            # Iterate over more important groups
-            for more_important_group_id in more_important_group_ids:
-                more_important_group_name = group_id_to_name[more_important_group_id]
-                Z_more = Z_group_sums[more_important_group_name]
-                W_more = W_adjusted_group_sums[more_important_group_name]
-
-                # Calculate available capacity in the more important group
-                capacity = round(Z_more - W_more, 8)
-                if capacity <= 0:
-                    continue  # No capacity, move to the next more important group
-
-                # Transfer as much as possible
-                transfer_amount = min(remaining_excess, capacity)
-                W_adjusted_group_sums[more_important_group_name] = round(W_adjusted_group_sums[more_important_group_name] + transfer_amount, 8)
-                remaining_excess = round(remaining_excess - transfer_amount, 8)
-
-                if remaining_excess <= 0:
-                    transferred = True
-                    break  # Transferred all excess, no need to continue
-
-            if remaining_excess > 0:
-                # Unable to transfer all excess to more important groups
-                # Therefore, cannot make W equivalent or dominated by Z
-                return False
-
-        #print(f'[DEBUG] After transfers, Z = {Z_group_sums}, W = {W_adjusted_group_sums}')
-        #print(f'[DEBUG] transferred = {transferred}')
-        # After transfers, check if Z dominates or is equivalent to adjusted W
-        if transferred and self._dominates_or_equal_group_sums(Z_group_sums, W_adjusted_group_sums):
-            #print(f'[DEBUG] Discarded: alternative Z {Z_values}, alternative W {W_values}')
-            return True
-
-        # If no dominance found
-        #print(f'[DEBUG] Not discarded: alternative Z {Z_values}, alternative W {W_values}')
-        return False
+        Z_group_sums = self._group_sums(Z_values)
+        W_group_sums = self._group_sums(W_values)
+        closure = self.importance_closure
+        kernels = backends.get_backend(self.backend)
+        return bool(kernels.t_dominated_mask(Z_group_sums, W_group_sums[None, :], closure, core.transfer_order(closure))[0])
 
     def _dominates_group_sums(self, Z_sums, W_sums):
         """
         Проверяет, доминирует ли Z_sums над W_sums в смысле Парето.
 
         Параметры:
-        - Z_sums: словарь групповых сумм для альтернативы Z.
-        - W_sums: словарь групповых сумм для альтернативы W.
+        - Z_sums: массив групповых сумм для альтернативы Z.
+        - W_sums: массив групповых сумм для альтернативы W.
 
         Возвращает:
         - True, если Z_sums доминирует над W_sums, иначе False.
         """
-        dominates = False
-        for group_name in Z_sums.keys():
-            if round(Z_sums[group_name], 8) < round(W_sums[group_name], 8):
-                return False  # Z is worse in at least one group
-            elif round(Z_sums[group_name], 8) > round(W_sums[group_name], 8):
-                dominates = True  # Z is better in at least one group
-        return dominates
+        kernels = backends.get_backend(self.backend)
+        return bool(kernels.dominated_by_any(np.round(W_sums, 8)[None, :], np.round(Z_sums, 8)[None, :])[0])
 
     def _dominates_or_equal_group_sums(self, Z_sums, W_sums):
         """
         Проверяет, что Z_sums эквивалентен W_sums или Z_sums доминирует над W_sums в смысле Парето.
 
         Параметры:
-        - Z_sums: словарь групповых сумм для альтернативы Z.
-        - W_sums: словарь групповых сумм для альтернативы W.
+        - Z_sums: массив групповых сумм для альтернативы Z.
+        - W_sums: массив групповых сумм для альтернативы W.
 
         Возвращает:
         - True, если Z_sums доминирует или эквивалентен W_sums, в противном случае False.
         """
-        for group_name in Z_sums.keys():
-            if round(Z_sums[group_name], 8) < round(W_sums[group_name], 8):
-                return False  # Z is worse in at least one group
-        return True
+        return bool(np.all(np.round(Z_sums, 8) >= np.round(W_sums, 8)))
 
-    def t_ordering(self):
+    def t_ordering(self, segment_by=None, record_relation: bool = False):
         """
         Применяет метод t-упорядочения для сокращения множества Парето на основе предпочтений пользователя.
+        Если с предыдущего вызова не изменились ни множество Парето, ни предпочтения, возвращается
+        сохраненный результат.
+
+        Параметры:
+        - segment_by: Имя столбца альтернатив или последовательность значений (по одному на
+          альтернативу), задающие сегменты. Если задано, множество Парето и t-упорядочение
+          вычисляются отдельно в каждом сегменте за один проход (см. segments), а результаты
+          модели не меняются.
+        - record_relation: Также вычислить отношение t-доминирования между всеми альтернативами
+          множества Парето (self.t_dominance_relation). Для этого проверяются все пары, тогда как
+          t-упорядочение пропускает уже исключенные альтернативы, поэтому отношение не
+          вычисляется без запроса.
 
         Результат:
         - Обновляет self.pareto_t альтернативами, оставшимися после t-упорядочения.
+        - Для segment_by возвращает объект SegmentedSkyline с позициями альтернатив по сегментам.
         """
-        if self.pareto_front is None:
-            self.find_pareto_front()
-
-        # Assign importance relations
-        self._get_equivalent_groups()
-        self._assign_importance_relations()
-
-        # Copy Pareto alternatives for processing
-        pareto_alternatives = self.pareto_front.copy()
-
-        # Set of alternatives to remove
-        alternatives_to_remove = set()
-
-        # List of alternative names
-        alternative_names = list(pareto_alternatives.index)
-
-        # For each pair of alternatives in the Pareto set
-        for i in range(len(alternative_names)):
-            alt_name_Z = alternative_names[i]
-            if alt_name_Z in alternatives_to_remove:
-                continue
-            Z_values = pareto_alternatives.loc[alt_name_Z]
-            #print(f'[DEBUG] comparing {alt_name_Z}')
-            for j in range(len(alternative_names)):
-                if i == j:
-                    continue
-                alt_name_W = alternative_names[j]
-                if alt_name_W in alternatives_to_remove:
-                    continue
-                W_values = pareto_alternatives.loc[alt_name_W]
-                #print(f'[DEBUG] to {alt_name_W}')
-                # Check if Z dominates W
-                if self._check_t_dominance(Z_values, W_values):
-                    #print(f'[DEBUG] {alt_name_Z} dominated {alt_name_W}')
-                    alternatives_to_remove.add(alt_name_W)
+        if segment_by is not None:
+            result = self._segmented_t_ordering(segment_by)
+            print(f"Количество сегментов: {len(result)}, альтернатив после t-упорядочивания: {len(result.pareto_t_index)}\n")
+            return result
+        self._require_stage("pareto_t")
+        if record_relation:
+            self._require_stage("t_relation")
+        print(f"Количество альтернатив после t-упорядочивания: {len(self._pareto_t_index)}\n")
+        return self.pareto_t
+
+    def _segmented_t_ordering(self, segment_by):
+        from t_ordering import segments
+
+        if isinstance(segment_by, str):
+            self._require_source_data()
+            if segment_by not in self.columns:
+                raise ValueError(f"Столбец сегментов '{segment_by}' отсутствует в данных альтернатив")
+            segment_by = self.columns[segment_by]
+        if len(segment_by) != len(self.labels):
+            raise ValueError("Число значений сегментов не совпадает с числом альтернатив")
+        keys, codes = segments.segment_codes(segment_by)
+        matrix = self.normalized_matrix
+        pareto_index = np.flatnonzero(segments.segmented_pareto_mask(matrix, codes, len(keys), backend=self.backend))
+        sums = core.group_sums(matrix[pareto_index], self.group_of, len(self.groups))
+        keep = segments.segmented_t_ordering_mask(sums, codes[pareto_index], self.importance_closure, backend=self.backend)
+        return segments.SegmentedSkyline(keys, codes, pareto_index, pareto_index[keep])
+
+    def _apply_t_ordering(self):
+        pareto_index = self.pareto_index
+        # Group sums of the Pareto alternatives, one row per alternative
+        sums = self.front_sums
+        # Альтернативы с равными групповыми суммами неразличимы для t-упорядочения
+        representatives, classes = core.row_classes(sums)
+        keep = core.t_ordering_mask(sums[representatives], self.importance_closure, backend=self.backend)[classes]
 
         # Update alternatives after t-ordering
-        self.pareto_t = pareto_alternatives.drop(index=alternatives_to_remove)
-        print(f"Количество альтернатив после t-упорядочивания: {len(self.pareto_t)}\n")
-        return self.pareto_t
+        self._pareto_t_index = pareto_index[keep]
+        self._stage_done("pareto_t")
+
+    def preference_robustness(self, max_changes: int = 1, changes=("flip", "drop"), samples: int = None,
+                              seed=None, workers: int = None):
+        """
+        Оценивает устойчивость t-упорядочения к изменению предпочтений: предпочтения
+        заменяются строгими вместо эквивалентных и наоборот ("flip") или удаляются ("drop").
+        Нормализованные значения и множество Парето модели используются всеми вариантами.
+
+        Параметры:
+        - max_changes: наибольшее число изменяемых предпочтений при переборе вариантов.
+        - changes: допустимые изменения предпочтения.
+        - samples: если задано, вместо перебора используется столько случайных вариантов
+          (см. robustness.sample_variants); seed задает генератор случайных чисел.
+        - workers: число процессов для вычисления вариантов.
+
+        Возвращает:
+        - Объект RobustnessReport с долей вариантов, в которых каждая альтернатива множества
+          Парето осталась после t-упорядочения.
+        """
+        from t_ordering import robustness
+
+        preference_pairs = [(pref.criterion1.name, pref.criterion2.name, pref.equivalent) for pref in self.preferences]
+        if samples is not None:
+            variants = robustness.sample_variants(len(preference_pairs), samples, changes, seed=seed)
+        else:
+            variants = robustness.enumerate_variants(len(preference_pairs), changes, max_changes)
+        pareto_index = self.pareto_index
+        return robustness.preference_robustness(
+            self.normalized_matrix[pareto_index], self.labels[pareto_index], list(self.criteria),
+            preference_pairs, variants, workers=workers,
+        )
+
+    def compile(self):
+        """
+        Выполняет все подготовительные этапы t-упорядочения, которые еще не выполнены
+        или устарели: поиск множества Парето, построение групп и отношений важности.
+
+        Возвращает:
+        - Сам объект DecisionModel.
+        """
+        self._require_stage("pareto")
+        self._require_stage("importance")
+        return self
+
+    def freeze(self):
+        """
+        Возвращает неизменяемый скомпилированный снимок модели для одновременных запросов
+        из нескольких потоков (см. CompiledModel).
+        """
+        from t_ordering.CompiledModel import CompiledModel
+
+        return CompiledModel(self)
+
+    def skycube(self, max_memory_mb: float = 64, materialize_after: int = 1):
+        """
+        Возвращает куб множеств Парето для запросов по подмножествам критериев (см. Skycube).
+        """
+        from t_ordering.Skycube import Skycube
+
+        return Skycube(self, max_memory_mb=max_memory_mb, materialize_after=materialize_after)
+
+    def save(self, path: str):
+        """
+        Сохраняет скомпилированную модель в файл .npz: нормализованную матрицу, множество Парето,
+        группы, замыкание отношения важности, описание критериев и предпочтений.
+        Исходные (ненормализованные) данные альтернатив не сохраняются.
+
+        Параметры:
+        - path: путь к файлу.
+        """
+        self.compile()
+        labels = np.asarray(self.labels)
+        labels_type = None
+        if labels.dtype.kind == "O":
+            # Метки-объекты сохраняются строками, чтобы файл не требовал pickle
+            labels = labels.astype(str)
+            labels_type = "str"
+        arrays = {
+            "normalized_matrix": self.normalized_matrix,
+            "labels": labels,
+            "pareto_index": self.pareto_index,
+            "group_of": self.group_of,
+            "importance_closure": self.importance_closure,
+        }
+        # Необязательные результаты сохраняются, только если они уже получены
+        if self._stage_is_current("pareto_t"):
+            arrays["pareto_t_index"] = self.pareto_t_index
+        if self._stage_is_current("front_ranks"):
+            arrays["front_ranks"] = self.front_ranks
+        header = {
+            "format": MODEL_FORMAT,
+            "version": MODEL_FORMAT_VERSION,
+            "criteria": [criterion.to_dict() for criterion in self.criteria.values()],
+            "preferences": [pref.to_dict() for pref in self.preferences],
+            "as_frame": self.as_frame,
+            "index_name": self._index_name,
+            "labels_type": labels_type,
+            "pareto_epsilon": self.pareto_epsilon,
+        }
+        save_arrays(path, arrays, header)
+
+    @classmethod
+    def load(cls, path: str, mmap: bool = True):
+        """
+        Загружает модель, сохраненную методом save, без повторной валидации, нормализации,
+        поиска множества Парето и построения групп.
+
+        Параметры:
+        - path: путь к файлу.
+        - mmap: отображать массивы в память вместо чтения в память процесса.
+
+        Возвращает:
+        - Объект DecisionModel, готовый к t-упорядочению.
+        """
+        arrays, header = load_arrays(path, MODEL_FORMAT, MODEL_FORMAT_VERSION, mmap=mmap)
+        criteria_list = [Criterion.from_dict(item) for item in header["criteria"]]
+        criteria = {criterion.name: criterion for criterion in criteria_list}
+
+        model = cls.__new__(cls)
+        model._init_stages()
+        model.backend = None
+        model._criteria = criteria
+        model._positions = {name: position for position, name in enumerate(criteria)}
+        model._preferences = [Preference.from_dict(item, criteria) for item in header["preferences"]]
+        model._set_preference_ids()
+        model.as_frame = header["as_frame"]
+        model.alternatives = None
+        model.columns = None
+        model._index_name = header["index_name"]
+        model.labels = arrays["labels"].astype(object) if header["labels_type"] == "str" else arrays["labels"]
+
+        # Сохраненные результаты этапов считаются актуальными для загруженных входов
+        model._normalized_matrix = arrays["normalized_matrix"]
+        model._stage_done("normalized")
+        model._pareto_index = arrays["pareto_index"]
+        model.pareto_epsilon = header.get("pareto_epsilon")
+        model._pareto_options = {"epsilon": model.pareto_epsilon}
+        model._stage_done("pareto")
+        if "front_ranks" in arrays:
+            model._front_ranks = arrays["front_ranks"]
+            model._stage_done("front_ranks")
+
+        # Восстановление групп и графа важности по целочисленным номерам групп
+        model._group_of = arrays["group_of"]
+        model._importance_closure = arrays["importance_closure"]
+        model._groups = [set() for _ in range(model._importance_closure.shape[0])]
+        for name, group in zip(criteria, model._group_of):
+            model._groups[group].add(name)
+        model._criterion_to_group = {name: model._groups[group] for name, group in zip(criteria, model._group_of)}
+        model._stage_done("groups")
+        model._set_importance_graph()
+        # Групповые суммы не сохраняются в файле, но t-упорядочение от них зависит:
+        # без них сохраненный результат t-упорядочения считался бы устаревшим
+        model._front_sums = core.group_sums(
+            model._normalized_matrix[model._pareto_index], model._group_of, len(model._groups)
+        )
+        model._stage_done("front_sums")
+        if "pareto_t_index" in arrays:
+            model._pareto_t_index = arrays["pareto_t_index"]
+            model._stage_done("pareto_t")
+        return model
+
+    def _require_source_data(self):
+        if self.columns is None:
+            raise ValueError("Исходные данные альтернатив недоступны: модель загружена из файла в скомпилированном виде.")
 
     def __str__(self):
         """
         Возвращает строковое представление объекта DecisionModel.
         """
-        criteria_str = "\n".join([str(criterion) for criterion in self.criteria.values()])
-        preferences_str = "\n".join([str(pref) for pref in self.preferences])
-        normalized_str = self.normalized_alternatives.to_string() if self.normalized_alternatives is not None else "Данные не нормализованы"
+        criteria_str = "\n".join(_shorten(self.criteria.values(), len(self.criteria)))
+        preferences_str = "\n".join(_shorten(self.preferences, len(self.preferences)))
+        wide = len(self.criteria) > DISPLAY_LIMIT
+        if self.as_frame:
+            normalized_str = str(self.normalized_alternatives) if wide else self.normalized_alternatives.to_string()
+        else:
+            names_str = ", ".join(_shorten(self.criteria, len(self.criteria)))
+            normalized_str = f"[{names_str}]\n{self.normalized_matrix}" if wide else f"{list(self.criteria)}\n{self.normalized_matrix}"
+        if self.alternatives is None:
+            alternatives_str = "Не сохранены"
+        elif wide and not self.as_frame:
+            alternatives_str = "\n".join(_shorten(
+                (f"{name}: {values}" for name, values in self.alternatives.items()), len(self.alternatives)
+            ))
+        else:
+            alternatives_str = str(self.alternatives)
         return (f"DecisionModel:\n\nКритерии:\n{criteria_str}\n\n"
-                f"Альтернативы:\n{self.alternatives}\n\n"
+                f"Альтернативы:\n{alternatives_str}\n\n"
                 f"Нормализованные альтернативы:\n{normalized_str}\n\n"
-                f"Предпочтения:\n{preferences_str}\n")
\ No newline at end of file
+                f"Предпочтения:\n{preferences_str}\n")
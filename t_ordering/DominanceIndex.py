@@ -0,0 +1,165 @@
+import numpy as np
+from typing import Optional
+
+class DominanceIndex:
+    def __init__(self, matrix: np.ndarray, leaf_size: int = 32):
+        """
+        Строит пространственный индекс (k-d дерево) над нормализованной матрицей альтернатив
+        для точечных запросов доминирования.
+
+        Альтернативы, доминирующие над точкой q, лежат в ортанте [q, +inf), доминируемые ею —
+        в ортанте (-inf, q]. Запросы обходят дерево и отбрасывают узлы, ограничивающий
+        параллелепипед которых не пересекает ортант, а узлы, целиком лежащие в нем,
+        учитывают без просмотра точек.
+
+        Параметры:
+        - matrix: нормализованная матрица (альтернативы x критерии), 1 — лучшее значение.
+        - leaf_size: наибольшее число точек в листе дерева.
+        """
+        self.matrix = matrix
+        points = np.asarray(matrix, dtype=float)
+        self.num_criteria = points.shape[1]
+        self._order = np.arange(points.shape[0])
+        self._lo, self._hi, self._start, self._stop, self._left, self._right = [], [], [], [], [], []
+        if points.shape[0]:
+            self._build(points, 0, points.shape[0], leaf_size)
+        # Точки в порядке обхода дерева: точки каждого узла занимают непрерывный диапазон строк
+        self._points = np.ascontiguousarray(points[self._order])
+        self._lo = np.array(self._lo).reshape(-1, self.num_criteria)
+        self._hi = np.array(self._hi).reshape(-1, self.num_criteria)
+        self._start = np.array(self._start, dtype=np.int64)
+        self._stop = np.array(self._stop, dtype=np.int64)
+        self._left = np.array(self._left, dtype=np.int64)
+        self._right = np.array(self._right, dtype=np.int64)
+
+    def _build(self, points: np.ndarray, begin: int, end: int, leaf_size: int) -> int:
+        node = len(self._start)
+        block = points[self._order[begin:end]]
+        lo, hi = block.min(axis=0), block.max(axis=0)
+        self._lo.append(lo)
+        self._hi.append(hi)
+        self._start.append(begin)
+        self._stop.append(end)
+        self._left.append(-1)
+        self._right.append(-1)
+        if end - begin <= leaf_size or np.all(lo == hi):
+            return node
+        # Разбиение по медиане вдоль самой протяженной оси
+        axis = int(np.argmax(hi - lo))
+        middle = (begin + end) // 2
+        rows = self._order[begin:end]
+        self._order[begin:end] = rows[np.argpartition(points[rows, axis], middle - begin)]
+        self._left[node] = self._build(points, begin, middle, leaf_size)
+        self._right[node] = self._build(points, middle, end, leaf_size)
+        return node
+
+    def __len__(self):
+        return len(self._order)
+
+    def _search(self, lower: np.ndarray, upper: np.ndarray, exclude: Optional[np.ndarray], mode: str):
+        """
+        Ищет точки параллелепипеда [lower, upper], кроме точек, совпадающих с exclude.
+
+        Дерево обходится по уровням: для всех узлов уровня проверки выполняются одними
+        операциями над массивами, поэтому число операций NumPy пропорционально глубине
+        дерева, а не числу посещенных узлов.
+
+        Параметры:
+        - mode: "any" — есть ли такие точки, "count" — их число, "rows" — их номера в матрице.
+        """
+        count = 0
+        found = []
+        nodes = np.zeros(1 if len(self) else 0, dtype=np.int64)
+        while len(nodes):
+            lo, hi = self._lo[nodes], self._hi[nodes]
+            overlap = ~(np.any(hi < lower, axis=1) | np.any(lo > upper, axis=1))
+            nodes, lo, hi = nodes[overlap], lo[overlap], hi[overlap]
+            inside = np.all(lo >= lower, axis=1) & np.all(hi <= upper, axis=1)
+            # Узлы целиком в параллелепипеде и без точек, равных exclude, учитываются без просмотра точек
+            full = inside if exclude is None else inside & (np.any(lo > exclude, axis=1) | np.any(hi < exclude, axis=1))
+            if mode == "any" and full.any():
+                return True
+            scan = ~full & ((self._left[nodes] < 0) | inside)
+            if mode == "count":
+                count += int((self._stop[nodes[full]] - self._start[nodes[full]]).sum())
+            elif mode == "rows":
+                found.append(self._ranges(nodes[full]))
+            if scan.any():
+                positions = self._ranges(nodes[scan])
+                block = self._points[positions]
+                mask = np.all(block >= lower, axis=1) & np.all(block <= upper, axis=1)
+                if exclude is not None:
+                    mask &= np.any(block != exclude, axis=1)
+                if mode == "any" and mask.any():
+                    return True
+                if mode == "count":
+                    count += int(mask.sum())
+                elif mode == "rows":
+                    found.append(positions[mask])
+            split = nodes[~full & ~scan]
+            nodes = np.concatenate([self._left[split], self._right[split]])
+        if mode == "any":
+            return False
+        if mode == "count":
+            return count
+        return np.sort(self._order[np.concatenate(found)]) if found else np.empty(0, dtype=np.int64)
+
+    def _ranges(self, nodes: np.ndarray) -> np.ndarray:
+        # Позиции точек узлов nodes (объединение диапазонов [start, stop))
+        starts, lengths = self._start[nodes], self._stop[nodes] - self._start[nodes]
+        offsets = np.cumsum(lengths) - lengths
+        return np.repeat(starts - offsets, lengths) + np.arange(int(lengths.sum()))
+
+    def _point(self, row) -> np.ndarray:
+        row = np.asarray(row, dtype=float)
+        if row.shape != (self.num_criteria,):
+            raise ValueError(f"Ожидался вектор из {self.num_criteria} нормализованных значений, получена форма {row.shape}")
+        return row
+
+    def is_dominated(self, row) -> bool:
+        """
+        Проверяет, доминирует ли над точкой row хотя бы одна альтернатива индекса.
+        """
+        row = self._point(row)
+        return self._search(row, np.full_like(row, np.inf), row, "any")
+
+    def count_dominators(self, row) -> int:
+        """
+        Возвращает число альтернатив, доминирующих над точкой row.
+        """
+        row = self._point(row)
+        return self._search(row, np.full_like(row, np.inf), row, "count")
+
+    def dominators(self, row) -> np.ndarray:
+        """
+        Возвращает номера строк матрицы (по возрастанию), доминирующих над точкой row.
+        """
+        row = self._point(row)
+        return self._search(row, np.full_like(row, np.inf), row, "rows")
+
+    def count_dominated(self, row) -> int:
+        """
+        Возвращает число альтернатив, над которыми доминирует точка row.
+        """
+        row = self._point(row)
+        return self._search(np.full_like(row, -np.inf), row, row, "count")
+
+    def dominated(self, row) -> np.ndarray:
+        """
+        Возвращает номера строк матрицы (по возрастанию), над которыми доминирует точка row.
+        """
+        row = self._point(row)
+        return self._search(np.full_like(row, -np.inf), row, row, "rows")
+
+    def query_box(self, lower, upper) -> np.ndarray:
+        """
+        Возвращает номера строк матрицы (по возрастанию), значения которых лежат в
+        параллелепипеде [lower, upper] (границы включаются; -inf и inf снимают ограничение).
+        """
+        return self._search(self._point(lower), self._point(upper), None, "rows")
+
+    def __str__(self):
+        """
+        Возвращает строковое представление объекта DominanceIndex.
+        """
+        return f"DominanceIndex: {len(self)} альтернатив, {self.num_criteria} критериев, {len(self._start)} узлов"
@@ -0,0 +1,176 @@
+import numpy as np
+from typing import Tuple
+from t_ordering import core
+from t_ordering.bitmap import pack_rows, popcount
+
+class DominanceRelation:
+    def __init__(self, words: np.ndarray, positions: np.ndarray = None):
+        """
+        Отношение t-доминирования между альтернативами множества Парето в виде битовой
+        матрицы n x n: бит j строки i равен 1, если альтернатива i t-доминирует над альтернативой j.
+
+        Строки хранятся 64-битными словами (бит j строки — бит j % 64 слова j // 64), так что
+        матрица занимает n * ceil(n / 64) * 8 байт. Запросы принимают и возвращают номера
+        альтернатив в отношении (0..n-1); positions сопоставляет им позиции строк модели.
+
+        Параметры:
+        - words: массив (n, ceil(n / 64)) типа uint64.
+        - positions: позиции альтернатив в модели (по умолчанию 0..n-1).
+        """
+        self.words = words
+        self.positions = np.arange(len(words)) if positions is None else np.asarray(positions)
+
+    @classmethod
+    def from_sums(cls, sums: np.ndarray, closure: np.ndarray, positions: np.ndarray = None,
+                  backend=None) -> "DominanceRelation":
+        """
+        Вычисляет отношение t-доминирования по групповым суммам альтернатив.
+
+        Все пары проверяются ядром t_dominated_mask выбранного набора (см. backends) блоками
+        строк; альтернативы с равными суммами проверяются один раз.
+
+        Параметры:
+        - sums: групповые суммы альтернатив (по строке на альтернативу).
+        - closure: транзитивное замыкание отношения важности групп.
+        - positions: позиции альтернатив в модели.
+        - backend: набор ядер доминирования.
+        """
+        kernels = core._kernels(backend)
+        order = core.transfer_order(closure)
+        representatives, classes = core.row_classes(sums)
+        distinct = sums[representatives]
+
+        # Строки обрабатываются блоками и сразу упаковываются: для каждого различного
+        # представителя блока вычисляется строка отношения по различным суммам, а
+        # альтернативы с равными суммами получают строки и столбцы своего представителя
+        num_rows = len(sums)
+        words = np.zeros((num_rows, (num_rows + 63) // 64), dtype=np.uint64)
+        step = max(1, core._BLOCK_ELEMENTS // max(num_rows, 1))
+        for start in range(0, num_rows, step):
+            block_classes, inverse = np.unique(classes[start:start + step], return_inverse=True)
+            block = np.zeros((len(block_classes), len(distinct)), dtype=bool)
+            for row, representative in enumerate(block_classes):
+                block[row] = kernels.t_dominated_mask(distinct[representative], distinct, closure, order)
+            words[start:start + step] = pack_rows(block[inverse.reshape(-1)][:, classes])
+        return cls(words, positions)
+
+    @classmethod
+    def from_dense(cls, matrix: np.ndarray, positions: np.ndarray = None) -> "DominanceRelation":
+        """
+        Создает отношение из булевой матрицы n x n.
+        """
+        matrix = np.asarray(matrix, dtype=bool)
+        return cls(pack_rows(matrix).reshape(len(matrix), -1), positions)
+
+    def __len__(self):
+        """
+        Возвращает число альтернатив в отношении.
+        """
+        return len(self.words)
+
+    def _row(self, i: int) -> np.ndarray:
+        return np.unpackbits(self.words[i].view(np.uint8), bitorder="little")[:len(self)].astype(bool)
+
+    def to_dense(self) -> np.ndarray:
+        """
+        Возвращает булеву матрицу n x n.
+        """
+        return np.unpackbits(self.words.view(np.uint8), axis=1, bitorder="little")[:, :len(self)].astype(bool)
+
+    @property
+    def num_edges(self) -> int:
+        """
+        Число пар (i, j), в которых i t-доминирует над j.
+        """
+        return int(popcount(self.words).sum())
+
+    def dominated_counts(self) -> np.ndarray:
+        """
+        Для каждой альтернативы — число альтернатив, над которыми она t-доминирует.
+        """
+        return popcount(self.words)
+
+    def dominator_counts(self) -> np.ndarray:
+        """
+        Для каждой альтернативы — число альтернатив, t-доминирующих над ней.
+        """
+        counts = np.zeros(len(self), dtype=np.int64)
+        step = max(1, core._BLOCK_ELEMENTS // max(len(self), 1))
+        for start in range(0, len(self), step):
+            block = np.unpackbits(self.words[start:start + step].view(np.uint8), axis=1, bitorder="little")
+            counts += block[:, :len(self)].sum(axis=0, dtype=np.int64)
+        return counts
+
+    def dominated(self, i: int) -> np.ndarray:
+        """
+        Номера альтернатив, над которыми t-доминирует альтернатива i.
+        """
+        return np.flatnonzero(self._row(i))
+
+    def dominators(self, j: int) -> np.ndarray:
+        """
+        Номера альтернатив, t-доминирующих над альтернативой j.
+        """
+        word, bit = divmod(int(j), 64)
+        return np.flatnonzero((self.words[:, word] >> np.uint64(bit)) & np.uint64(1))
+
+    def edges(self) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Возвращает отношение сжатым списком ребер (CSR): альтернативы, над которыми
+        t-доминирует i, — indices[indptr[i]:indptr[i + 1]].
+        """
+        indptr = np.concatenate([[0], np.cumsum(self.dominated_counts())]).astype(np.int64)
+        indices = np.empty(indptr[-1], dtype=np.int64)
+        step = max(1, core._BLOCK_ELEMENTS // max(len(self), 1))
+        for start in range(0, len(self), step):
+            block = np.unpackbits(self.words[start:start + step].view(np.uint8), axis=1, bitorder="little")
+            _, targets = np.nonzero(block[:, :len(self)])
+            indices[indptr[start]:indptr[min(start + step, len(self))]] = targets
+        return indptr, indices
+
+    def _compose(self, first: np.ndarray, second: np.ndarray) -> np.ndarray:
+        # Строка i результата — объединение строк second по единичным битам строки i в first
+        result = np.zeros_like(first)
+        for i in range(len(first)):
+            middle = np.flatnonzero(np.unpackbits(first[i].view(np.uint8), bitorder="little")[:len(self)])
+            if len(middle):
+                result[i] = np.bitwise_or.reduce(second[middle], axis=0)
+        return result
+
+    def transitive_closure(self) -> "DominanceRelation":
+        """
+        Возвращает транзитивное замыкание отношения.
+        """
+        reach = self.words.copy()
+        while True:
+            # Каждая итерация удваивает длину учтенных путей
+            extended = reach | self._compose(reach, reach)
+            if np.array_equal(extended, reach):
+                return DominanceRelation(reach, self.positions)
+            reach = extended
+
+    def transitive_reduction(self) -> "DominanceRelation":
+        """
+        Возвращает транзитивное сокращение: остаются пары (i, j), для которых нет пути
+        из i в j длиной больше 1. Для ациклического отношения сокращение имеет то же
+        транзитивное замыкание и минимально по числу пар.
+        """
+        reach = self.transitive_closure().words
+        return DominanceRelation(self.words & ~self._compose(self.words, reach), self.positions)
+
+    def to_arrow(self):
+        """
+        Возвращает битовую матрицу как pyarrow.FixedSizeListArray из слов uint64 (по списку
+        на строку) без копирования данных.
+        """
+        import pyarrow as pa
+
+        num_words = self.words.shape[1]
+        values = pa.array(np.ascontiguousarray(self.words).reshape(-1))
+        return pa.FixedSizeListArray.from_arrays(values, num_words)
+
+    def __str__(self):
+        """
+        Возвращает строковое представление объекта DominanceRelation.
+        """
+        return f"DominanceRelation: {len(self)} альтернатив, {self.num_edges} пар t-доминирования"
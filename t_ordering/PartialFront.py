@@ -0,0 +1,197 @@
+import hashlib
+import io
+import json
+import numpy as np
+from functools import reduce
+from typing import Iterable, List, Optional
+from t_ordering import Criterion, Preference
+from t_ordering import core
+from t_ordering.storage import save_arrays, load_arrays
+
+PARTIAL_FORMAT = "t_ordering.PartialFront"
+PARTIAL_FORMAT_VERSION = 1
+
+
+def criteria_fingerprint(criteria_list: List[Criterion]) -> str:
+    """
+    Вычисляет отпечаток списка критериев: имена, типы, цели и границы нормализации в порядке списка.
+    Нормализованные значения сравнимы, только если отпечатки критериев совпадают.
+    """
+    # Веса не влияют на нормализацию и в отпечаток не входят
+    items = [{key: value for key, value in criterion.to_dict().items() if key != "weight"} for criterion in criteria_list]
+    description = json.dumps(items, ensure_ascii=False, sort_keys=True)
+    return hashlib.sha256(description.encode("utf-8")).hexdigest()
+
+
+class PartialFront:
+    def __init__(self, criteria_list: List[Criterion], values: np.ndarray, row_ids):
+        """
+        Инициализирует частичный результат: множество Парето части набора альтернатив.
+
+        Нормализация выполняется по границам критериев, а не по данным, поэтому
+        нормализованные значения разных частей сравнимы. Множество Парето объединения
+        совпадает с множеством Парето объединения множеств Парето частей, так что частичные
+        результаты можно объединять в любом порядке и любыми группами (merge ассоциативно
+        и коммутативно).
+
+        Строки хранятся в каноническом порядке — по возрастанию идентификаторов, — поэтому
+        результат объединения не зависит от порядка частей.
+
+        Параметры:
+        - criteria_list: Список объектов Criterion (порядок задает порядок столбцов values).
+        - values: Нормализованные значения альтернатив (альтернативы x критерии).
+        - row_ids: Идентификаторы исходных строк. Должны быть уникальны во всем наборе данных;
+          строки с совпадающими идентификаторами считаются одной строкой.
+        """
+        self.criteria = list(criteria_list)
+        self.fingerprint = criteria_fingerprint(self.criteria)
+        values = np.asarray(values, dtype=float).reshape(-1, len(self.criteria))
+        row_ids = np.asarray(row_ids)
+        if len(row_ids) != len(values):
+            raise ValueError("Число идентификаторов строк не совпадает с числом альтернатив")
+
+        sort_key = row_ids.astype(str) if row_ids.dtype.kind == "O" else row_ids
+        _, unique = np.unique(sort_key, return_index=True)
+        front = core.pareto_front_mask(values[unique])
+        self.values = values[unique[front]]
+        self.row_ids = row_ids[unique[front]]
+
+    @classmethod
+    def from_model(cls, model):
+        """
+        Создает частичный результат из множества Парето модели DecisionModel
+        (множество Парето находится, если оно еще не найдено).
+        Идентификаторами строк служат метки альтернатив модели.
+        """
+        return cls(list(model.criteria.values()), model.normalized_matrix[model.pareto_index],
+                   np.asarray(model.labels)[model.pareto_index])
+
+    @classmethod
+    def from_alternatives(cls, criteria_list: List[Criterion], alternatives, index=None):
+        """
+        Находит множество Парето части набора альтернатив без построения модели.
+
+        Параметры:
+        - criteria_list: Список объектов Criterion.
+        - alternatives: Часть альтернатив (pandas.DataFrame, pyarrow.Table, polars.DataFrame или словарь столбцов).
+        - index: Имя столбца или последовательность глобальных идентификаторов строк (см. read_alternatives).
+        """
+        from t_ordering.ingest import read_alternatives
+
+        labels, columns = read_alternatives(alternatives, index)
+        for criterion in criteria_list:
+            if criterion.name not in columns:
+                raise ValueError(f"Критерий '{criterion.name}' отсутствует в данных альтернатив")
+            core.validate_column(columns[criterion.name], criterion)
+        return cls(criteria_list, core.normalize_matrix(columns, criteria_list), labels)
+
+    def __len__(self):
+        """
+        Возвращает число альтернатив частичного множества Парето.
+        """
+        return len(self.row_ids)
+
+    def merge(self, other: "PartialFront") -> "PartialFront":
+        """
+        Объединяет два частичных результата в множество Парето объединения их частей.
+        """
+        if other.fingerprint != self.fingerprint:
+            raise ValueError("Нельзя объединить частичные результаты с разными критериями")
+        return PartialFront(self.criteria, np.concatenate([self.values, other.values]),
+                            np.concatenate([self.row_ids, other.row_ids]))
+
+    __or__ = merge
+
+    @classmethod
+    def merge_all(cls, parts: Iterable["PartialFront"]) -> "PartialFront":
+        """
+        Объединяет последовательность частичных результатов.
+        """
+        parts = list(parts)
+        if not parts:
+            raise ValueError("Нет частичных результатов для объединения")
+        return reduce(cls.merge, parts)
+
+    def t_ordering(self, preferences_list: Optional[List[Preference]] = None) -> np.ndarray:
+        """
+        Применяет t-упорядочение к множеству Парето (обычно — после объединения всех частей).
+
+        Параметры:
+        - preferences_list: Список объектов Preference для критериев частичного результата.
+
+        Возвращает:
+        - Идентификаторы строк, оставшихся после t-упорядочения.
+        """
+        names = [criterion.name for criterion in self.criteria]
+        preference_pairs = [(pref.criterion1.name, pref.criterion2.name, pref.equivalent)
+                            for pref in preferences_list or []]
+        group_of, closure = core.preference_structure(names, preference_pairs)
+
+        sums = core.group_sums(self.values, group_of, closure.shape[0])
+        representatives, classes = core.row_classes(sums)
+        keep = core.t_ordering_mask(sums[representatives], closure)[classes]
+        return self.row_ids[keep]
+
+    def save(self, target):
+        """
+        Сохраняет частичный результат в формате .npz.
+
+        Параметры:
+        - target: путь к файлу или открытый двоичный файловый объект.
+        """
+        row_ids = self.row_ids
+        row_ids_type = None
+        if row_ids.dtype.kind == "O":
+            # Идентификаторы-объекты сохраняются строками, чтобы файл не требовал pickle
+            row_ids = row_ids.astype(str)
+            row_ids_type = "str"
+        header = {
+            "format": PARTIAL_FORMAT,
+            "version": PARTIAL_FORMAT_VERSION,
+            "criteria": [criterion.to_dict() for criterion in self.criteria],
+            "fingerprint": self.fingerprint,
+            "row_ids_type": row_ids_type,
+        }
+        save_arrays(target, {"values": self.values, "row_ids": row_ids}, header)
+
+    @classmethod
+    def load(cls, source, mmap: bool = True) -> "PartialFront":
+        """
+        Загружает частичный результат, сохраненный методом save.
+
+        Параметры:
+        - source: путь к файлу или открытый двоичный файловый объект.
+        - mmap: отображать массивы файла в память вместо чтения.
+        """
+        arrays, header = load_arrays(source, PARTIAL_FORMAT, PARTIAL_FORMAT_VERSION, mmap=mmap)
+        partial = cls.__new__(cls)
+        partial.criteria = [Criterion.from_dict(item) for item in header["criteria"]]
+        partial.fingerprint = criteria_fingerprint(partial.criteria)
+        if partial.fingerprint != header["fingerprint"]:
+            raise ValueError("Отпечаток критериев не совпадает с описанием критериев в файле")
+        partial.values = arrays["values"].reshape(-1, len(partial.criteria))
+        row_ids = arrays["row_ids"]
+        partial.row_ids = row_ids.astype(object) if header["row_ids_type"] == "str" else row_ids
+        return partial
+
+    def to_bytes(self) -> bytes:
+        """
+        Сериализует частичный результат для передачи между процессами или машинами.
+        """
+        buffer = io.BytesIO()
+        self.save(buffer)
+        return buffer.getvalue()
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> "PartialFront":
+        """
+        Восстанавливает частичный результат, сериализованный методом to_bytes.
+        """
+        return cls.load(io.BytesIO(data), mmap=False)
+
+    def __str__(self):
+        """
+        Возвращает строковое представление объекта PartialFront.
+        """
+        return (f"PartialFront: {len(self)} альтернатив в множестве Парето, "
+                f"критерии: {[criterion.name for criterion in self.criteria]}")
@@ -14,6 +14,30 @@ class Preference:
         self.criterion2 = criterion2
         self.equivalent = equivalent
 
+    def to_dict(self):
+        """
+        Возвращает описание предпочтения в виде словаря со ссылками на критерии по имени.
+        """
+        return {"criterion1": self.criterion1.name, "criterion2": self.criterion2.name, "equivalent": self.equivalent}
+
+    @classmethod
+    def from_dict(cls, data, criteria):
+        """
+        Создает объект Preference из словаря (см. to_dict).
+
+        Параметры:
+        - data: словарь с именами критериев и признаком эквивалентности.
+        - criteria: словарь {имя критерия: объект Criterion}.
+        """
+        for key in ("criterion1", "criterion2"):
+            if data[key] not in criteria:
+                raise ValueError(f"Критерий '{data[key]}' из предпочтений отсутствует в списке критериев")
+        return cls(
+            criterion1=criteria[data["criterion1"]],
+            criterion2=criteria[data["criterion2"]],
+            equivalent=data.get("equivalent", False),
+        )
+
     def __str__(self):
         """
         Возвращает строковое представление объекта Preference.
@@ -0,0 +1,238 @@
+import numpy as np
+from typing import Dict, Iterable, List, Optional, Tuple
+from t_ordering import Criterion, Preference
+from t_ordering import core
+
+
+class _Subspace:
+    def __init__(self, candidates: np.ndarray, pareto: np.ndarray):
+        # Позиции расширенного множества Парето и множества Парето подпространства
+        self.candidates = candidates
+        self.pareto = pareto
+        self.pareto_t = None  # Результат t-упорядочения с предпочтениями модели
+        self.last_used = 0
+
+    @property
+    def nbytes(self) -> int:
+        pareto_t_bytes = self.pareto_t.nbytes if self.pareto_t is not None else 0
+        return self.candidates.nbytes + self.pareto.nbytes + pareto_t_bytes
+
+
+class Skycube:
+    def __init__(self, model, max_memory_mb: float = 64, materialize_after: int = 1):
+        """
+        Создает куб множеств Парето (skycube) по подмножествам критериев модели DecisionModel.
+
+        Запрос к подпространству (подмножеству критериев) дает тот же результат, что и новая
+        модель с сокращенным списком критериев, но множество Парето ищется не среди всех
+        альтернатив. Расширенное множество Парето (альтернативы, над которыми никто не
+        доминирует строго по всем критериям) монотонно: для U ⊆ V оно по U содержится в
+        нем же по V и включает множество Парето по U. Поэтому подпространство вычисляется
+        только по расширенному множеству наименьшего материализованного надпространства
+        (или всего пространства критериев, которое вычисляется при создании).
+
+        Подпространства материализуются по запросу: после materialize_after запросов или
+        явно (materialize). Хранимые результаты ограничены объемом max_memory_mb; при
+        нехватке памяти удаляются реже и давнее запрашиваемые подпространства. Объект
+        хранит копию нормализованных данных; последующие изменения модели на него не влияют.
+
+        Параметры:
+        - model: Объект DecisionModel.
+        - max_memory_mb: Наибольший объем хранимых результатов подпространств (МБ).
+        - materialize_after: Число запросов подпространства, после которого оно сохраняется.
+        """
+        if materialize_after < 1:
+            raise ValueError("materialize_after должен быть положительным")
+        self.criteria = tuple(model.criteria.values())
+        self.criterion_names = tuple(criterion.name for criterion in self.criteria)
+        self.preferences = tuple(model.preferences)
+        self.labels = np.array(model.labels)
+        self.normalized_matrix = np.array(model.normalized_matrix, dtype=float)
+        self.backend = model.backend
+        self.max_bytes = int(max_memory_mb * 1024 * 1024)
+        self.materialize_after = materialize_after
+        self.hits = 0
+        self.misses = 0
+        self._positions = {name: idx for idx, name in enumerate(self.criterion_names)}
+        self._full = tuple(range(len(self.criteria)))
+        self._root = self._compute(self._full, np.arange(len(self.normalized_matrix)))
+        self._subspaces: Dict[Tuple[int, ...], _Subspace] = {}
+        self._queries: Dict[Tuple[int, ...], int] = {}
+        self._tick = 0
+
+    def __len__(self):
+        """
+        Возвращает число материализованных подпространств.
+        """
+        return len(self._subspaces)
+
+    @property
+    def materialized(self) -> List[Tuple[str, ...]]:
+        """
+        Материализованные подпространства (кортежи имен критериев).
+        """
+        return [self._names(key) for key in self._subspaces]
+
+    @property
+    def memory_bytes(self) -> int:
+        """
+        Объем результатов, хранимых для материализованных подпространств (байт).
+        """
+        return sum(subspace.nbytes for subspace in self._subspaces.values())
+
+    def _key(self, criteria: Iterable) -> Tuple[int, ...]:
+        positions = set()
+        for criterion in criteria:
+            name = criterion.name if isinstance(criterion, Criterion) else criterion
+            if name not in self._positions:
+                raise ValueError(f"Критерий '{name}' отсутствует в списке критериев")
+            positions.add(self._positions[name])
+        if not positions:
+            raise ValueError("Подпространство должно содержать хотя бы один критерий")
+        return tuple(sorted(positions))
+
+    def _names(self, key: Tuple[int, ...]) -> Tuple[str, ...]:
+        return tuple(self.criterion_names[position] for position in key)
+
+    def _candidates(self, key: Tuple[int, ...]) -> np.ndarray:
+        # Расширенное множество Парето наименьшего материализованного надпространства
+        columns = set(key)
+        best = self._root.candidates
+        for other, subspace in self._subspaces.items():
+            if len(subspace.candidates) < len(best) and columns.issubset(other):
+                best = subspace.candidates
+        return best
+
+    def _compute(self, key: Tuple[int, ...], candidates: np.ndarray) -> _Subspace:
+        values = self.normalized_matrix[np.ix_(candidates, key)]
+        # Альтернативы, совпадающие по критериям подпространства, проверяются один раз
+        representatives, classes = core.row_classes(values)
+        unique = values[representatives]
+        extended = core.extended_pareto_mask(unique)
+        pareto = np.zeros(len(unique), dtype=bool)
+        pareto[extended] = core.pareto_front_mask(unique[extended], backend=self.backend)
+        return _Subspace(candidates[extended[classes]], candidates[pareto[classes]])
+
+    def _priority(self, key: Tuple[int, ...], subspace: _Subspace) -> Tuple[int, int]:
+        return self._queries.get(key, 0), subspace.last_used
+
+    def _store(self, key: Tuple[int, ...], subspace: _Subspace) -> bool:
+        # Сохраняет подпространство, удаляя менее популярные; False, если памяти не хватает
+        priority = self._priority(key, subspace)
+        others = sorted((self._priority(other, stored), other) for other, stored in self._subspaces.items()
+                        if other != key)
+        excess = sum(self._subspaces[other].nbytes for _, other in others) + subspace.nbytes - self.max_bytes
+        victims = []
+        for other_priority, other in others:
+            if excess <= 0 or other_priority >= priority:
+                break
+            victims.append(other)
+            excess -= self._subspaces[other].nbytes
+        if excess > 0:
+            return False
+        for other in victims:
+            del self._subspaces[other]
+        self._subspaces[key] = subspace
+        return True
+
+    def _subspace(self, criteria: Iterable) -> Tuple[Tuple[int, ...], _Subspace]:
+        key = self._key(criteria)
+        self._tick += 1
+        self._queries[key] = self._queries.get(key, 0) + 1
+        if key == self._full:
+            return key, self._root
+        subspace = self._subspaces.get(key)
+        if subspace is not None:
+            self.hits += 1
+        else:
+            self.misses += 1
+            subspace = self._compute(key, self._candidates(key))
+        subspace.last_used = self._tick
+        if key not in self._subspaces and self._queries[key] >= self.materialize_after:
+            self._store(key, subspace)
+        return key, subspace
+
+    def materialize(self, subspaces: Iterable[Iterable]) -> "Skycube":
+        """
+        Вычисляет и сохраняет подпространства заранее (например, самые популярные).
+
+        Подпространства обрабатываются от больших к меньшим, чтобы меньшие вычислялись
+        по результатам больших. Подпространство не сохраняется, если для него не хватает
+        памяти даже после удаления менее популярных.
+
+        Параметры:
+        - subspaces: Подмножества критериев (имена или объекты Criterion).
+
+        Возвращает:
+        - Сам объект Skycube.
+        """
+        keys = sorted({self._key(criteria) for criteria in subspaces}, key=len, reverse=True)
+        for key in keys:
+            if key == self._full or key in self._subspaces:
+                continue
+            self._tick += 1
+            self._queries[key] = self._queries.get(key, 0) + 1
+            subspace = self._compute(key, self._candidates(key))
+            subspace.last_used = self._tick
+            self._store(key, subspace)
+        return self
+
+    def pareto_index(self, criteria: Iterable) -> np.ndarray:
+        """
+        Возвращает позиции альтернатив множества Парето по подмножеству критериев criteria
+        (имена или объекты Criterion).
+        """
+        return self._subspace(criteria)[1].pareto
+
+    def pareto_front(self, criteria: Iterable) -> np.ndarray:
+        """
+        Возвращает метки альтернатив множества Парето по подмножеству критериев criteria.
+        """
+        return self.labels[self.pareto_index(criteria)]
+
+    def t_ordering_index(self, criteria: Iterable, preferences_list: Optional[List[Preference]] = None) -> np.ndarray:
+        """
+        Возвращает позиции альтернатив, оставшихся после t-упорядочения множества Парето
+        подпространства criteria.
+
+        Параметры:
+        - criteria: Подмножество критериев (имена или объекты Criterion).
+        - preferences_list: Предпочтения запроса между критериями подпространства. По
+          умолчанию — предпочтения модели, оба критерия которых входят в подпространство
+          (результат сохраняется вместе с подпространством).
+        """
+        key, subspace = self._subspace(criteria)
+        if preferences_list is None and subspace.pareto_t is not None:
+            return subspace.pareto_t
+        names = self._names(key)
+        if preferences_list is None:
+            preference_pairs = [(pref.criterion1.name, pref.criterion2.name, pref.equivalent) for pref in self.preferences
+                                if pref.criterion1.name in names and pref.criterion2.name in names]
+        else:
+            preference_pairs = [(pref.criterion1.name, pref.criterion2.name, pref.equivalent) for pref in preferences_list]
+        group_of, closure = core.preference_structure(names, preference_pairs)
+        sums = core.group_sums(self.normalized_matrix[np.ix_(subspace.pareto, key)], group_of, closure.shape[0])
+        representatives, classes = core.row_classes(sums)
+        keep = core.t_ordering_mask(sums[representatives], closure, backend=self.backend)[classes]
+        result = subspace.pareto[keep]
+        if preferences_list is None:
+            subspace.pareto_t = result
+            if key in self._subspaces and not self._store(key, subspace):
+                # Для результата t-упорядочения не хватает памяти: хранится только множество Парето
+                subspace.pareto_t = None
+        return result
+
+    def t_ordering(self, criteria: Iterable, preferences_list: Optional[List[Preference]] = None) -> np.ndarray:
+        """
+        Возвращает метки альтернатив, оставшихся после t-упорядочения по подмножеству
+        критериев criteria (см. t_ordering_index).
+        """
+        return self.labels[self.t_ordering_index(criteria, preferences_list)]
+
+    def __str__(self):
+        """
+        Возвращает строковое представление объекта Skycube.
+        """
+        return (f"Skycube: {len(self.labels)} альтернатив, {len(self.criteria)} критериев, "
+                f"{len(self)} материализованных подпространств ({self.memory_bytes} байт из {self.max_bytes}), "
+                f"{self.hits} попаданий, {self.misses} промахов")
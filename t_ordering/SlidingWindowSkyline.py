@@ -0,0 +1,187 @@
+import heapq
+import numpy as np
+from typing import List, Mapping, Optional
+from t_ordering import Criterion, Preference
+from t_ordering import core
+
+class SlidingWindowSkyline:
+    def __init__(self, criteria_list: List[Criterion], preferences_list: Optional[List[Preference]] = None,
+                 ttl: Optional[float] = None):
+        """
+        Инициализирует множество Парето скользящего окна для альтернатив с ограниченным сроком действия.
+
+        Хранятся только кандидаты — альтернативы, которые не доминирует ни одна альтернатива,
+        действующая не меньший срок. Остальные альтернативы не могут войти в множество Парето
+        до своего истечения и отбрасываются сразу при поступлении. При истечении члена
+        множества Парето его место занимают кандидаты без повторного просмотра окна.
+
+        Параметры:
+        - criteria_list: Список объектов Criterion.
+        - preferences_list: Список объектов Preference для t-упорядочения множества Парето окна.
+        - ttl: Срок действия альтернативы по умолчанию (в единицах меток времени).
+        """
+        self.criteria = {criterion.name: criterion for criterion in criteria_list}
+        self.preferences = preferences_list or []
+        self.ttl = ttl
+
+        preference_pairs = [(pref.criterion1.name, pref.criterion2.name, pref.equivalent) for pref in self.preferences]
+        self.group_of, self.importance_closure = core.preference_structure(list(self.criteria), preference_pairs)
+        self.num_groups = self.importance_closure.shape[0]
+
+        capacity = 64
+        self._values = np.empty((capacity, len(self.criteria)))  # Нормализованные значения кандидатов
+        self._expires = np.empty(capacity)  # Моменты истечения кандидатов
+        self._alive = np.zeros(capacity, dtype=bool)  # Слот занят действующим кандидатом
+        self._on_front = np.zeros(capacity, dtype=bool)  # Кандидат входит в множество Парето окна
+        self._labels: List = [None] * capacity
+        self._size = 0  # Число занятых слотов (включая освобожденные до уплотнения)
+        self._expiry_heap = []  # Пары (момент истечения, слот)
+        self._now = -np.inf
+        self._t_cache = None
+
+    def __len__(self):
+        """
+        Возвращает число хранимых кандидатов.
+        """
+        return int(self._alive[:self._size].sum())
+
+    def insert(self, label, values: Mapping, timestamp: float, ttl: Optional[float] = None,
+               expires_at: Optional[float] = None) -> bool:
+        """
+        Добавляет альтернативу в окно.
+
+        Параметры:
+        - label: Метка альтернативы.
+        - values: Словарь {имя критерия: исходное значение}.
+        - timestamp: Момент поступления; альтернативы с истекшим сроком к этому моменту удаляются.
+        - ttl: Срок действия альтернативы (по умолчанию ttl окна).
+        - expires_at: Момент истечения; если задан, ttl не используется.
+
+        Возвращает:
+        - True, если альтернатива сохранена как кандидат, False, если ее доминирует
+          альтернатива, действующая не меньший срок.
+        """
+        if expires_at is None:
+            ttl = self.ttl if ttl is None else ttl
+            if ttl is None:
+                raise ValueError("Необходимо указать срок действия альтернативы (ttl или expires_at)")
+            expires_at = timestamp + ttl
+        row = core.normalize_row(values, list(self.criteria.values()))
+        self.expire(timestamp)
+        if expires_at <= self._now:
+            return False
+
+        live = np.flatnonzero(self._alive[:self._size])
+        values_live = self._values[live]
+        dominators = np.all(values_live >= row, axis=1) & np.any(values_live > row, axis=1)
+        if np.any(dominators & (self._expires[live] >= expires_at)):
+            return False
+
+        # Кандидаты, которых новая альтернатива доминирует, больше не входят в множество Парето,
+        # а истекающие не позже нее уже никогда не войдут
+        dominated = np.all(row >= values_live, axis=1) & np.any(row > values_live, axis=1)
+        self._on_front[live[dominated]] = False
+        self._alive[live[dominated & (self._expires[live] <= expires_at)]] = False
+
+        slot = self._allocate()
+        self._values[slot] = row
+        self._expires[slot] = expires_at
+        self._labels[slot] = label
+        self._alive[slot] = True
+        self._on_front[slot] = not dominators.any()
+        heapq.heappush(self._expiry_heap, (expires_at, slot))
+        self._t_cache = None
+        return True
+
+    def expire(self, now: float):
+        """
+        Удаляет альтернативы, срок действия которых истек к моменту now.
+        Кандидаты, доминируемые только истекшими альтернативами, входят в множество Парето.
+        """
+        self._now = max(self._now, now)
+        expired = []
+        while self._expiry_heap and self._expiry_heap[0][0] <= now:
+            _, slot = heapq.heappop(self._expiry_heap)
+            if self._alive[slot] and self._expires[slot] <= now:
+                self._alive[slot] = False
+                self._on_front[slot] = False
+                expired.append(slot)
+        if not expired:
+            return
+
+        live = np.flatnonzero(self._alive[:self._size])
+        waiting = live[~self._on_front[live]]
+        if len(waiting):
+            # Пересматриваются только кандидаты, которых доминировали истекшие альтернативы
+            affected = waiting[core.dominated_by_any(self._values[waiting], self._values[expired])]
+            if len(affected):
+                promoted = ~core.dominated_by_any(self._values[affected], self._values[live])
+                self._on_front[affected[promoted]] = True
+        self._t_cache = None
+
+    def _allocate(self) -> int:
+        if self._size == len(self._alive):
+            if self._alive.sum() * 2 <= self._size:
+                self._compact()
+            else:
+                self._grow()
+        slot = self._size
+        self._size += 1
+        return slot
+
+    def _grow(self):
+        capacity = 2 * len(self._alive)
+        for name in ("_values", "_expires", "_alive", "_on_front"):
+            old = getattr(self, name)
+            new = np.zeros((capacity,) + old.shape[1:], dtype=old.dtype)
+            new[:len(old)] = old
+            setattr(self, name, new)
+        self._labels.extend([None] * (capacity - len(self._labels)))
+
+    def _compact(self):
+        """
+        Уплотняет хранилище, удаляя освобожденные слоты, и перестраивает очередь истечения.
+        """
+        live = np.flatnonzero(self._alive[:self._size])
+        count = len(live)
+        self._values[:count] = self._values[live]
+        self._expires[:count] = self._expires[live]
+        self._on_front[:count] = self._on_front[live]
+        self._alive[:] = False
+        self._alive[:count] = True
+        self._on_front[count:] = False
+        self._labels = [self._labels[slot] for slot in live] + [None] * (len(self._labels) - count)
+        self._size = count
+        self._expiry_heap = [(self._expires[slot], slot) for slot in range(count)]
+        heapq.heapify(self._expiry_heap)
+
+    @property
+    def pareto_front(self) -> List:
+        """
+        Метки альтернатив множества Парето текущего окна (в порядке поступления).
+        """
+        front = np.flatnonzero(self._on_front[:self._size])
+        return [self._labels[slot] for slot in front]
+
+    def t_ordering(self) -> List:
+        """
+        Применяет t-упорядочение к множеству Парето текущего окна.
+
+        Возвращает:
+        - Метки альтернатив, оставшихся после t-упорядочения. Результат кэшируется до
+          следующего изменения окна.
+        """
+        if self._t_cache is None:
+            front = np.flatnonzero(self._on_front[:self._size])
+            sums = core.group_sums(self._values[front], self.group_of, self.num_groups)
+            representatives, classes = core.row_classes(sums)
+            keep = core.t_ordering_mask(sums[representatives], self.importance_closure)[classes]
+            self._t_cache = [self._labels[slot] for slot in front[keep]]
+        return list(self._t_cache)
+
+    def __str__(self):
+        """
+        Возвращает строковое представление объекта SlidingWindowSkyline.
+        """
+        return (f"SlidingWindowSkyline: кандидатов {len(self)}, "
+                f"в множестве Парето {int(self._on_front[:self._size].sum())}")
@@ -1,5 +1,11 @@
 from .Criterion import Criterion
 from .Preference import Preference
 from .DecisionModel import DecisionModel
+from .SlidingWindowSkyline import SlidingWindowSkyline
+from .PartialFront import PartialFront
+from .DominanceIndex import DominanceIndex
+from .CompiledModel import CompiledModel
+from .DominanceRelation import DominanceRelation
+from .Skycube import Skycube
 
-__all__ = ["Criterion", "Preference", "DecisionModel"]
\ No newline at end of file
+__all__ = ["Criterion", "Preference", "DecisionModel", "SlidingWindowSkyline", "PartialFront", "DominanceIndex", "CompiledModel", "DominanceRelation", "Skycube"]
\ No newline at end of file
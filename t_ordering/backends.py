@@ -0,0 +1,232 @@
+"""
+Вычислительные ядра доминирования и их наборы (бэкенды).
+
+Ядра — проверка доминирования Парето над строками (dominated_by_any) и проверка
+t-доминирования с переносом избытка между группами (t_dominated_mask) — имеют
+одинаковые сигнатуры и результаты во всех наборах:
+
+- "python": эталонные циклы на Python, по одному элементу;
+- "numpy": векторизованные операции NumPy над всеми строками сразу (core);
+- "numba": те же циклы, что и в "python", скомпилированные Numba. Перенос избытка
+  ветвится на каждом элементе и плохо векторизуется, поэтому от компиляции выигрывает
+  больше всего. Доступен, только если установлен пакет numba; компилируется при первом
+  использовании.
+
+Набор выбирается для процесса (set_backend) или для модели (DecisionModel(..., backend=...)).
+По умолчанию используется "numba", если пакет установлен, иначе "numpy".
+"""
+import importlib.util
+from typing import Callable, Dict, List, Union
+
+import numpy as np
+
+from t_ordering import core
+
+PYTHON, NUMPY, NUMBA = "python", "numpy", "numba"
+
+# Множитель округления сумм: np.round(x, 8) == round(x * _SCALE) / _SCALE
+_SCALE = 10.0 ** core._DECIMALS
+
+
+class Backend:
+    def __init__(self, name: str, dominated_by_any: Callable, t_dominated_mask: Callable):
+        """
+        Набор вычислительных ядер.
+
+        Параметры:
+        - name: имя набора.
+        - dominated_by_any: функция (candidates, front) -> булев массив (см. core.dominated_by_any).
+        - t_dominated_mask: функция (z_sums, w_sums, closure, order) -> булев массив
+          (см. core.t_dominated_mask: z_sums — строка или матрица по строке на W; order обязателен).
+        """
+        self.name = name
+        self.dominated_by_any = dominated_by_any
+        self.t_dominated_mask = t_dominated_mask
+
+    def __str__(self):
+        """
+        Возвращает строковое представление объекта Backend.
+        """
+        return f"Backend: {self.name}"
+
+
+def _loop_dominated_by_any(candidates, front):
+    result = np.zeros(candidates.shape[0], dtype=np.bool_)
+    for i in range(candidates.shape[0]):
+        for j in range(front.shape[0]):
+            not_worse = True
+            better = False
+            for k in range(candidates.shape[1]):
+                if front[j, k] < candidates[i, k]:
+                    not_worse = False
+                    break
+                if front[j, k] > candidates[i, k]:
+                    better = True
+            if not_worse and better:
+                result[i] = True
+                break
+    return result
+
+
+def _loop_t_dominated_mask(z_sums, w_sums, closure, order):
+    num_groups = z_sums.shape[1]
+    result = np.zeros(w_sums.shape[0], dtype=np.bool_)
+    for r in range(w_sums.shape[0]):
+        row = w_sums[r].copy()
+        # Доминирование по групповым суммам (WE)
+        not_worse = True
+        better = False
+        for g in range(num_groups):
+            if z_sums[r, g] < row[g]:
+                not_worse = False
+                break
+            if z_sums[r, g] > row[g]:
+                better = True
+        if not_worse and better:
+            result[r] = True
+            continue
+
+        # Перенос избытка из менее важных групп в более важные (WI)
+        alive = True
+        transferred = False
+        for group in order:
+            if row[group] <= z_sums[r, group]:
+                continue
+            remaining = round((row[group] - z_sums[r, group]) * _SCALE) / _SCALE
+            has_targets = False
+            active = True
+            for target in range(num_groups):
+                if not closure[group, target]:
+                    continue
+                if not has_targets:
+                    has_targets = True
+                    row[group] = z_sums[r, group]
+                if not active:
+                    break
+                capacity = round((z_sums[r, target] - row[target]) * _SCALE) / _SCALE
+                if capacity > 0:
+                    amount = min(remaining, capacity)
+                    row[target] = round((row[target] + amount) * _SCALE) / _SCALE
+                    remaining = round((remaining - amount) * _SCALE) / _SCALE
+                    if remaining <= 0:
+                        transferred = True
+                        active = False
+            if not has_targets or remaining > 0:
+                # Избыток некуда перенести или не удалось перенести полностью
+                alive = False
+                break
+        if alive and transferred:
+            covered = True
+            for g in range(num_groups):
+                if z_sums[r, g] < row[g]:
+                    covered = False
+                    break
+            result[r] = covered
+    return result
+
+
+def _python_t_dominated_mask(z_sums, w_sums, closure, order):
+    w_sums = np.asarray(w_sums, dtype=float)
+    return _loop_t_dominated_mask(
+        np.broadcast_to(np.asarray(z_sums, dtype=float), w_sums.shape), w_sums, np.asarray(closure, dtype=bool),
+        np.asarray(order, dtype=np.int64),
+    )
+
+
+def _python_dominated_by_any(candidates, front):
+    return _loop_dominated_by_any(np.asarray(candidates, dtype=float), np.asarray(front, dtype=float))
+
+
+def _numpy_backend() -> Backend:
+    return Backend(NUMPY, core.dominated_by_any, core.t_dominated_mask)
+
+
+def _python_backend() -> Backend:
+    return Backend(PYTHON, _python_dominated_by_any, _python_t_dominated_mask)
+
+
+def _numba_backend() -> Backend:
+    if not numba_available():
+        raise ValueError("Бэкенд 'numba' недоступен: пакет numba не установлен")
+    import numba
+
+    dominated_by_any = numba.njit(cache=True, nogil=True)(_loop_dominated_by_any)
+    t_dominated_mask = numba.njit(cache=True, nogil=True)(_loop_t_dominated_mask)
+    return Backend(
+        NUMBA,
+        lambda candidates, front: dominated_by_any(
+            np.ascontiguousarray(candidates, dtype=float), np.ascontiguousarray(front, dtype=float)
+        ),
+        lambda z_sums, w_sums, closure, order: t_dominated_mask(
+            np.ascontiguousarray(np.broadcast_to(z_sums, np.shape(w_sums)), dtype=float),
+            np.ascontiguousarray(w_sums, dtype=float),
+            np.ascontiguousarray(closure, dtype=np.bool_), np.ascontiguousarray(order, dtype=np.int64),
+        ),
+    )
+
+
+# Фабрики наборов; набор создается при первом обращении
+_factories: Dict[str, Callable[[], Backend]] = {
+    PYTHON: _python_backend,
+    NUMPY: _numpy_backend,
+    NUMBA: _numba_backend,
+}
+_backends: Dict[str, Backend] = {}
+_default = None  # Имя набора процесса (None — выбор по умолчанию)
+
+
+def numba_available() -> bool:
+    """
+    Проверяет, установлен ли пакет numba (без его импорта).
+    """
+    return importlib.util.find_spec("numba") is not None
+
+
+def available_backends() -> List[str]:
+    """
+    Возвращает имена наборов, которые можно использовать в текущем окружении.
+    """
+    return [name for name in _factories if name != NUMBA or numba_available()]
+
+
+def register_backend(backend: Backend):
+    """
+    Регистрирует собственный набор ядер под его именем.
+    """
+    _factories[backend.name] = lambda: backend
+    _backends.pop(backend.name, None)
+
+
+def get_backend(backend: Union[str, Backend, None] = None) -> Backend:
+    """
+    Возвращает набор ядер.
+
+    Параметры:
+    - backend: имя набора, сам набор или None — набор процесса (см. set_backend).
+    """
+    if isinstance(backend, Backend):
+        return backend
+    if backend is None:
+        backend = _default if _default is not None else (NUMBA if numba_available() else NUMPY)
+    if backend not in _factories:
+        raise ValueError(f"Неизвестный бэкенд: '{backend}'. Доступны: {available_backends()}")
+    if backend not in _backends:
+        _backends[backend] = _factories[backend]()
+    return _backends[backend]
+
+
+def set_backend(backend: Union[str, None]) -> Union[str, None]:
+    """
+    Задает набор ядер для всего процесса.
+
+    Параметры:
+    - backend: имя набора или None — выбор по умолчанию.
+
+    Возвращает:
+    - Прежнее значение (для восстановления).
+    """
+    global _default
+    if backend is not None:
+        get_backend(backend)
+    previous, _default = _default, backend
+    return previous
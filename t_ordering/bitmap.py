@@ -0,0 +1,171 @@
+"""
+Поиск множества Парето по битовым индексам уровней критериев.
+
+Порядковые критерии принимают всего несколько значений. Для каждого критерия и уровня
+строится битовое множество строк, значение которых не ниже этого уровня. Строки,
+не уступающие альтернативе ни по одному критерию, — пересечение (AND) множеств ее уровней,
+а строки, превосходящие ее хотя бы по одному критерию, — объединение (OR) множеств
+следующих уровней. Альтернатива входит в множество Парето, если пересечение этих
+двух множеств пусто (число единичных битов равно нулю). Операции выполняются над
+64-битными словами, то есть сразу для 64 строк.
+
+Критерии с большим числом различных значений (обычно абсолютные) разбиваются на
+квантильные интервалы; для альтернатив, которым интервалы не позволяют дать точный
+ответ, доминирование проверяется по исходным значениям.
+"""
+from typing import List, Tuple
+
+import numpy as np
+
+from t_ordering import core
+
+# Ограничение на число 64-битных слов во временных массивах блока
+_BLOCK_WORDS = 1 << 20
+# Число единичных битов в каждом байте (для NumPy без np.bitwise_count)
+_BYTE_POPCOUNT = np.unpackbits(np.arange(256, dtype=np.uint8)[:, None], axis=1).sum(axis=1)
+
+
+def level_codes(matrix: np.ndarray, max_levels: int = 64) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Кодирует значения каждого столбца номерами уровней, сохраняя порядок: из a >= b
+    следует code(a) >= code(b), а из code(a) > code(b) следует a > b.
+
+    Параметры:
+    - matrix: нормализованная матрица (альтернативы x критерии).
+    - max_levels: наибольшее число уровней столбца; столбцы с большим числом различных
+      значений разбиваются на квантильные интервалы.
+
+    Возвращает:
+    - Матрицу номеров уровней и булев массив: True для столбцов, уровни которых
+      совпадают с различными значениями (равенство уровней означает равенство значений).
+    """
+    codes = np.empty(matrix.shape, dtype=np.int64)
+    exact = np.ones(matrix.shape[1], dtype=bool)
+    for k in range(matrix.shape[1]):
+        values, codes[:, k] = np.unique(matrix[:, k], return_inverse=True)
+        if len(values) > max_levels:
+            edges = np.unique(np.quantile(matrix[:, k], np.linspace(0, 1, max_levels + 1)[1:-1]))
+            codes[:, k] = np.searchsorted(edges, matrix[:, k], side="right")
+            exact[k] = False
+    return codes, exact
+
+
+def pack_rows(masks: np.ndarray) -> np.ndarray:
+    """
+    Упаковывает булевы маски строк (по маске в строке массива) в 64-битные слова:
+    элемент j строки — бит j % 64 слова j // 64.
+    """
+    packed = np.packbits(masks, axis=1, bitorder="little")
+    padding = (-packed.shape[1]) % 8
+    if padding:
+        packed = np.pad(packed, ((0, 0), (0, padding)))
+    return np.ascontiguousarray(packed).view(np.uint64)
+
+
+def level_bitmaps(codes: np.ndarray) -> List[np.ndarray]:
+    """
+    Строит битовые индексы уровней.
+
+    Возвращает:
+    - Для каждого столбца массив (число уровней + 1) x (число слов): строка l — множество
+      строк матрицы с уровнем не ниже l; последняя строка пуста.
+    """
+    bitmaps = []
+    for k in range(codes.shape[1]):
+        column = codes[:, k]
+        levels = np.arange(column.max() + 2 if len(column) else 1)
+        bitmaps.append(pack_rows(column[None, :] >= levels[:, None]))
+    return bitmaps
+
+
+def popcount(words: np.ndarray) -> np.ndarray:
+    """
+    Число единичных битов в каждой строке массива 64-битных слов.
+    """
+    if hasattr(np, "bitwise_count"):
+        return np.bitwise_count(words).sum(axis=-1, dtype=np.int64)
+    return _BYTE_POPCOUNT[np.ascontiguousarray(words).view(np.uint8)].sum(axis=-1, dtype=np.int64)
+
+
+def bitmap_pareto_front_mask(matrix: np.ndarray, max_levels: int = 64, elite_size: int = 256) -> np.ndarray:
+    """
+    Находит множество Парето матрицы по битовым индексам уровней.
+
+    Параметры:
+    - matrix: нормализованная матрица (альтернативы x критерии).
+    - max_levels: наибольшее число уровней столбца (см. level_codes).
+    - elite_size: число лучших по сумме строк для предварительного отсева.
+
+    Возвращает:
+    - Булев массив, совпадающий с core.pareto_front_mask(matrix).
+    """
+    mask = np.zeros(matrix.shape[0], dtype=bool)
+    if matrix.shape[0] == 0:
+        return mask
+    # Предварительный отсев: строки, которые доминирует множество Парето лучших по сумме
+    # строк, не входят в результат. Доминирующая строка любой оставшейся строки тоже
+    # остается (иначе ее доминировала бы строка отсева), поэтому дальше достаточно
+    # сравнивать оставшиеся строки только между собой.
+    elite = core.dominance_sort_order(matrix)[:elite_size]
+    elite = elite[core.pareto_front_mask(matrix[elite])]
+    remaining = np.flatnonzero(~core.dominated_by_any(matrix, matrix[elite]))
+    mask[remaining] = _bitmap_front(matrix[remaining], max_levels)
+    return mask
+
+
+def _bitmap_front(matrix: np.ndarray, max_levels: int) -> np.ndarray:
+    num_alternatives = matrix.shape[0]
+    mask = np.zeros(num_alternatives, dtype=bool)
+    codes, exact = level_codes(matrix, max_levels)
+    bitmaps = level_bitmaps(codes)
+    num_words = bitmaps[0].shape[1] if bitmaps else 0
+    step = max(1, _BLOCK_WORDS // max(num_words, 1))
+    for start in range(0, num_alternatives, step):
+        block = codes[start:start + step]
+        # not_worse: строки, уровни которых не ниже по всем критериям;
+        # better: строки, уровень которых выше хотя бы по одному критерию;
+        # sure: строки, которые заведомо не хуже по значениям (для интервалов — уровень выше)
+        not_worse = np.full((len(block), num_words), np.uint64(0xFFFFFFFFFFFFFFFF))
+        better = np.zeros((len(block), num_words), dtype=np.uint64)
+        sure = not_worse.copy()
+        for k, bitmap in enumerate(bitmaps):
+            not_worse &= bitmap[block[:, k]]
+            above = bitmap[block[:, k] + 1]
+            better |= above
+            sure &= bitmap[block[:, k]] if exact[k] else above
+        dominated = np.any(not_worse & better & sure, axis=1)
+        if exact.all():
+            mask[start:start + step] = ~dominated
+            continue
+
+        # Уровни интервалов не дают точного ответа: проверка по исходным значениям
+        # среди строк, не уступающих по уровням
+        undecided = np.flatnonzero(~dominated)
+        candidates = np.unpackbits(not_worse[undecided].view(np.uint8), axis=1, bitorder="little")
+        for position, row_candidates in zip(undecided, candidates):
+            rows = np.flatnonzero(row_candidates[:num_alternatives])
+            row = matrix[start + position]
+            dominated[position] = core.dominated_by_any(row[None, :], matrix[rows])[0]
+        mask[start:start + step] = ~dominated
+    return mask
+
+
+def bitmap_dominator_counts(matrix: np.ndarray) -> np.ndarray:
+    """
+    Для каждой строки матрицы считает число строк, доминирующих над ней (по числу
+    единичных битов). Все столбцы кодируются точными уровнями.
+    """
+    codes, _ = level_codes(matrix, max_levels=max(matrix.shape[0], 1))
+    bitmaps = level_bitmaps(codes)
+    num_words = bitmaps[0].shape[1] if bitmaps else 0
+    counts = np.zeros(matrix.shape[0], dtype=np.int64)
+    step = max(1, _BLOCK_WORDS // max(num_words, 1))
+    for start in range(0, matrix.shape[0], step):
+        block = codes[start:start + step]
+        not_worse = np.full((len(block), num_words), np.uint64(0xFFFFFFFFFFFFFFFF))
+        better = np.zeros((len(block), num_words), dtype=np.uint64)
+        for k, bitmap in enumerate(bitmaps):
+            not_worse &= bitmap[block[:, k]]
+            better |= bitmap[block[:, k] + 1]
+        counts[start:start + step] = popcount(not_worse & better)
+    return counts
@@ -0,0 +1,400 @@
+"""
+Консольная утилита t-ordering для пакетной обработки задач выбора.
+
+Задача описывается JSON-объектом:
+
+    {
+        "id": "problem-1",
+        "criteria": [
+            {"name": "Price", "absolute": true, "maximize": false, "min_value": 100, "max_value": 1000},
+            {"name": "Quality", "absolute": false, "maximize": true, "valid_values": ["low", "medium", "high"]}
+        ],
+        "preferences": [
+            {"criterion1": "Quality", "criterion2": "Price", "equivalent": false}
+        ],
+        "index": "Alternative",
+        "alternatives": [
+            {"Alternative": "A", "Price": 500, "Quality": "medium"},
+            {"Alternative": "B", "Price": 800, "Quality": "high"}
+        ]
+    }
+
+Альтернативы задаются списком записей либо словарем столбцов. Для файлов CSV и Parquet
+альтернативы читаются из самого файла, а критерии и предпочтения — из спецификации (--spec).
+Результаты выводятся в формате JSONL: по одной строке с pareto_front и pareto_t на задачу.
+"""
+import argparse
+import contextlib
+import io
+import json
+import os
+import sys
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+
+from t_ordering.ingest import is_pandas_frame
+
+PROBLEM_SUFFIXES = (".json", ".jsonl", ".csv", ".parquet")
+
+
+def alternatives_from_problem(problem: Dict):
+    """
+    Извлекает альтернативы из описания задачи.
+
+    Параметры:
+    - problem: словарь задачи; альтернативы берутся из ключа "alternatives"
+      (список записей, словарь столбцов, DataFrame или таблица Arrow).
+
+    Возвращает:
+    - Альтернативы в виде, принимаемом DecisionModel, и метки альтернатив (параметр index).
+      Для JSON-задач pandas не используется.
+    """
+    alternatives = problem["alternatives"]
+    index_column = problem.get("index")
+    if is_pandas_frame(alternatives):
+        if index_column is not None and index_column in alternatives.columns:
+            alternatives = alternatives.set_index(index_column)
+        return alternatives, None
+    if isinstance(alternatives, list):
+        for number, record in enumerate(alternatives):
+            if not isinstance(record, dict):
+                raise ValueError(f"Альтернатива {number} должна быть JSON-объектом, получено: {record!r}")
+        names = list(dict.fromkeys(name for record in alternatives for name in record))
+        alternatives = {name: [record.get(name) for record in alternatives] for name in names}
+    return alternatives, index_column
+
+
+def build_model(problem: Dict):
+    """
+    Создает DecisionModel по описанию задачи.
+    """
+    from t_ordering import Criterion, Preference, DecisionModel
+
+    criteria_list = [Criterion.from_dict(item) for item in problem["criteria"]]
+    criteria = {criterion.name: criterion for criterion in criteria_list}
+    preferences_list = [Preference.from_dict(item, criteria) for item in problem.get("preferences", [])]
+    alternatives, index = alternatives_from_problem(problem)
+    return DecisionModel(criteria_list, alternatives, preferences_list, index=index)
+
+
+def _to_json_label(label):
+    """
+    Приводит метку альтернативы к типу, сериализуемому в JSON.
+    """
+    if hasattr(label, "item"):
+        label = label.item()
+    if isinstance(label, (str, int, float, bool)) or label is None:
+        return label
+    return str(label)
+
+
+def solve_problem(problem: Dict) -> Dict:
+    """
+    Решает одну задачу: находит множество Парето и применяет t-упорядочение.
+
+    Возвращает:
+    - Словарь с идентификатором задачи и метками альтернатив в pareto_front и pareto_t,
+      либо с описанием ошибки.
+    """
+    problem_id = problem.get("id")
+    try:
+        # Модель печатает отчеты о ходе работы, они не должны попадать в вывод JSONL
+        with contextlib.redirect_stdout(io.StringIO()):
+            model = build_model(problem)
+            model.find_pareto_front()
+            model.t_ordering()
+    except Exception as e:
+        # Любая ошибка в описании задачи или при решении относится только к этой задаче
+        return {"id": problem_id, "error": f"{type(e).__name__}: {e}"}
+    return {
+        "id": problem_id,
+        "pareto_front": [_to_json_label(label) for label in model.labels[model.pareto_index]],
+        "pareto_t": [_to_json_label(label) for label in model.labels[model.pareto_t_index]],
+    }
+
+
+def load_spec(path: Optional[str]) -> Optional[Dict]:
+    """
+    Читает JSON-спецификацию критериев и предпочтений для табличных файлов.
+    """
+    if path is None:
+        return None
+    with open(path, encoding="utf-8") as f:
+        return json.load(f)
+
+
+def iter_file_problems(path: str, spec: Optional[Dict] = None) -> Iterator[Dict]:
+    """
+    Читает задачи из файла JSON, JSONL, CSV или Parquet.
+    """
+    stem = os.path.splitext(os.path.basename(path))[0]
+    suffix = os.path.splitext(path)[1].lower()
+
+    if suffix == ".json":
+        with open(path, encoding="utf-8") as f:
+            problem = json.load(f)
+        if not isinstance(problem, dict):
+            raise ValueError(f"Задача в файле '{path}' должна быть JSON-объектом")
+        problem.setdefault("id", stem)
+        yield problem
+    elif suffix == ".jsonl":
+        with open(path, encoding="utf-8") as f:
+            yield from iter_jsonl_problems(enumerate(f, start=1), stem)
+    elif suffix in (".csv", ".parquet"):
+        if spec is None:
+            raise ValueError(f"Для файла '{path}' необходимо указать спецификацию критериев (--spec)")
+        if suffix == ".csv":
+            import pandas as pd
+
+            alternatives = pd.read_csv(path)
+        else:
+            # Parquet читается в таблицу Arrow: столбцы передаются в модель без копирования
+            import pyarrow.parquet as pq
+
+            alternatives = pq.read_table(path)
+        problem = dict(spec)
+        problem["alternatives"] = alternatives
+        problem["id"] = stem
+        yield problem
+    else:
+        raise ValueError(f"Неподдерживаемый формат файла задачи: '{path}'")
+
+
+def iter_jsonl_problems(numbered_lines: Iterable[Tuple[int, str]], source: str) -> Iterator[Dict]:
+    """
+    Читает задачи из пронумерованных строк JSONL; пустые строки пропускаются.
+    """
+    for line_number, line in numbered_lines:
+        if not line.strip():
+            continue
+        problem = json.loads(line)
+        if not isinstance(problem, dict):
+            raise ValueError(f"Строка {line_number}: задача должна быть JSON-объектом")
+        problem.setdefault("id", f"{source}:{line_number}")
+        yield problem
+
+
+def solve_lines(numbered_lines: Iterable[Tuple[int, str]], source: str) -> List[Dict]:
+    """
+    Решает задачи из пронумерованных строк JSONL. Ошибка в строке (неверный JSON, не объект)
+    дает запись с ошибкой для этой строки, остальные строки обрабатываются.
+    """
+    results = []
+    for line_number, line in numbered_lines:
+        try:
+            problems = list(iter_jsonl_problems([(line_number, line)], source))
+        except ValueError as e:
+            results.append({"id": f"{source}:{line_number}", "error": f"{type(e).__name__}: {e}"})
+            continue
+        results.extend(solve_problem(problem) for problem in problems)
+    return results
+
+
+def solve_batch(task: Tuple[str, List[str], Optional[Dict]]) -> List[Dict]:
+    """
+    Обрабатывает пачку задач в рабочем процессе.
+
+    Параметры:
+    - task: кортеж (вид, элементы, спецификация), где вид — "files" для путей к файлам
+      или "lines" для пронумерованных строк JSONL.
+    """
+    kind, items, spec = task
+    if kind == "lines":
+        return solve_lines(items, "stdin")
+
+    results = []
+    for path in items:
+        try:
+            if path.lower().endswith(".jsonl"):
+                stem = os.path.splitext(os.path.basename(path))[0]
+                with open(path, encoding="utf-8") as f:
+                    results.extend(solve_lines(enumerate(f, start=1), stem))
+            else:
+                for problem in iter_file_problems(path, spec):
+                    results.append(solve_problem(problem))
+        except (OSError, ValueError, MemoryError) as e:
+            results.append({"id": path, "error": f"{type(e).__name__}: {e}"})
+    return results
+
+
+def failed_batch(task: Tuple[str, List, Optional[Dict]], error: str) -> List[Dict]:
+    """
+    Возвращает записи с ошибкой для всех элементов пачки (файлов или строк stdin).
+    """
+    kind, items, _ = task
+    ids = [f"stdin:{line_number}" for line_number, _ in items] if kind == "lines" else list(items)
+    return [{"id": problem_id, "error": error} for problem_id in ids]
+
+
+def _limit_worker_memory(max_memory_mb: Optional[int]):
+    """
+    Ограничивает объем адресного пространства процесса (мягкий предел RLIMIT_AS;
+    жесткий предел не меняется, поэтому прежнее ограничение можно восстановить).
+
+    Возвращает:
+    - Прежние пределы (soft, hard) или None, если ограничение не задано.
+    """
+    if not max_memory_mb:
+        return None
+    import resource
+
+    previous = resource.getrlimit(resource.RLIMIT_AS)
+    hard = previous[1]
+    limit = max_memory_mb * 1024 * 1024
+    if hard != resource.RLIM_INFINITY:
+        limit = min(limit, hard)
+    resource.setrlimit(resource.RLIMIT_AS, (limit, hard))
+    return previous
+
+
+@contextlib.contextmanager
+def _memory_limit(max_memory_mb: Optional[int]):
+    # Ограничение памяти текущего процесса на время блока
+    previous = _limit_worker_memory(max_memory_mb)
+    try:
+        yield
+    finally:
+        if previous is not None:
+            import resource
+
+            resource.setrlimit(resource.RLIMIT_AS, previous)
+
+
+def collect_files(paths: List[str]) -> List[str]:
+    """
+    Раскрывает каталоги в отсортированный список файлов задач.
+    """
+    files = []
+    for path in paths:
+        if os.path.isdir(path):
+            for name in sorted(os.listdir(path)):
+                if name.lower().endswith(PROBLEM_SUFFIXES):
+                    files.append(os.path.join(path, name))
+        else:
+            files.append(path)
+    return files
+
+
+def _chunked(items: Iterable, size: int) -> Iterator[List]:
+    chunk = []
+    for item in items:
+        chunk.append(item)
+        if len(chunk) >= size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+def run_tasks(tasks: Iterable, jobs: int, max_memory_mb: Optional[int] = None,
+              max_tasks_per_child: Optional[int] = None) -> Iterator[Dict]:
+    """
+    Выполняет пачки задач в пуле процессов и возвращает результаты в порядке входа.
+
+    Одновременно в работе находится не более 4 * jobs пачек, поэтому память главного
+    процесса не растет с числом задач. Аварийное завершение рабочего процесса не
+    прерывает обработку: пачки, потерянные вместе с процессом, повторяются каждая в
+    отдельном процессе, а пачка, снова завершившая процесс, дает записи с ошибкой.
+    При jobs <= 1 задачи решаются в текущем процессе, ограничение памяти действует
+    только на время решения пачки.
+    """
+    if jobs <= 1:
+        for task in tasks:
+            with _memory_limit(max_memory_mb):
+                results = solve_batch(task)
+            yield from results
+        return
+
+    def new_executor():
+        return ProcessPoolExecutor(
+            max_workers=jobs,
+            initializer=_limit_worker_memory,
+            initargs=(max_memory_mb,),
+            max_tasks_per_child=max_tasks_per_child,
+        )
+
+    def results_of(task, future):
+        try:
+            return future.result()
+        except BrokenProcessPool:
+            return _solve_isolated(task, max_memory_mb)
+
+    window = 4 * jobs
+    executor = new_executor()
+    try:
+        pending = deque()
+        for task in tasks:
+            try:
+                future = executor.submit(solve_batch, task)
+            except BrokenProcessPool:
+                # Пул остановлен из-за аварии процесса: дальнейшие пачки идут в новый пул
+                executor.shutdown(wait=False)
+                executor = new_executor()
+                future = executor.submit(solve_batch, task)
+            pending.append((task, future))
+            if len(pending) >= window:
+                yield from results_of(*pending.popleft())
+        while pending:
+            yield from results_of(*pending.popleft())
+    finally:
+        executor.shutdown(wait=True, cancel_futures=True)
+
+
+def _solve_isolated(task, max_memory_mb: Optional[int]) -> List[Dict]:
+    # Повтор пачки в отдельном процессе: пул не сообщает, какая пачка завершила процесс
+    with ProcessPoolExecutor(max_workers=1, initializer=_limit_worker_memory, initargs=(max_memory_mb,)) as executor:
+        try:
+            return executor.submit(solve_batch, task).result()
+        except BrokenProcessPool as e:
+            return failed_batch(task, f"{type(e).__name__}: рабочий процесс завершился аварийно ({e})")
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog="t-ordering",
+        description="Поиск множества Парето и t-упорядочение для набора задач выбора.",
+    )
+    parser.add_argument(
+        "paths", nargs="*",
+        help="Файлы задач (.json, .jsonl, .csv, .parquet) или каталоги с ними. "
+             "Без аргументов задачи читаются из stdin в формате JSONL.",
+    )
+    parser.add_argument("--spec", help="JSON с критериями и предпочтениями для файлов CSV и Parquet.")
+    parser.add_argument("-o", "--output", help="Файл для результатов JSONL (по умолчанию stdout).")
+    parser.add_argument("-j", "--jobs", type=int, default=os.cpu_count() or 1,
+                        help="Число рабочих процессов.")
+    parser.add_argument("--batch-size", type=int, default=64,
+                        help="Число файлов или строк, передаваемых рабочему процессу за раз.")
+    parser.add_argument("--max-memory-mb", type=int, default=None,
+                        help="Ограничение памяти на рабочий процесс, МБ.")
+    parser.add_argument("--max-tasks-per-child", type=int, default=None,
+                        help="Перезапускать рабочий процесс после указанного числа пачек.")
+    return parser
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    args = build_parser().parse_args(argv)
+    spec = load_spec(args.spec)
+
+    if args.paths:
+        files = collect_files(args.paths)
+        tasks = (("files", chunk, spec) for chunk in _chunked(files, args.batch_size))
+    else:
+        tasks = (("lines", chunk, None) for chunk in _chunked(enumerate(sys.stdin, start=1), args.batch_size))
+
+    output = open(args.output, "w", encoding="utf-8") if args.output else sys.stdout
+    has_errors = False
+    try:
+        for result in run_tasks(tasks, args.jobs, args.max_memory_mb, args.max_tasks_per_child):
+            has_errors = has_errors or "error" in result
+            output.write(json.dumps(result, ensure_ascii=False) + "\n")
+    finally:
+        if output is not sys.stdout:
+            output.close()
+    return 1 if has_errors else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,919 @@
+"""
+Вычислительное ядро t-упорядочения на массивах NumPy.
+
+Модуль не зависит от pandas: нормализация, поиск множества Парето, построение групп
+эквивалентных критериев и t-упорядочение работают с матрицей значений размера
+(число альтернатив) x (число критериев), столбцы которой идут в порядке списка критериев.
+"""
+from typing import Dict, List, Mapping, Sequence, Tuple
+
+import numpy as np
+
+from t_ordering.ingest import DictionaryColumn
+
+# Ограничение на число элементов во временных массивах при попарных сравнениях
+_BLOCK_ELEMENTS = 1 << 22
+# Число знаков округления групповых сумм
+_DECIMALS = 8
+
+
+def encode_ordinal(values: np.ndarray, valid_values: Sequence) -> np.ndarray:
+    """
+    Кодирует порядковые значения номерами в списке допустимых значений.
+
+    Параметры:
+    - values: массив исходных значений или DictionaryColumn.
+    - valid_values: упорядоченный список допустимых значений.
+
+    Возвращает:
+    - Массив кодов (int64); недопустимые и пропущенные значения кодируются как -1.
+    """
+    value_to_number = {value: idx for idx, value in enumerate(valid_values)}
+    if isinstance(values, DictionaryColumn):
+        # Сопоставление выполняется для словаря, коды столбца получаются индексированием
+        dictionary_codes = np.array(
+            [value_to_number.get(value, -1) for value in values.dictionary.tolist()] + [-1], dtype=np.int64
+        )
+        return dictionary_codes[values.indices]
+    try:
+        # Словарь применяется только к уникальным значениям столбца
+        uniques, inverse = np.unique(values, return_inverse=True)
+    except TypeError:
+        return np.fromiter(
+            (value_to_number.get(value, -1) for value in values), dtype=np.int64, count=len(values)
+        )
+    unique_codes = np.array([value_to_number.get(value, -1) for value in uniques.tolist()], dtype=np.int64)
+    return unique_codes[inverse.reshape(-1)]
+
+
+def validate_column(values: np.ndarray, criterion) -> None:
+    """
+    Проверяет тип и допустимость значений столбца для критерия.
+    Если проверка не пройдена, выбрасывает исключение ValueError.
+    """
+    if criterion.is_absolute():
+        if values.dtype.kind not in "biufc":
+            raise ValueError(
+                f"Критерий '{criterion.name}' должен иметь числовой тип данных"
+            )
+        in_range = (values >= criterion.min_value) & (values <= criterion.max_value)
+        if not in_range.all():
+            raise ValueError(
+                f"Значения {values[~in_range].tolist()} для критерия '{criterion.name}' выходят за допустимый диапазон [{criterion.min_value}, {criterion.max_value}]"
+            )
+    elif criterion.is_ordinal():
+        if values.dtype.kind not in "OU":
+            raise ValueError(
+                f"Критерий '{criterion.name}' должен иметь строковый тип данных для порядковых значений"
+            )
+        codes = encode_ordinal(values, criterion.valid_values)
+        if (codes < 0).any():
+            raise ValueError(
+                f"Значения {values[codes < 0].tolist()} для критерия '{criterion.name}' не входят в допустимые значения {criterion.valid_values}"
+            )
+
+
+def validate_columns(columns: Dict[str, np.ndarray], criteria: Sequence) -> None:
+    """
+    Проверяет столбцы всех критериев (см. validate_column). Числовые столбцы абсолютных
+    критериев проверяются на попадание в границы одной операцией над блоком столбцов;
+    при ошибке сообщение формирует validate_column для первого неверного столбца.
+    """
+    for criterion in criteria:
+        if criterion.name not in columns:
+            raise ValueError(f"Критерий '{criterion.name}' отсутствует в DataFrame альтернатив")
+    batched = [
+        criterion for criterion in criteria
+        if criterion.is_absolute() and np.asarray(columns[criterion.name]).dtype.kind in "biuf"
+    ]
+    if batched:
+        block = np.column_stack([np.asarray(columns[criterion.name], dtype=float) for criterion in batched])
+        k_min = np.array([criterion.min_value for criterion in batched], dtype=float)
+        k_max = np.array([criterion.max_value for criterion in batched], dtype=float)
+        invalid = ~np.all((block >= k_min) & (block <= k_max), axis=0)
+        for position in np.flatnonzero(invalid)[:1]:
+            validate_column(columns[batched[position].name], batched[position])
+    batched_names = {criterion.name for criterion in batched}
+    for criterion in criteria:
+        if criterion.name not in batched_names:
+            validate_column(columns[criterion.name], criterion)
+
+
+def normalize_column(values: np.ndarray, criterion) -> np.ndarray:
+    """
+    Нормализует значения одного критерия в отрезок [0, 1], где 1 — лучшее значение.
+    """
+    if criterion.is_ordinal():
+        if len(criterion.valid_values) == 1:
+            return np.ones(len(values))
+        # Кодирование порядковых значений от 0 до n
+        alt_star = encode_ordinal(values, criterion.valid_values).astype(float)
+        k_min = 0
+        k_max = len(criterion.valid_values) - 1
+    else:
+        if criterion.min_value == criterion.max_value:
+            return np.ones(len(values))
+        alt_star = np.asarray(values, dtype=float)
+        k_min = criterion.min_value
+        k_max = criterion.max_value
+
+    if criterion.is_maximize():
+        return (alt_star - k_min) / (k_max - k_min)
+    return (k_max - alt_star) / (k_max - k_min)
+
+
+def normalize_matrix(columns: Dict[str, np.ndarray], criteria: Sequence) -> np.ndarray:
+    """
+    Строит нормализованную матрицу альтернатив, столбцы которой идут в порядке criteria.
+    """
+    num_alternatives = len(next(iter(columns.values()))) if columns else 0
+    matrix = np.empty((num_alternatives, len(criteria)))
+    # Абсолютные критерии с различными границами нормализуются одной операцией над блоком столбцов
+    batched = [
+        position for position, criterion in enumerate(criteria)
+        if criterion.is_absolute() and criterion.min_value != criterion.max_value
+        and np.asarray(columns[criterion.name]).dtype.kind in "biuf"
+    ]
+    if batched:
+        k_min = np.array([criteria[position].min_value for position in batched], dtype=float)
+        k_max = np.array([criteria[position].max_value for position in batched], dtype=float)
+        maximize = np.array([criteria[position].is_maximize() for position in batched])
+        block = np.column_stack([np.asarray(columns[criteria[position].name], dtype=float) for position in batched])
+        matrix[:, batched] = np.where(maximize, block - k_min, k_max - block) / (k_max - k_min)
+    for position in np.setdiff1d(np.arange(len(criteria)), batched).tolist():
+        matrix[:, position] = normalize_column(columns[criteria[position].name], criteria[position])
+    return matrix
+
+
+def row_classes(matrix: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Разбивает строки матрицы на классы совпадающих строк.
+
+    Совпадающие строки одинаково участвуют в отношениях доминирования, поэтому
+    проверки достаточно выполнить для одного представителя класса, а результат
+    распространить на все строки класса: result_for_rows = result_for_representatives[classes].
+
+    Возвращает:
+    - Номера строк-представителей (первые вхождения, по возрастанию) и номер класса
+      (позицию представителя) для каждой строки.
+    """
+    if matrix.shape[0] == 0:
+        return np.empty(0, dtype=np.int64), np.empty(0, dtype=np.int64)
+    _, first, inverse = np.unique(matrix, axis=0, return_index=True, return_inverse=True)
+    # Представители упорядочиваются по первому вхождению, чтобы сохранить порядок обхода строк
+    order = np.argsort(first)
+    position = np.empty_like(order)
+    position[order] = np.arange(len(order))
+    return first[order], position[inverse.reshape(-1)]
+
+
+def dominates(row1: np.ndarray, row2: np.ndarray) -> bool:
+    """
+    Проверяет, доминирует ли row1 над row2 по критерию Парето.
+    """
+    return bool(np.all(row1 >= row2) and np.any(row1 > row2))
+
+
+def dominated_by_any(candidates: np.ndarray, front: np.ndarray) -> np.ndarray:
+    """
+    Для каждой строки candidates проверяет, доминирует ли над ней хотя бы одна строка front.
+
+    Возвращает:
+    - Булев массив длины len(candidates).
+    """
+    result = np.zeros(len(candidates), dtype=bool)
+    if len(candidates) == 0 or len(front) == 0:
+        return result
+    step = max(1, _BLOCK_ELEMENTS // len(candidates))
+    for start in range(0, len(front), step):
+        block = front[start:start + step]
+        # Сравнение по столбцам: двумерные массивы (строки фронта x кандидаты)
+        geq = np.ones((len(block), len(candidates)), dtype=bool)
+        gt = np.zeros((len(block), len(candidates)), dtype=bool)
+        for k in range(candidates.shape[1]):
+            front_column = block[:, k, None]
+            candidate_column = candidates[None, :, k]
+            geq &= front_column >= candidate_column
+            gt |= front_column > candidate_column
+        result |= np.any(geq & gt, axis=0)
+    return result
+
+
+def strictly_dominated_by_any(candidates: np.ndarray, front: np.ndarray) -> np.ndarray:
+    """
+    Для каждой строки candidates проверяет, есть ли в front строка, строго большая
+    по каждому столбцу.
+
+    Возвращает:
+    - Булев массив длины len(candidates).
+    """
+    result = np.zeros(len(candidates), dtype=bool)
+    if len(candidates) == 0 or len(front) == 0:
+        return result
+    step = max(1, _BLOCK_ELEMENTS // len(candidates))
+    for start in range(0, len(front), step):
+        block = front[start:start + step]
+        gt = np.ones((len(block), len(candidates)), dtype=bool)
+        for k in range(candidates.shape[1]):
+            gt &= block[:, k, None] > candidates[None, :, k]
+        result |= np.any(gt, axis=0)
+    return result
+
+
+def dominance_sort_order(matrix: np.ndarray, key: np.ndarray = None) -> np.ndarray:
+    """
+    Возвращает порядок строк, в котором любая доминирующая альтернатива идет раньше
+    доминируемой: по убыванию суммы значений, затем лексикографически по убыванию.
+
+    Параметры:
+    - key: значения, заменяющие сумму, например взвешенные суммы с положительными
+      весами (weighted_scores); ключ не должен убывать при улучшении значений.
+    """
+    keys = tuple(-matrix[:, k] for k in reversed(range(matrix.shape[1])))
+    return np.lexsort(keys + (-(matrix.sum(axis=1) if key is None else key),))
+
+
+def _kernels(backend):
+    # Набор ядер доминирования (см. backends); импорт при вызове, так как backends использует core
+    from t_ordering import backends
+
+    return backends.get_backend(backend)
+
+
+def pareto_front_mask(matrix: np.ndarray, block_size: int = 1024, key: np.ndarray = None,
+                      backend=None) -> np.ndarray:
+    """
+    Находит множество Парето (недоминируемые строки) матрицы.
+
+    Строки просматриваются в порядке dominance_sort_order блоками: блок сначала
+    фильтруется уже найденным фронтом, затем внутри блока оставляются недоминируемые строки.
+
+    Параметры:
+    - key: ключ предварительной сортировки (см. dominance_sort_order).
+    - backend: набор ядер доминирования (см. backends.get_backend).
+
+    Возвращает:
+    - Булев массив, True для строк из множества Парето.
+    """
+    num_alternatives = matrix.shape[0]
+    mask = np.zeros(num_alternatives, dtype=bool)
+    if num_alternatives == 0:
+        return mask
+    dominated = _kernels(backend).dominated_by_any
+
+    order = dominance_sort_order(matrix, key)
+    front = np.empty_like(matrix)
+    front_size = 0
+    for start in range(0, num_alternatives, block_size):
+        block_indices = order[start:start + block_size]
+        block = matrix[block_indices]
+        survivors = ~dominated(block, front[:front_size])
+        block_indices, block = block_indices[survivors], block[survivors]
+        survivors = ~dominated(block, block)
+        block_indices, block = block_indices[survivors], block[survivors]
+        front[front_size:front_size + len(block)] = block
+        front_size += len(block)
+        mask[block_indices] = True
+    return mask
+
+
+def extended_pareto_mask(matrix: np.ndarray, block_size: int = 1024) -> np.ndarray:
+    """
+    Находит расширенное множество Парето: строки, над которыми ни одна строка не
+    доминирует строго (не больше по каждому столбцу).
+
+    Расширенное множество содержит множество Парето и монотонно по столбцам: для
+    подмножества столбцов U ⊆ V расширенное множество по U содержится в расширенном
+    множестве по V. Поэтому множество Парето по U можно искать только среди строк
+    расширенного множества по любому V ⊇ U.
+
+    Возвращает:
+    - Булев массив, True для строк расширенного множества Парето.
+    """
+    num_alternatives = matrix.shape[0]
+    mask = np.zeros(num_alternatives, dtype=bool)
+    if num_alternatives == 0:
+        return mask
+    # Строго доминирующая строка имеет большую сумму и идет раньше; исключенная строка
+    # строго доминируется и оставленной строкой (отношение транзитивно)
+    order = dominance_sort_order(matrix)
+    front = np.empty_like(matrix)
+    front_size = 0
+    for start in range(0, num_alternatives, block_size):
+        block_indices = order[start:start + block_size]
+        block = matrix[block_indices]
+        survivors = ~strictly_dominated_by_any(block, front[:front_size])
+        block_indices, block = block_indices[survivors], block[survivors]
+        survivors = ~strictly_dominated_by_any(block, block)
+        block_indices, block = block_indices[survivors], block[survivors]
+        front[front_size:front_size + len(block)] = block
+        front_size += len(block)
+        mask[block_indices] = True
+    return mask
+
+
+def epsilon_pareto_mask(matrix: np.ndarray, epsilon: float) -> np.ndarray:
+    """
+    Находит приближенное множество Парето по ε-доминированию на сетке.
+
+    Нормализованное пространство [0, 1]^m делится на ячейки со стороной epsilon. Остаются
+    только ячейки, не доминируемые другими ячейками, и в каждой из них — одна альтернатива
+    с наибольшей суммой значений (она недоминируема и в точном смысле). Для любой
+    исключенной альтернативы x найдется оставленная r, у которой r_k > x_k - epsilon
+    по каждому критерию. Число оставленных альтернатив не превышает (1/epsilon + 1)^(m-1).
+
+    Параметры:
+    - matrix: нормализованная матрица (альтернативы x критерии).
+    - epsilon: сторона ячейки сетки, 0 < epsilon.
+
+    Возвращает:
+    - Булев массив, True для оставленных альтернатив.
+    """
+    if not epsilon > 0:
+        raise ValueError(f"Параметр epsilon должен быть положительным, получено: {epsilon}")
+    mask = np.zeros(matrix.shape[0], dtype=bool)
+    if matrix.shape[0] == 0:
+        return mask
+    boxes = np.floor(matrix / epsilon)
+    box_rows, classes = row_classes(boxes)
+    front_boxes = pareto_front_mask(boxes[box_rows])
+    candidates = np.flatnonzero(front_boxes[classes])
+    # Внутри ячейки первой идет альтернатива с наибольшей суммой значений
+    ordered = candidates[np.lexsort((-matrix[candidates].sum(axis=1), classes[candidates]))]
+    _, first = np.unique(classes[ordered], return_index=True)
+    mask[ordered[first]] = True
+    return mask
+
+
+def domination_matrix(matrix: np.ndarray) -> np.ndarray:
+    """
+    Строит матрицу доминирования D, где D[i, j] = True, если строка i доминирует над строкой j.
+    Требует памяти порядка n^2 и предназначена для небольших n.
+    """
+    num_alternatives = matrix.shape[0]
+    geq = np.ones((num_alternatives, num_alternatives), dtype=bool)
+    gt = np.zeros((num_alternatives, num_alternatives), dtype=bool)
+    for k in range(matrix.shape[1]):
+        column = matrix[:, k]
+        geq &= column[:, None] >= column[None, :]
+        gt |= column[:, None] > column[None, :]
+    return geq & gt
+
+
+def deb_ranks(matrix: np.ndarray) -> np.ndarray:
+    """
+    Быстрая недоминируемая сортировка Деба: ранги фронтов по счетчикам доминирования.
+
+    Возвращает:
+    - Массив рангов (int32), 1 — множество Парето.
+    """
+    dominance = domination_matrix(matrix)
+    counts = dominance.sum(axis=0)
+    ranks = np.zeros(matrix.shape[0], dtype=np.int32)
+    current = np.flatnonzero(counts == 0)
+    rank = 1
+    while len(current):
+        ranks[current] = rank
+        counts -= dominance[current].sum(axis=0)
+        current = np.flatnonzero((counts == 0) & (ranks == 0))
+        rank += 1
+    return ranks
+
+
+def ens_ranks(matrix: np.ndarray, block_size: int = 512) -> np.ndarray:
+    """
+    Эффективная недоминируемая сортировка (ENS) с бинарным поиском фронта.
+
+    Строки обрабатываются в порядке dominance_sort_order, поэтому ранг каждой строки
+    определяется окончательно при ее просмотре. Если строку доминирует член фронта k,
+    то ее доминирует и член каждого предыдущего фронта, что допускает бинарный поиск.
+    Строки берутся блоками: бинарный поиск по уже построенным фронтам выполняется для
+    всего блока сразу, затем учитывается доминирование внутри блока.
+
+    Возвращает:
+    - Массив рангов (int32), 1 — множество Парето.
+    """
+    num_alternatives, num_criteria = matrix.shape
+    ranks = np.zeros(num_alternatives, dtype=np.int32)
+    fronts: List[np.ndarray] = []
+    sizes: List[int] = []
+    order = dominance_sort_order(matrix)
+    for start in range(0, num_alternatives, block_size):
+        block_indices = order[start:start + block_size]
+        block = matrix[block_indices]
+
+        # Бинарный поиск первого фронта без доминирующих строк, одновременно для всего блока
+        low = np.zeros(len(block), dtype=np.int64)
+        high = np.full(len(block), len(fronts), dtype=np.int64)
+        while True:
+            active = low < high
+            if not active.any():
+                break
+            middle = (low + high) // 2
+            dominated = np.zeros(len(block), dtype=bool)
+            for front in np.unique(middle[active]):
+                selected = np.flatnonzero(active & (middle == front))
+                dominated[selected] = dominated_by_any(block[selected], fronts[front][:sizes[front]])
+            low = np.where(active & dominated, middle + 1, low)
+            high = np.where(active & ~dominated, middle, high)
+        block_ranks = low + 1
+
+        # Доминирующие строки внутри блока идут раньше доминируемых
+        dominance = domination_matrix(block)
+        for position in range(len(block)):
+            dominators = np.flatnonzero(dominance[:position, position])
+            if len(dominators):
+                block_ranks[position] = max(block_ranks[position], block_ranks[dominators].max() + 1)
+        ranks[block_indices] = block_ranks
+
+        for rank in np.unique(block_ranks):
+            rows = block[block_ranks == rank]
+            front = rank - 1
+            if front == len(fronts):
+                fronts.append(np.empty((max(16, len(rows)), num_criteria)))
+                sizes.append(0)
+            if sizes[front] + len(rows) > len(fronts[front]):
+                grown = np.empty((2 * (sizes[front] + len(rows)), num_criteria))
+                grown[:sizes[front]] = fronts[front][:sizes[front]]
+                fronts[front] = grown
+            fronts[front][sizes[front]:sizes[front] + len(rows)] = rows
+            sizes[front] += len(rows)
+    return ranks
+
+
+def nondominated_ranks(matrix: np.ndarray, method: str = "auto") -> np.ndarray:
+    """
+    Присваивает каждой альтернативе ранг фронта Парето за один проход.
+
+    Параметры:
+    - matrix: нормализованная матрица (альтернативы x критерии).
+    - method: "deb" — сортировка Деба (память O(n^2), для небольших n), "ens" — ENS
+      с бинарным поиском, "auto" — выбор по числу альтернатив.
+
+    Возвращает:
+    - Массив рангов (int32), 1 — множество Парето.
+    """
+    if method == "auto":
+        method = "deb" if matrix.shape[0] <= 2048 else "ens"
+    if method == "deb":
+        return deb_ranks(matrix)
+    if method == "ens":
+        return ens_ranks(matrix)
+    raise ValueError(f"Неизвестный метод недоминируемой сортировки: '{method}'")
+
+
+def check_preference_cycles(criterion_names: Sequence[str],
+                            preference_pairs: Sequence[Tuple[str, str, bool]]) -> None:
+    """
+    Проверяет наличие циклов в предпочтениях критериев.
+    Если цикл найден, выбрасывает исключение ValueError с подробной информацией о цикле.
+
+    Параметры:
+    - criterion_names: имена критериев.
+    - preference_pairs: тройки (критерий1, критерий2, эквивалентны ли).
+    """
+    # Построение графа предпочтений
+    graph: Dict[str, List[Tuple[str, bool]]] = {}
+    for name in criterion_names:
+        graph[name] = []
+
+    # Добавляем ребра в граф
+    for c1, c2, equivalent in preference_pairs:
+        if equivalent:
+            # Добавляем двунаправленные ребра для эквивалентности
+            graph[c1].append((c2, False))  # False означает, что ребро не строгое
+            graph[c2].append((c1, False))
+        else:
+            # Добавляем направленное ребро для строгого предпочтения
+            graph[c1].append((c2, True))  # True означает, что ребро строгое
+
+    def dfs(node, parent, has_strict_edge, stack):
+        stack.append(node)
+        for neighbor, is_strict in graph[node]:
+            path_has_strict_edge = has_strict_edge or is_strict
+            if (neighbor != stack[0]) and (len(stack) < 3):
+                if dfs(neighbor, node, path_has_strict_edge, stack):
+                    return True
+            elif neighbor == stack[0] and path_has_strict_edge:
+                # Если найден цикл, и по пути есть хотя бы одно строгое предпочтение, то собираем цикл
+                cycle = []
+                idx = stack.index(neighbor)
+                cycle_nodes = stack[idx:] + [neighbor]
+                for i in range(len(cycle_nodes) - 1):
+                    n1 = cycle_nodes[i]
+                    n2 = cycle_nodes[i + 1]
+                    # Найдем отношение между n1 и n2
+                    for neighbor_name, is_strict_edge in graph[n1]:
+                        if neighbor_name == n2:
+                            relation = ">" if is_strict_edge else "="
+                            cycle.append(f"{n1} {relation} {n2}")
+                            break
+                error_message = "Обнаружен цикл в предпочтениях: " + " -> ".join(cycle)
+                raise ValueError(error_message)
+        stack.pop()
+        return False
+
+    for node in graph:
+        if dfs(node, None, False, []):
+            return
+
+
+def equivalent_groups(criterion_names: Sequence[str],
+                      preference_pairs: Sequence[Tuple[str, str, bool]]) -> Tuple[List[List[str]], np.ndarray]:
+    """
+    Объединяет критерии в группы эквивалентности (система непересекающихся множеств).
+
+    Параметры:
+    - criterion_names: имена критериев в порядке списка критериев.
+    - preference_pairs: тройки (критерий1, критерий2, эквивалентны ли).
+
+    Возвращает:
+    - Список групп (списки имен в порядке критериев; группы упорядочены по первому критерию)
+      и массив номеров групп для каждого критерия.
+    """
+    position = {name: idx for idx, name in enumerate(criterion_names)}
+    group_of = equivalent_group_of(
+        len(criterion_names),
+        [(position[name1], position[name2]) for name1, name2, equivalent in preference_pairs if equivalent],
+    )
+    groups: List[List[str]] = [[] for _ in range(int(group_of.max()) + 1 if len(group_of) else 0)]
+    for name, group in zip(criterion_names, group_of.tolist()):
+        groups[group].append(name)
+    return groups, group_of
+
+
+def equivalent_group_of(num_criteria: int, equivalent_pairs: Sequence[Tuple[int, int]]) -> np.ndarray:
+    """
+    Номера групп эквивалентности по целочисленным позициям критериев.
+
+    Параметры:
+    - num_criteria: число критериев.
+    - equivalent_pairs: пары позиций эквивалентных критериев.
+
+    Возвращает:
+    - Массив номеров групп; группы нумеруются в порядке первого критерия группы.
+    """
+    parent = list(range(num_criteria))
+
+    def find(node):
+        while parent[node] != node:
+            parent[node] = parent[parent[node]]
+            node = parent[node]
+        return node
+
+    for position1, position2 in equivalent_pairs:
+        root1, root2 = find(position1), find(position2)
+        if root1 != root2:
+            parent[max(root1, root2)] = min(root1, root2)
+
+    # Корень множества — его наименьший элемент, поэтому номера групп по возрастанию
+    # корней идут в порядке первого критерия группы
+    roots = np.array([find(idx) for idx in range(num_criteria)], dtype=np.int64)
+    _, group_of = np.unique(roots, return_inverse=True)
+    return group_of.reshape(-1).astype(np.int64)
+
+
+def importance_closure(group_of: np.ndarray, num_groups: int,
+                       strict_pairs: Sequence[Tuple[int, int]]) -> np.ndarray:
+    """
+    Строит транзитивное замыкание отношения важности между группами.
+
+    Параметры:
+    - group_of: номер группы для каждого критерия.
+    - num_groups: число групп.
+    - strict_pairs: пары позиций критериев (более важный, менее важный).
+
+    Возвращает:
+    - Булеву матрицу closure, где closure[g, h] = True, если группа h важнее группы g.
+    """
+    closure = np.zeros((num_groups, num_groups), dtype=bool)
+    more_important_of: List[List[int]] = [[] for _ in range(num_groups)]
+    for more_important, less_important in strict_pairs:
+        g_more, g_less = group_of[more_important], group_of[less_important]
+        if g_more != g_less and not closure[g_less, g_more]:
+            closure[g_less, g_more] = True
+            more_important_of[g_less].append(g_more)
+
+    # Строки замыкания объединяются в топологическом порядке (сначала более важные группы):
+    # число операций пропорционально числу прямых отношений, а не кубу числа групп
+    less_important_of: List[List[int]] = [[] for _ in range(num_groups)]
+    for g_less, targets in enumerate(more_important_of):
+        for g_more in targets:
+            less_important_of[g_more].append(g_less)
+    ready = [group for group in range(num_groups) if not more_important_of[group]]
+    remaining = np.array([len(targets) for targets in more_important_of], dtype=np.int64)
+    order = []
+    while ready:
+        group = ready.pop()
+        order.append(group)
+        for g_less in less_important_of[group]:
+            remaining[g_less] -= 1
+            if remaining[g_less] == 0:
+                ready.append(g_less)
+    if len(order) < num_groups:
+        # Отношение содержит цикл: замыкание по алгоритму Уоршелла
+        for k in range(num_groups):
+            closure |= closure[:, k:k + 1] & closure[k:k + 1, :]
+        return closure
+    for group in order:
+        for g_more in more_important_of[group]:
+            closure[group] |= closure[g_more]
+    return closure
+
+
+def preference_structure(criterion_names: Sequence[str],
+                         preference_pairs: Sequence[Tuple[str, str, bool]]) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Строит группы эквивалентных критериев и замыкание отношения важности групп.
+    Выбрасывает ValueError, если в предпочтениях есть неизвестный критерий или цикл.
+
+    Параметры:
+    - criterion_names: имена критериев.
+    - preference_pairs: тройки (критерий1, критерий2, эквивалентны ли).
+
+    Возвращает:
+    - Номер группы для каждого критерия и замыкание (см. importance_closure).
+    """
+    positions = {name: idx for idx, name in enumerate(criterion_names)}
+    for name1, name2, _ in preference_pairs:
+        for name in (name1, name2):
+            if name not in positions:
+                raise ValueError(f"Критерий '{name}' из предпочтений отсутствует в списке критериев")
+    check_preference_cycles(criterion_names, preference_pairs)
+    group_of = equivalent_group_of(
+        len(criterion_names),
+        [(positions[name1], positions[name2]) for name1, name2, equivalent in preference_pairs if equivalent],
+    )
+    strict_pairs = [(positions[name1], positions[name2]) for name1, name2, equivalent in preference_pairs
+                    if not equivalent]
+    num_groups = int(group_of.max()) + 1 if len(group_of) else 0
+    return group_of, importance_closure(group_of, num_groups, strict_pairs)
+
+
+def group_sums(matrix: np.ndarray, group_of: np.ndarray, num_groups: int, groups: Sequence[int] = None) -> np.ndarray:
+    """
+    Вычисляет суммы нормализованных значений по группам эквивалентных критериев.
+
+    Параметры:
+    - groups: номера групп, суммы которых нужны (по умолчанию все). Сумма группы
+      вычисляется одинаково при любом наборе групп, поэтому отдельные столбцы можно
+      пересчитывать без пересчета остальных.
+    """
+    groups = np.arange(num_groups) if groups is None else np.asarray(groups, dtype=np.int64)
+    sums = np.zeros((matrix.shape[0], len(groups)))
+    # Столбцы групп собираются подряд (по возрастанию номера группы, внутри группы — в порядке
+    # критериев), и суммы всех групп вычисляются одним проходом np.add.reduceat
+    selected = np.isin(group_of, groups)
+    columns = np.flatnonzero(selected)[np.argsort(group_of[selected], kind="stable")]
+    if len(columns) and matrix.shape[0]:
+        present, starts = np.unique(group_of[columns], return_index=True)
+        reduced = np.add.reduceat(matrix[:, columns], starts, axis=1)
+        order = np.argsort(groups, kind="stable")
+        sums[:, order[np.searchsorted(groups, present, sorter=order)]] = reduced
+    return np.round(sums, _DECIMALS)
+
+
+def is_order_preserving(old: np.ndarray, new: np.ndarray) -> bool:
+    """
+    Проверяет, что new получен из old строго возрастающим преобразованием (например,
+    аффинным с положительным коэффициентом): равные значения остаются равными, а
+    порядок различных значений сохраняется. Такое преобразование столбца не меняет
+    отношения доминирования между строками.
+    """
+    order = np.argsort(old, kind="stable")
+    old_steps = np.diff(old[order])
+    new_steps = np.diff(new[order])
+    return bool(np.all((old_steps > 0) == (new_steps > 0)) and np.all(new_steps >= 0))
+
+
+def transfer_order(closure: np.ndarray) -> np.ndarray:
+    """
+    Порядок обхода групп при переносе: от групп с наибольшим числом более важных групп
+    к группам, важнее которых нет.
+    """
+    return np.argsort(-closure.sum(axis=1), kind="stable")
+
+
+def _chain_direction(closure: np.ndarray) -> int:
+    """
+    Проверяет, является ли отношение важности цепочкой в порядке номеров групп.
+
+    Возвращает:
+    - 1, если важнее группы g все группы h < g; -1, если все группы h > g; иначе 0.
+    """
+    if closure.shape[0] < 2:
+        return 0
+    numbers = np.arange(closure.shape[0])
+    for direction, ordered in ((1, closure), (-1, closure[::-1, ::-1])):
+        # В строке g ровно g отмеченных групп, и первая неотмеченная — сама g
+        if np.array_equal(ordered.sum(axis=1), numbers) and np.array_equal(np.argmin(ordered, axis=1), numbers):
+            return direction
+    return 0
+
+
+def _chain_transfer_mask(z_sums: np.ndarray, w_sums: np.ndarray, alive: np.ndarray, direction: int) -> np.ndarray:
+    """
+    Перенос избытка для цепочки групп (см. _chain_direction) без обхода групп-получателей.
+
+    Группы обходятся от наименее важной, а получатели — по возрастанию номера. Если номера
+    идут от самой важной группы (direction = 1), заполненные емкости образуют начало
+    цепочки, и избыток группы g удается перенести, если суммарный избыток групп не важнее g
+    не превышает суммарную емкость групп важнее g. Иначе (direction = -1) первыми
+    заполняются ближайшие более важные группы, и условие для g — суммарный избыток групп
+    не менее важных, чем g, не больше емкости групп важнее g. Результат совпадает с общим
+    алгоритмом, а число операций пропорционально числу групп, а не его квадрату.
+    """
+    result = np.zeros(len(w_sums), dtype=bool)
+    rows = np.flatnonzero(alive)
+    # Столбцы по убыванию важности групп
+    difference = (w_sums[rows] - z_sums[rows])[:, ::direction]
+    excess = np.maximum(difference, 0)
+    capacity = np.maximum(-difference, 0)
+    if direction == 1:
+        excess_total = np.cumsum(excess[:, ::-1], axis=1)[:, ::-1]
+    else:
+        excess_total = np.cumsum(excess, axis=1)
+    capacity_before = np.cumsum(capacity, axis=1) - capacity
+    moved = np.all((excess <= 0) | (np.round(excess_total - capacity_before, _DECIMALS) <= 0), axis=1)
+    result[rows] = moved & np.any(excess > 0, axis=1)
+    return result
+
+
+def t_dominated_mask(z_sums: np.ndarray, w_sums: np.ndarray, closure: np.ndarray,
+                     order: np.ndarray = None) -> np.ndarray:
+    """
+    Проверяет t-доминирование альтернативы Z над каждой из альтернатив W.
+
+    Параметры:
+    - z_sums: групповые суммы альтернативы Z либо матрица сумм по строке на каждую
+      альтернативу W (тогда проверяются пары из соответствующих строк).
+    - w_sums: матрица групповых сумм альтернатив W (по строке на альтернативу).
+    - closure: транзитивное замыкание отношения важности групп.
+    - order: порядок обхода групп (по умолчанию transfer_order(closure)).
+
+    Возвращает:
+    - Булев массив, True для альтернатив W, над которыми Z доминирует в t-упорядочении.
+    """
+    if order is None:
+        order = transfer_order(closure)
+    z_sums = np.broadcast_to(z_sums, w_sums.shape)
+    # Проверка доминирования по групповым суммам (WE)
+    result = np.all(z_sums >= w_sums, axis=1) & np.any(z_sums > w_sums, axis=1)
+
+    # Перенос избытка W из менее важных групп в более важные (WI)
+    w_adjusted = w_sums.copy()
+    alive = ~result
+    transferred = np.zeros(len(w_sums), dtype=bool)
+    # Перенос заполняет более важные группы не выше сумм Z, поэтому избыток может
+    # возникнуть только в группах, где он есть изначально; остальные группы пропускаются.
+    # Избыток в группе, важнее которой нет, перенести некуда: такие альтернативы W
+    # исключаются сразу для всех этих групп
+    has_targets = closure.any(axis=1)
+    alive &= ~np.any(w_sums[:, ~has_targets] > z_sums[:, ~has_targets], axis=1)
+    direction = _chain_direction(closure)
+    if direction:
+        return result | _chain_transfer_mask(z_sums, w_sums, alive, direction)
+    excess = np.any(w_sums[alive] > z_sums[alive], axis=0) & has_targets
+    for group in order[excess[order]]:
+        need = alive & (w_adjusted[:, group] > z_sums[:, group])
+        if not need.any():
+            continue
+        targets = np.flatnonzero(closure[group])
+        if len(targets) == 0:
+            # Нет более важных групп, в которые можно перенести избыток
+            alive &= ~need
+            continue
+        remaining = np.round(w_adjusted[:, group] - z_sums[:, group], _DECIMALS)
+        w_adjusted[need, group] = z_sums[need, group]
+        active = need.copy()
+        for more_important in targets:
+            capacity = np.round(z_sums[:, more_important] - w_adjusted[:, more_important], _DECIMALS)
+            move = active & (capacity > 0)
+            if not move.any():
+                continue
+            amount = np.minimum(remaining[move], capacity[move])
+            w_adjusted[move, more_important] = np.round(w_adjusted[move, more_important] + amount, _DECIMALS)
+            remaining[move] = np.round(remaining[move] - amount, _DECIMALS)
+            done = move & (remaining <= 0)
+            transferred |= done
+            active &= ~done
+            if not active.any():
+                break
+        # Избыток не удалось перенести полностью
+        alive &= ~(need & (remaining > 0))
+
+    return result | (alive & transferred & np.all(z_sums >= w_adjusted, axis=1))
+
+
+def t_ordering_mask(sums: np.ndarray, closure: np.ndarray, row_order: np.ndarray = None,
+                    backend=None) -> np.ndarray:
+    """
+    Применяет t-упорядочение к множеству альтернатив, заданных групповыми суммами.
+
+    Параметры:
+    - row_order: порядок просмотра альтернатив (по умолчанию порядок строк). Просмотр по
+      убыванию взвешенной суммы (score_order) раньше исключает доминируемые альтернативы.
+    - backend: набор ядер доминирования (см. backends.get_backend).
+
+    Возвращает:
+    - Булев массив, True для альтернатив, оставшихся после t-упорядочения.
+    """
+    t_dominated = _kernels(backend).t_dominated_mask
+    order = transfer_order(closure)
+    removed = np.zeros(len(sums), dtype=bool)
+    for i in (range(len(sums)) if row_order is None else row_order):
+        if removed[i]:
+            continue
+        candidates = np.flatnonzero(~removed)
+        candidates = candidates[candidates != i]
+        if len(candidates) == 0:
+            continue
+        removed[candidates[t_dominated(sums[i], sums[candidates], closure, order)]] = True
+    return ~removed
+
+
+def preference_weights(group_of: np.ndarray, closure: np.ndarray) -> np.ndarray:
+    """
+    Выводит веса критериев из структуры предпочтений: критерии одной группы получают
+    равные веса, а вес группы равен 1 + числу групп, менее важных, чем она. Поэтому
+    более важная группа всегда весит больше, и альтернатива, доминирующая в
+    t-упорядочении, получает большую взвешенную сумму.
+
+    Возвращает:
+    - Веса критериев (сумма равна 1).
+    """
+    # closure[g, h] = True, если группа h важнее группы g
+    group_weights = 1.0 + closure.sum(axis=0)
+    weights = group_weights[group_of]
+    return weights / weights.sum()
+
+
+def resolve_weights(criterion_names: Sequence[str], weights) -> np.ndarray:
+    """
+    Приводит веса к массиву в порядке критериев, нормированному к сумме 1.
+
+    Параметры:
+    - weights: словарь {имя критерия: вес} (отсутствующие критерии получают вес 0)
+      или последовательность весов в порядке критериев.
+    """
+    if isinstance(weights, Mapping):
+        unknown = set(weights) - set(criterion_names)
+        if unknown:
+            raise ValueError(f"Критерии {sorted(unknown)} отсутствуют в списке критериев")
+        weights = [weights.get(name, 0.0) for name in criterion_names]
+    weights = np.asarray(weights, dtype=float)
+    if weights.shape != (len(criterion_names),) or np.any(weights < 0) or not weights.sum() > 0:
+        raise ValueError("Веса критериев должны быть неотрицательными, не все нулевыми, по одному на критерий")
+    return weights / weights.sum()
+
+
+def normalize_row(values, criteria: Sequence) -> np.ndarray:
+    """
+    Проверяет и нормализует значения одной альтернативы.
+
+    Параметры:
+    - values: словарь {имя критерия: исходное значение}.
+    - criteria: критерии в порядке столбцов.
+    """
+    row = np.empty(len(criteria))
+    for position, criterion in enumerate(criteria):
+        if criterion.name not in values:
+            raise ValueError(f"Критерий '{criterion.name}' отсутствует в значениях альтернативы")
+        column = np.asarray([values[criterion.name]])
+        validate_column(column, criterion)
+        row[position] = normalize_column(column, criterion)[0]
+    return row
+
+
+def weighted_scores(matrix: np.ndarray, weights: np.ndarray) -> np.ndarray:
+    """
+    Вычисляет взвешенные суммы нормализованных значений (одно умножение матрицы на вектор).
+    """
+    return np.asarray(matrix, dtype=float) @ np.asarray(weights, dtype=float)
+
+
+def top_k(scores: np.ndarray, k: int) -> np.ndarray:
+    """
+    Возвращает номера k строк с наибольшими значениями scores по убыванию (при равенстве —
+    по возрастанию номера). Выбор выполняется частичным разбиением, полностью
+    сортируются только k отобранных значений.
+    """
+    k = min(max(k, 0), len(scores))
+    if k == 0:
+        return np.empty(0, dtype=np.int64)
+    if k < len(scores):
+        threshold = np.partition(scores, len(scores) - k)[len(scores) - k]
+        # Все строки со значением выше порога и первые по номеру строки, равные порогу
+        above = np.flatnonzero(scores > threshold)
+        tied = np.flatnonzero(scores == threshold)[:k - len(above)]
+        selected = np.concatenate([above, tied])
+    else:
+        selected = np.arange(len(scores))
+    return selected[np.lexsort((selected, -scores[selected]))]
+
+
+def score_order(scores: np.ndarray) -> np.ndarray:
+    """
+    Порядок строк по убыванию scores (при равенстве — по возрастанию номера).
+    """
+    return np.argsort(-scores, kind="stable")
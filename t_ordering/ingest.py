@@ -0,0 +1,161 @@
+"""
+Приведение входных данных об альтернативах к набору столбцов NumPy.
+
+Поддерживаются pandas.DataFrame, pyarrow.Table, polars.DataFrame и словари столбцов.
+Библиотеки не импортируются этим модулем: таблица распознается, только если
+соответствующая библиотека уже загружена вызывающим кодом.
+"""
+import sys
+from typing import Dict, Mapping, Tuple
+
+import numpy as np
+
+
+class DictionaryColumn:
+    """
+    Столбец со словарным кодированием: массив номеров и словарь значений.
+
+    Используется для порядковых критериев, чтобы сопоставлять допустимым значениям
+    только элементы словаря, а не каждое значение столбца.
+    """
+
+    dtype = np.dtype(object)
+
+    def __init__(self, indices: np.ndarray, dictionary: np.ndarray):
+        """
+        Параметры:
+        - indices: номера значений в словаре; -1 означает пропущенное значение.
+        - dictionary: массив значений словаря.
+        """
+        self.indices = indices
+        self.dictionary = dictionary
+
+    def __len__(self):
+        return len(self.indices)
+
+    def __getitem__(self, key):
+        return np.array(
+            [self.dictionary[idx] if idx >= 0 else None for idx in np.atleast_1d(self.indices[key])], dtype=object
+        )
+
+    def __array__(self, dtype=None, copy=None):
+        return self[:].astype(dtype) if dtype is not None else self[:]
+
+
+def _loaded_type(module_name: str, type_name: str):
+    module = sys.modules.get(module_name)
+    return getattr(module, type_name) if module is not None else None
+
+
+def is_pandas_frame(obj) -> bool:
+    """
+    Проверяет, является ли объект pandas.DataFrame, не импортируя pandas.
+    """
+    frame_type = _loaded_type("pandas", "DataFrame")
+    return frame_type is not None and isinstance(obj, frame_type)
+
+
+def _is_arrow_table(obj) -> bool:
+    table_types = tuple(
+        t for t in (_loaded_type("pyarrow", "Table"), _loaded_type("pyarrow", "RecordBatch")) if t is not None
+    )
+    return bool(table_types) and isinstance(obj, table_types)
+
+
+def _is_polars_frame(obj) -> bool:
+    frame_type = _loaded_type("polars", "DataFrame")
+    return frame_type is not None and isinstance(obj, frame_type)
+
+
+def _pandas_column(series):
+    """
+    Извлекает столбец pandas; категориальные столбцы передаются кодами и словарем категорий.
+    """
+    if getattr(series.dtype, "name", None) == "category":
+        return DictionaryColumn(series.cat.codes.to_numpy(dtype=np.int64), series.cat.categories.to_numpy())
+    return series.to_numpy()
+
+
+def _arrow_column(column):
+    """
+    Извлекает столбец Arrow без поэлементного преобразования в объекты Python.
+
+    Числовые столбцы из одного фрагмента без пропусков возвращаются представлениями
+    буферов Arrow (без копирования). Строковые и словарные столбцы возвращаются как
+    DictionaryColumn.
+    """
+    import pyarrow as pa
+    import pyarrow.compute as pc
+
+    if isinstance(column, pa.Array):
+        column = pa.chunked_array([column])
+    if pa.types.is_string(column.type) or pa.types.is_large_string(column.type) or \
+            getattr(pa.types, "is_string_view", lambda t: False)(column.type):
+        column = pc.dictionary_encode(column)
+    if pa.types.is_dictionary(column.type):
+        column = column.unify_dictionaries()
+        if column.num_chunks == 0:
+            return DictionaryColumn(np.empty(0, dtype=np.int64), np.empty(0, dtype=object))
+        dictionary = column.chunk(0).dictionary.to_numpy(zero_copy_only=False)
+        indices = [
+            chunk.indices.cast(pa.int64()).fill_null(-1).to_numpy(zero_copy_only=False) for chunk in column.chunks
+        ]
+        return DictionaryColumn(np.concatenate(indices), dictionary)
+    if column.num_chunks == 1 and column.null_count == 0:
+        return column.chunk(0).to_numpy(zero_copy_only=False)
+    return column.to_numpy()
+
+
+def _read_arrow(table, index=None) -> Tuple[np.ndarray, Dict[str, np.ndarray]]:
+    columns = {name: _arrow_column(table.column(name)) for name in table.column_names}
+    if isinstance(index, str) and index in columns:
+        labels = columns.pop(index)
+        if isinstance(labels, DictionaryColumn):
+            labels = labels[:]
+    elif index is not None:
+        labels = np.asarray(index)
+    else:
+        labels = np.arange(table.num_rows)
+    return labels, columns
+
+
+def read_alternatives(alternatives, index=None) -> Tuple[np.ndarray, Dict[str, np.ndarray]]:
+    """
+    Извлекает метки и столбцы альтернатив.
+
+    Параметры:
+    - alternatives: pandas.DataFrame, pyarrow.Table, polars.DataFrame или словарь
+      {имя столбца: последовательность значений}.
+    - index: для таблиц Arrow, Polars и словаря — имя столбца с метками альтернатив или
+      последовательность меток. По умолчанию метками служат номера строк.
+
+    Возвращает:
+    - Массив меток альтернатив и словарь столбцов NumPy.
+    """
+    if is_pandas_frame(alternatives):
+        labels = alternatives.index.to_numpy()
+        columns = {name: _pandas_column(alternatives[name]) for name in alternatives.columns}
+        return labels, columns
+    if _is_polars_frame(alternatives):
+        # Преобразование Polars в Arrow не копирует буферы столбцов
+        return _read_arrow(alternatives.to_arrow(), index)
+    if _is_arrow_table(alternatives):
+        return _read_arrow(alternatives, index)
+
+    if not isinstance(alternatives, Mapping):
+        raise ValueError(
+            f"Альтернативы должны быть заданы таблицей (pandas, Arrow, Polars) или словарем столбцов, получено: {type(alternatives).__name__}"
+        )
+    columns = {name: np.asarray(values) for name, values in alternatives.items()}
+    if isinstance(index, str) and index in columns:
+        labels = columns.pop(index)
+    elif index is not None:
+        labels = np.asarray(index)
+    else:
+        num_rows = len(next(iter(columns.values()))) if columns else 0
+        labels = np.arange(num_rows)
+
+    lengths = {len(values) for values in columns.values()} | {len(labels)}
+    if len(lengths) > 1:
+        raise ValueError("Столбцы альтернатив и метки имеют разную длину")
+    return labels, columns
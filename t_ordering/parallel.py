@@ -0,0 +1,104 @@
+"""
+Параллельный поиск множества Парето методом «разделяй и властвуй».
+
+Множество Парето объединения совпадает с множеством Парето объединения локальных
+множеств Парето его частей. Нормализованная матрица помещается в разделяемую память
+(multiprocessing.shared_memory), рабочие процессы находят локальные множества Парето
+своих диапазонов строк без копирования данных, после чего результаты объединяются
+одной финальной редукцией либо попарно, деревом.
+"""
+import os
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+from typing import List, Optional
+
+import numpy as np
+
+from t_ordering import core
+
+# Матрица в разделяемой памяти, к которой подключен рабочий процесс
+_worker_state = {}
+
+
+def _attach(name: str, shape, dtype: str):
+    """
+    Подключает рабочий процесс к матрице в разделяемой памяти.
+    """
+    block = shared_memory.SharedMemory(name=name)
+    _worker_state["block"] = block
+    _worker_state["matrix"] = np.ndarray(shape, dtype=np.dtype(dtype), buffer=block.buf)
+
+
+def _local_front(start: int, stop: int) -> np.ndarray:
+    """
+    Находит локальное множество Парето строк [start, stop).
+
+    Возвращает:
+    - Номера строк множества Парето во всей матрице.
+    """
+    matrix = _worker_state["matrix"]
+    return start + np.flatnonzero(core.pareto_front_mask(matrix[start:stop]))
+
+
+def _merge_fronts(*fronts: np.ndarray) -> np.ndarray:
+    """
+    Объединяет несколько множеств Парето, заданных номерами строк, в одно.
+    """
+    matrix = _worker_state["matrix"]
+    indices = np.sort(np.concatenate(fronts))
+    return indices[core.pareto_front_mask(matrix[indices])]
+
+
+def _partition(num_rows: int, partitions: int) -> List[range]:
+    bounds = np.linspace(0, num_rows, partitions + 1).astype(int)
+    return [range(bounds[i], bounds[i + 1]) for i in range(partitions) if bounds[i] < bounds[i + 1]]
+
+
+def parallel_pareto_front_mask(matrix: np.ndarray, workers: Optional[int] = None,
+                               partitions: Optional[int] = None, tree_merge: bool = False) -> np.ndarray:
+    """
+    Находит множество Парето матрицы в нескольких процессах.
+
+    Параметры:
+    - matrix: нормализованная матрица (альтернативы x критерии).
+    - workers: число рабочих процессов (по умолчанию число ядер).
+    - partitions: число частей, на которые делятся строки (по умолчанию workers).
+    - tree_merge: объединять локальные множества попарно, деревом, вместо одной финальной редукции.
+
+    Возвращает:
+    - Булев массив, совпадающий с core.pareto_front_mask(matrix).
+    """
+    workers = workers or os.cpu_count() or 1
+    partitions = partitions or workers
+    matrix = np.ascontiguousarray(matrix, dtype=float)
+    mask = np.zeros(matrix.shape[0], dtype=bool)
+    if matrix.shape[0] == 0:
+        return mask
+
+    block = shared_memory.SharedMemory(create=True, size=max(matrix.nbytes, 1))
+    try:
+        shared = np.ndarray(matrix.shape, dtype=matrix.dtype, buffer=block.buf)
+        shared[:] = matrix
+        with ProcessPoolExecutor(
+            max_workers=workers,
+            initializer=_attach,
+            initargs=(block.name, matrix.shape, matrix.dtype.str),
+        ) as executor:
+            ranges = _partition(matrix.shape[0], partitions)
+            fronts = list(executor.map(_local_front, [r.start for r in ranges], [r.stop for r in ranges]))
+            if tree_merge:
+                while len(fronts) > 1:
+                    left, right = fronts[0::2], fronts[1::2]
+                    # Нечетная часть без пары переходит на следующий уровень дерева как есть
+                    fronts = list(executor.map(_merge_fronts, left[:len(right)], right)) + left[len(right):]
+                indices = fronts[0]
+            else:
+                indices = np.sort(np.concatenate(fronts))
+                indices = indices[core.pareto_front_mask(matrix[indices])]
+        del shared
+    finally:
+        block.close()
+        block.unlink()
+
+    mask[indices] = True
+    return mask
@@ -0,0 +1,197 @@
+"""
+Анализ устойчивости t-упорядочения к изменению предпочтений.
+
+Варианты предпочтений получаются из исходных заменой строгого предпочтения на
+эквивалентность (и наоборот) или удалением предпочтения. Для каждого варианта
+строятся группы и замыкание отношения важности; варианты с совпадающими группами
+и замыканием дают одинаковый результат и вычисляются один раз. Нормализованные
+значения множества Парето от предпочтений не зависят и используются всеми вариантами.
+"""
+import itertools
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from t_ordering import core
+
+# Изменения одного предпочтения
+KEEP, FLIP, DROP = "keep", "flip", "drop"
+
+# Значения множества Парето, с которыми работает рабочий процесс
+_worker_state = {}
+
+
+def enumerate_variants(num_preferences: int, changes: Sequence[str] = (FLIP, DROP),
+                       max_changes: int = 1) -> List[Tuple[str, ...]]:
+    """
+    Перечисляет варианты, в которых изменено не более max_changes предпочтений.
+
+    Возвращает:
+    - Список вариантов: кортежи изменений (KEEP, FLIP или DROP) по одному на предпочтение.
+      Первый вариант — исходные предпочтения.
+    """
+    variants = []
+    for count in range(min(max_changes, num_preferences) + 1):
+        for changed in itertools.combinations(range(num_preferences), count):
+            for kinds in itertools.product(changes, repeat=count):
+                variant = [KEEP] * num_preferences
+                for position, kind in zip(changed, kinds):
+                    variant[position] = kind
+                variants.append(tuple(variant))
+    return variants
+
+
+def sample_variants(num_preferences: int, samples: int, changes: Sequence[str] = (FLIP, DROP),
+                    change_probability: float = None, seed=None) -> List[Tuple[str, ...]]:
+    """
+    Случайно выбирает варианты: каждое предпочтение независимо изменяется с вероятностью
+    change_probability (по умолчанию 1 / число предпочтений) одним из изменений changes.
+    """
+    rng = np.random.default_rng(seed)
+    if change_probability is None:
+        change_probability = 1.0 / max(num_preferences, 1)
+    changed = rng.random((samples, num_preferences)) < change_probability
+    kinds = rng.integers(0, len(changes), (samples, num_preferences))
+    return [
+        tuple(changes[kind] if flag else KEEP for flag, kind in zip(changed_row, kinds_row))
+        for changed_row, kinds_row in zip(changed, kinds)
+    ]
+
+
+def apply_variant(preference_pairs: Sequence[Tuple[str, str, bool]],
+                  variant: Sequence[str]) -> List[Tuple[str, str, bool]]:
+    """
+    Применяет вариант к тройкам (критерий1, критерий2, эквивалентны ли).
+    """
+    pairs = []
+    for (name1, name2, equivalent), kind in zip(preference_pairs, variant):
+        if kind == FLIP:
+            pairs.append((name1, name2, not equivalent))
+        elif kind == KEEP:
+            pairs.append((name1, name2, equivalent))
+        elif kind != DROP:
+            raise ValueError(f"Неизвестное изменение предпочтения: '{kind}'")
+    return pairs
+
+
+def _attach(front: np.ndarray):
+    _worker_state["front"] = front
+
+
+def _survivors(group_of: np.ndarray, closure: np.ndarray) -> np.ndarray:
+    """
+    Возвращает маску альтернатив множества Парето, оставшихся после t-упорядочения.
+    """
+    sums = core.group_sums(_worker_state["front"], group_of, closure.shape[0])
+    representatives, classes = core.row_classes(sums)
+    return core.t_ordering_mask(sums[representatives], closure)[classes]
+
+
+def _survivors_batch(structures) -> List[np.ndarray]:
+    return [_survivors(group_of, closure) for group_of, closure in structures]
+
+
+class RobustnessReport:
+    def __init__(self, labels: np.ndarray, survival: np.ndarray, num_variants: int, num_unique: int,
+                 num_invalid: int, baseline: np.ndarray):
+        """
+        Результат анализа устойчивости.
+
+        Параметры:
+        - labels: метки альтернатив множества Парето.
+        - survival: доля допустимых вариантов, в которых альтернатива осталась после t-упорядочения.
+        - num_variants: число допустимых (без циклов) вариантов.
+        - num_unique: число различных вариантов (по группам и замыканию), вычисленных отдельно.
+        - num_invalid: число вариантов с циклами в предпочтениях (не учитываются).
+        - baseline: маска альтернатив, оставшихся при исходных предпочтениях.
+        """
+        self.labels = labels
+        self.survival = survival
+        self.num_variants = num_variants
+        self.num_unique = num_unique
+        self.num_invalid = num_invalid
+        self.baseline = baseline
+
+    def as_dict(self) -> Dict:
+        """
+        Возвращает словарь {метка альтернативы: доля вариантов, в которых она осталась}.
+        """
+        return dict(zip(self.labels.tolist(), self.survival.tolist()))
+
+    def most_stable(self, k: int = None) -> np.ndarray:
+        """
+        Метки альтернатив по убыванию доли вариантов, в которых они остались (k первых).
+        """
+        order = np.argsort(-self.survival, kind="stable")
+        return self.labels[order[:k]]
+
+    def __str__(self):
+        """
+        Возвращает строковое представление объекта RobustnessReport.
+        """
+        lines = [f"Вариантов предпочтений: {self.num_variants} (различных: {self.num_unique}, "
+                 f"с циклами: {self.num_invalid})"]
+        for position in np.argsort(-self.survival, kind="stable"):
+            mark = "*" if self.baseline[position] else " "
+            lines.append(f"{mark} {self.labels[position]}: {self.survival[position]:.3f}")
+        return "\n".join(lines)
+
+
+def preference_robustness(front: np.ndarray, labels: np.ndarray, criterion_names: Sequence[str],
+                          preference_pairs: Sequence[Tuple[str, str, bool]],
+                          variants: Sequence[Sequence[str]], workers: Optional[int] = None,
+                          batch_size: int = 64) -> RobustnessReport:
+    """
+    Вычисляет, как часто альтернативы множества Парето остаются после t-упорядочения
+    при вариантах предпочтений.
+
+    Параметры:
+    - front: нормализованные значения альтернатив множества Парето.
+    - labels: метки этих альтернатив.
+    - criterion_names: имена критериев в порядке столбцов front.
+    - preference_pairs: исходные тройки (критерий1, критерий2, эквивалентны ли).
+    - variants: варианты (см. enumerate_variants, sample_variants).
+    - workers: число процессов; по умолчанию варианты вычисляются в текущем процессе.
+    - batch_size: число вариантов в одном задании рабочего процесса.
+
+    Возвращает:
+    - Объект RobustnessReport.
+    """
+    baseline = core.preference_structure(criterion_names, preference_pairs)
+    # Группы нумеруются по первому критерию, поэтому совпадение ключей означает
+    # совпадение групп и отношения важности
+    baseline_key = (tuple(baseline[0].tolist()), baseline[1].tobytes())
+    structures: Dict[Tuple, Tuple[np.ndarray, np.ndarray]] = {baseline_key: baseline}
+    multiplicity: Dict[Tuple, int] = {}
+    num_invalid = 0
+    for variant in variants:
+        try:
+            group_of, closure = core.preference_structure(criterion_names, apply_variant(preference_pairs, variant))
+        except ValueError:
+            num_invalid += 1
+            continue
+        key = (tuple(group_of.tolist()), closure.tobytes())
+        structures.setdefault(key, (group_of, closure))
+        multiplicity[key] = multiplicity.get(key, 0) + 1
+
+    keys = list(structures)
+    front = np.ascontiguousarray(front, dtype=float)
+    if workers is not None and workers > 1:
+        batches = [keys[start:start + batch_size] for start in range(0, len(keys), batch_size)]
+        with ProcessPoolExecutor(max_workers=workers, initializer=_attach, initargs=(front,)) as executor:
+            results = executor.map(_survivors_batch, [[structures[key] for key in batch] for batch in batches])
+            masks = [mask for batch in results for mask in batch]
+    else:
+        _attach(front)
+        masks = _survivors_batch([structures[key] for key in keys])
+        _worker_state.clear()
+    survivors = dict(zip(keys, masks))
+
+    counts = np.zeros(len(front), dtype=np.int64)
+    for key, count in multiplicity.items():
+        counts += count * survivors[key]
+    num_variants = sum(multiplicity.values())
+    survival = counts / num_variants if num_variants else survivors[baseline_key].astype(float)
+    return RobustnessReport(np.asarray(labels), survival, num_variants, len(multiplicity), num_invalid,
+                            survivors[baseline_key])
@@ -0,0 +1,213 @@
+"""
+Множество Парето и t-упорядочение отдельно в каждом сегменте набора альтернатив
+(категории, региона, продавца) за один проход по всем сегментам.
+
+Нормализация, группы и замыкание отношения важности вычисляются один раз для всего
+набора. Строки упорядочиваются по сегментам; для небольших сегментов попарные сравнения
+всех сегментов выполняются одними операциями над массивами пар строк, а t-упорядочение
+на шаге r сравнивает r-ю строку каждого сегмента со строками ее сегмента, так что
+число вызовов ядра равно размеру наибольшего сегмента, а не числу сегментов.
+"""
+from typing import Dict, Hashable, Tuple
+
+import numpy as np
+
+from t_ordering import core
+from t_ordering.ingest import DictionaryColumn
+
+# Сегменты не больше этого размера обрабатываются попарными сравнениями вместе с другими,
+# для больших используется core.pareto_front_mask
+_SMALL_SEGMENT = 256
+
+
+def segment_codes(values) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Кодирует значения столбца сегментов номерами сегментов.
+
+    Возвращает:
+    - Массив значений сегментов (ключей) и номер сегмента для каждой строки.
+    """
+    if isinstance(values, DictionaryColumn):
+        used, codes = np.unique(values.indices, return_inverse=True)
+        keys = np.empty(len(used), dtype=object)
+        keys[:] = [values.dictionary[idx] if idx >= 0 else None for idx in used.tolist()]
+        return keys, codes.reshape(-1)
+    values = np.asarray(values)
+    try:
+        keys, codes = np.unique(values, return_inverse=True)
+        return keys, codes.reshape(-1)
+    except TypeError:
+        # Несравнимые значения (например, строки и None): ключи в порядке первого появления
+        numbers: Dict[Hashable, int] = {}
+        codes = np.fromiter((numbers.setdefault(value, len(numbers)) for value in values.tolist()),
+                            dtype=np.int64, count=len(values))
+        keys = np.empty(len(numbers), dtype=object)
+        keys[:] = list(numbers)
+        return keys, codes
+
+
+def _segment_layout(codes: np.ndarray, num_segments: int) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    # Строки по сегментам (внутри сегмента — по возрастанию номера), начало и размер каждого сегмента
+    order = np.argsort(codes, kind="stable")
+    sizes = np.bincount(codes, minlength=num_segments)
+    starts = np.concatenate([[0], np.cumsum(sizes)[:-1]]).astype(np.int64)
+    return order, starts, sizes
+
+
+def _segment_pairs(order: np.ndarray, starts: np.ndarray, sizes: np.ndarray, segments: np.ndarray,
+                   row: np.ndarray = None) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Пары строк (первая, вторая) внутри каждого из сегментов segments: все пары, либо,
+    если задан row, пары (row-я строка сегмента, любая строка сегмента).
+    """
+    counts = sizes[segments] if row is not None else sizes[segments] ** 2
+    total = int(counts.sum())
+    segment_of_pair = np.repeat(np.arange(len(segments)), counts)
+    offset = np.arange(total) - np.repeat(np.cumsum(counts) - counts, counts)
+    begin = starts[segments][segment_of_pair]
+    if row is not None:
+        return order[begin + row], order[begin + offset]
+    size = sizes[segments][segment_of_pair]
+    return order[begin + offset // size], order[begin + offset % size]
+
+
+def segmented_pareto_mask(matrix: np.ndarray, codes: np.ndarray, num_segments: int, backend=None) -> np.ndarray:
+    """
+    Находит множество Парето каждого сегмента.
+
+    Параметры:
+    - matrix: нормализованная матрица (альтернативы x критерии).
+    - codes: номер сегмента каждой строки (см. segment_codes).
+    - backend: набор ядер для больших сегментов (см. backends.get_backend).
+
+    Возвращает:
+    - Булев массив, True для строк, недоминируемых в своем сегменте.
+    """
+    mask = np.ones(matrix.shape[0], dtype=bool)
+    order, starts, sizes = _segment_layout(codes, num_segments)
+    for segment in np.flatnonzero(sizes > _SMALL_SEGMENT):
+        rows = order[starts[segment]:starts[segment] + sizes[segment]]
+        mask[rows] = core.pareto_front_mask(matrix[rows], backend=backend)
+
+    # Небольшие сегменты: все пары строк внутри сегментов, порциями ограниченного размера
+    small = np.flatnonzero((sizes > 1) & (sizes <= _SMALL_SEGMENT))
+    budget = max(1, core._BLOCK_ELEMENTS // max(matrix.shape[1], 1))
+    cumulative = np.cumsum(sizes[small] ** 2)
+    begin = 0
+    while begin < len(small):
+        before = cumulative[begin - 1] if begin else 0
+        end = max(begin + 1, int(np.searchsorted(cumulative, before + budget, side="right")))
+        first, second = _segment_pairs(order, starts, sizes, small[begin:end])
+        not_worse = np.ones(len(first), dtype=bool)
+        better = np.zeros(len(first), dtype=bool)
+        for k in range(matrix.shape[1]):
+            not_worse &= matrix[first, k] >= matrix[second, k]
+            better |= matrix[first, k] > matrix[second, k]
+        mask[second[not_worse & better]] = False
+        begin = end
+    return mask
+
+
+def segmented_t_ordering_mask(sums: np.ndarray, codes: np.ndarray, closure: np.ndarray, backend=None) -> np.ndarray:
+    """
+    Применяет t-упорядочение отдельно к альтернативам каждого сегмента.
+
+    Результат для каждого сегмента совпадает с core.t_ordering_mask, примененным к
+    строкам этого сегмента: строки сегмента просматриваются в том же порядке, а на шаге r
+    r-я строка всех сегментов одновременно сравнивается с оставшимися строками своего сегмента.
+
+    Параметры:
+    - sums: групповые суммы альтернатив (обычно множеств Парето сегментов).
+    - codes: номер сегмента каждой строки.
+    - closure: транзитивное замыкание отношения важности групп.
+
+    Возвращает:
+    - Булев массив, True для альтернатив, оставшихся после t-упорядочения в своем сегменте.
+    """
+    if len(sums) == 0:
+        return np.zeros(0, dtype=bool)
+    kernels = core._kernels(backend)
+    transfer = core.transfer_order(closure)
+    # Строки сегмента с равными групповыми суммами неразличимы для t-упорядочения
+    representatives, classes = core.row_classes(np.column_stack([codes, sums]))
+    sums, codes = sums[representatives], codes[representatives]
+    order, starts, sizes = _segment_layout(codes, int(codes.max()) + 1)
+    removed = np.zeros(len(sums), dtype=bool)
+    for row in range(int(sizes.max())):
+        segments = np.flatnonzero(sizes > row)
+        segments = segments[~removed[order[starts[segments] + row]]]
+        if len(segments) == 0:
+            continue
+        first, second = _segment_pairs(order, starts, sizes, segments, row)
+        candidates = (first != second) & ~removed[second]
+        first, second = first[candidates], second[candidates]
+        if len(first):
+            removed[second[kernels.t_dominated_mask(sums[first], sums[second], closure, transfer)]] = True
+    return ~removed[classes]
+
+
+def _grouped(positions: np.ndarray, codes: np.ndarray, num_segments: int) -> Tuple[np.ndarray, np.ndarray]:
+    # Позиции по сегментам (внутри сегмента — по возрастанию) и границы сегментов
+    positions = positions[np.lexsort((positions, codes[positions]))]
+    offsets = np.concatenate([[0], np.cumsum(np.bincount(codes[positions], minlength=num_segments))])
+    return positions, offsets.astype(np.int64)
+
+
+class SegmentedSkyline:
+    def __init__(self, keys: np.ndarray, codes: np.ndarray, pareto_positions: np.ndarray,
+                 pareto_t_positions: np.ndarray):
+        """
+        Результаты по сегментам: позиции альтернатив (строк модели) множества Парето и
+        оставшихся после t-упорядочения в каждом сегменте.
+
+        Позиции хранятся одним массивом, упорядоченным по сегментам, и массивом границ:
+        позиции сегмента s — pareto_index[pareto_offsets[s]:pareto_offsets[s + 1]].
+
+        Параметры:
+        - keys: значения сегментов.
+        - codes: номер сегмента каждой строки модели.
+        - pareto_positions, pareto_t_positions: позиции строк в множествах Парето сегментов
+          и после t-упорядочения.
+        """
+        self.keys = keys
+        self._numbers = {key: number for number, key in enumerate(keys.tolist())}
+        self.pareto_index, self.pareto_offsets = _grouped(pareto_positions, codes, len(keys))
+        self.pareto_t_index, self.pareto_t_offsets = _grouped(pareto_t_positions, codes, len(keys))
+
+    def __len__(self):
+        """
+        Возвращает число сегментов.
+        """
+        return len(self.keys)
+
+    def _number(self, key) -> int:
+        if key not in self._numbers:
+            raise ValueError(f"Сегмент '{key}' отсутствует")
+        return self._numbers[key]
+
+    def pareto(self, key) -> np.ndarray:
+        """
+        Возвращает позиции альтернатив множества Парето сегмента key.
+        """
+        number = self._number(key)
+        return self.pareto_index[self.pareto_offsets[number]:self.pareto_offsets[number + 1]]
+
+    def pareto_t(self, key) -> np.ndarray:
+        """
+        Возвращает позиции альтернатив сегмента key, оставшихся после t-упорядочения.
+        """
+        number = self._number(key)
+        return self.pareto_t_index[self.pareto_t_offsets[number]:self.pareto_t_offsets[number + 1]]
+
+    def as_dict(self) -> Dict:
+        """
+        Возвращает словарь {значение сегмента: позиции альтернатив после t-упорядочения}.
+        """
+        return {key: self.pareto_t(key) for key in self.keys.tolist()}
+
+    def __str__(self):
+        """
+        Возвращает строковое представление объекта SegmentedSkyline.
+        """
+        return (f"SegmentedSkyline: {len(self)} сегментов, {len(self.pareto_index)} альтернатив в множествах Парето, "
+                f"{len(self.pareto_t_index)} после t-упорядочения")
@@ -4,4 +4,17 @@ setup(
     name="t_ordering",
     version="0.1",
     packages=find_packages(),
+    install_requires=["numpy"],
+    # pandas, pyarrow и polars импортируются только при работе с их таблицами
+    extras_require={
+        "pandas": ["pandas"],
+        "arrow": ["pyarrow"],
+        "polars": ["polars"],
+        "all": ["pandas", "pyarrow", "polars"],
+    },
+    entry_points={
+        "console_scripts": [
+            "t-ordering=t_ordering.cli:main",
+        ],
+    },
 )
@@ -0,0 +1,97 @@
+"""
+Хранение массивов NumPy в файлах .npz с версионированным заголовком.
+
+Массивы записываются без сжатия, поэтому при загрузке они отображаются в память
+(np.memmap) прямо из архива, без чтения и копирования данных.
+"""
+import json
+import os
+import struct
+import zipfile
+from contextlib import ExitStack
+from typing import Dict, Tuple
+
+import numpy as np
+
+HEADER_KEY = "__header__"
+# Фиксированная часть локального заголовка файла в ZIP-архиве
+_LOCAL_HEADER = struct.Struct("<IHHHHHIIIHH")
+
+
+def save_arrays(target, arrays: Dict[str, np.ndarray], header: Dict) -> None:
+    """
+    Сохраняет массивы и заголовок (словарь, сериализуемый в JSON) в формате .npz без сжатия.
+
+    Параметры:
+    - target: путь к файлу или открытый двоичный файловый объект.
+    """
+    payload = dict(arrays)
+    payload[HEADER_KEY] = np.frombuffer(json.dumps(header, ensure_ascii=False).encode("utf-8"), dtype=np.uint8)
+    if isinstance(target, (str, os.PathLike)):
+        with open(target, "wb") as f:
+            np.savez(f, **payload)
+    else:
+        np.savez(target, **payload)
+
+
+def load_arrays(path, fmt: str, version: int, mmap: bool = True) -> Tuple[Dict[str, np.ndarray], Dict]:
+    """
+    Загружает массивы и заголовок, сохраненные save_arrays.
+
+    Параметры:
+    - path: путь к файлу или открытый двоичный файловый объект.
+    - fmt, version: ожидаемые значения полей "format" и "version" заголовка.
+    - mmap: отображать массивы в память вместо чтения (только для чтения; только для путей).
+
+    Возвращает:
+    - Словарь массивов и заголовок.
+    """
+    mmap = mmap and isinstance(path, (str, os.PathLike))
+    arrays = {}
+    with ExitStack() as stack:
+        archive = stack.enter_context(zipfile.ZipFile(path))
+        raw = stack.enter_context(open(path, "rb")) if mmap else None
+        for info in archive.infolist():
+            name = info.filename[:-len(".npy")] if info.filename.endswith(".npy") else info.filename
+            array = _memmap_member(path, raw, info) if mmap else None
+            if array is None:
+                with archive.open(info) as member:
+                    array = np.lib.format.read_array(member, allow_pickle=False)
+            arrays[name] = array
+
+    if HEADER_KEY not in arrays:
+        raise ValueError(f"Файл '{path}' не содержит заголовка")
+    header = json.loads(bytes(arrays.pop(HEADER_KEY)).decode("utf-8"))
+    if header.get("format") != fmt:
+        raise ValueError(f"Файл '{path}' имеет формат '{header.get('format')}', ожидался '{fmt}'")
+    if header.get("version") != version:
+        raise ValueError(
+            f"Версия формата файла '{path}' ({header.get('version')}) не поддерживается, ожидалась {version}"
+        )
+    return arrays, header
+
+
+def _memmap_member(path: str, raw, info: zipfile.ZipInfo):
+    """
+    Отображает в память массив из несжатого элемента архива.
+    Возвращает None, если элемент нельзя отобразить (сжатие, объекты Python, пустой массив).
+    """
+    if info.compress_type != zipfile.ZIP_STORED:
+        return None
+    raw.seek(info.header_offset)
+    fields = _LOCAL_HEADER.unpack(raw.read(_LOCAL_HEADER.size))
+    name_length, extra_length = fields[-2], fields[-1]
+    raw.seek(info.header_offset + _LOCAL_HEADER.size + name_length + extra_length)
+
+    version = np.lib.format.read_magic(raw)
+    if version == (1, 0):
+        shape, fortran_order, dtype = np.lib.format.read_array_header_1_0(raw)
+    elif version == (2, 0):
+        shape, fortran_order, dtype = np.lib.format.read_array_header_2_0(raw)
+    else:
+        return None
+    if dtype.hasobject or int(np.prod(shape)) == 0:
+        return None
+    mapped = np.memmap(path, dtype=dtype, mode="r", offset=raw.tell(), shape=shape,
+                       order="F" if fortran_order else "C")
+    return mapped.view(np.ndarray)
@@ -0,0 +1,73 @@
+import importlib.util
+import unittest
+import numpy as np
+import pandas as pd
+from t_ordering import Criterion, Preference, DecisionModel
+from t_ordering.ingest import DictionaryColumn
+
+HAS_PYARROW = importlib.util.find_spec("pyarrow") is not None
+HAS_POLARS = importlib.util.find_spec("polars") is not None
+
+class TestArrowPolarsInput(unittest.TestCase):
+    def setUp(self):
+        self.price_criterion = Criterion(name="Price", absolute=True, maximize=False, min_value=100, max_value=1000)
+        self.quality_criterion = Criterion(
+            name="Quality", absolute=False, maximize=True, valid_values=["low", "medium", "high"]
+        )
+        self.brand_reputation_criterion = Criterion(
+            name="Brand Reputation", absolute=False, maximize=True, valid_values=["unknown", "known", "famous"]
+        )
+        self.criteria_list = [self.price_criterion, self.quality_criterion, self.brand_reputation_criterion]
+        self.data = {
+            "Alternative": ["A", "B", "C", "D", "E"],
+            "Price": [500.0, 800.0, 300.0, 900.0, 300.0],
+            "Quality": ["medium", "high", "low", "low", "medium"],
+            "Brand Reputation": ["known", "famous", "unknown", "known", "unknown"],
+        }
+        self.preferences_list = [
+            Preference(criterion1=self.quality_criterion, criterion2=self.price_criterion, equivalent=False),
+        ]
+        reference = DecisionModel(self.criteria_list, pd.DataFrame(self.data).set_index("Alternative"), self.preferences_list)
+        self.expected_front = list(reference.find_pareto_front().index)
+        self.expected_t = list(reference.t_ordering().index)
+
+    def check_model(self, decision_model):
+        self.assertEqual(list(decision_model.find_pareto_front()), self.expected_front)
+        self.assertEqual(list(decision_model.t_ordering()), self.expected_t)
+
+    @unittest.skipUnless(HAS_PYARROW, "pyarrow не установлен")
+    def test_arrow_table(self):
+        import pyarrow as pa
+
+        table = pa.table(self.data)
+        decision_model = DecisionModel(self.criteria_list, table, self.preferences_list, index="Alternative")
+        # Числовой столбец читается без копирования, строковый — через словарь
+        self.assertFalse(decision_model.columns["Price"].flags.owndata)
+        self.assertIsInstance(decision_model.columns["Quality"], DictionaryColumn)
+        self.check_model(decision_model)
+
+    @unittest.skipUnless(HAS_PYARROW, "pyarrow не установлен")
+    def test_arrow_invalid_ordinal_value(self):
+        import pyarrow as pa
+
+        data = dict(self.data, Quality=["medium", "high", "low", "excellent", None])
+        with self.assertRaises(ValueError):
+            DecisionModel(self.criteria_list, pa.table(data), self.preferences_list, index="Alternative")
+
+    @unittest.skipUnless(HAS_POLARS, "polars не установлен")
+    def test_polars_frame(self):
+        import polars as pl
+
+        frame = pl.DataFrame(self.data).with_columns(pl.col("Quality").cast(pl.Categorical))
+        decision_model = DecisionModel(self.criteria_list, frame, self.preferences_list, index="Alternative")
+        self.check_model(decision_model)
+
+    def test_pandas_categorical(self):
+        alternatives_df = pd.DataFrame(self.data).set_index("Alternative")
+        alternatives_df["Quality"] = alternatives_df["Quality"].astype("category")
+        decision_model = DecisionModel(self.criteria_list, alternatives_df, self.preferences_list)
+        self.assertEqual(list(decision_model.t_ordering().index), self.expected_t)
+        np.testing.assert_array_equal(decision_model.columns["Quality"][[0]], ["medium"])
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
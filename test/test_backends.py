@@ -0,0 +1,93 @@
+import contextlib
+import glob
+import importlib
+import io
+import os
+import unittest
+import numpy as np
+from t_ordering import Criterion, Preference, DecisionModel
+from t_ordering import backends, core
+
+class TestBackends(unittest.TestCase):
+    def setUp(self):
+        self.previous = backends.set_backend(None)
+
+    def tearDown(self):
+        backends.set_backend(self.previous)
+
+    def random_structure(self, rng):
+        num_groups = int(rng.integers(1, 7))
+        pairs = [tuple(rng.integers(0, num_groups, 2).tolist()) for _ in range(int(rng.integers(0, 8)))]
+        pairs = [(a, b) for a, b in pairs if a < b]  # более важная группа имеет меньший номер: без циклов
+        closure = core.importance_closure(np.arange(num_groups), num_groups, pairs)
+        # Суммы с повторами и близкими значениями, чтобы проверить округление и равенства
+        sums = np.round(rng.integers(0, 6, (int(rng.integers(1, 25)), num_groups)) / 5
+                        + rng.choice([0, 1e-9, 0.1], (1, num_groups)), 8)
+        return sums, closure
+
+    def test_kernels_match_numpy(self):
+        rng = np.random.default_rng(7)
+        reference = backends.get_backend("numpy")
+        for name in backends.available_backends():
+            kernels = backends.get_backend(name)
+            for _ in range(200):
+                sums, closure = self.random_structure(rng)
+                order = core.transfer_order(closure)
+                for i in range(len(sums)):
+                    np.testing.assert_array_equal(
+                        kernels.t_dominated_mask(sums[i], sums, closure, order),
+                        reference.t_dominated_mask(sums[i], sums, closure, order), err_msg=name)
+                # Пары строк: своя альтернатива Z для каждой альтернативы W
+                np.testing.assert_array_equal(kernels.t_dominated_mask(sums[::-1], sums, closure, order),
+                                              reference.t_dominated_mask(sums[::-1], sums, closure, order), err_msg=name)
+                np.testing.assert_array_equal(kernels.dominated_by_any(sums, sums[::2]),
+                                              reference.dominated_by_any(sums, sums[::2]), err_msg=name)
+                np.testing.assert_array_equal(core.t_ordering_mask(sums, closure, backend=name),
+                                              core.t_ordering_mask(sums, closure, backend="numpy"), err_msg=name)
+                np.testing.assert_array_equal(core.pareto_front_mask(sums, block_size=4, backend=name),
+                                              core.pareto_front_mask(sums, block_size=4, backend="numpy"), err_msg=name)
+
+    def test_examples_pass_with_every_backend(self):
+        # Тесты примеров выполняются заново для каждого набора ядер процесса
+        directory = os.path.dirname(os.path.abspath(__file__))
+        names = sorted(os.path.basename(path)[:-3] for path in glob.glob(os.path.join(directory, "test_example_*.py")))
+        self.assertTrue(names)
+        for name in backends.available_backends():
+            backends.set_backend(name)
+            suite = unittest.TestSuite(
+                unittest.defaultTestLoader.loadTestsFromModule(importlib.import_module(module)) for module in names
+            )
+            result = unittest.TestResult()
+            with contextlib.redirect_stdout(io.StringIO()):
+                suite.run(result)
+            self.assertTrue(result.wasSuccessful(), f"{name}: {result.failures + result.errors}")
+
+    def test_model_backend_selection(self):
+        criteria_list = [Criterion(name=f"c{i}", absolute=True, maximize=True, min_value=0, max_value=1) for i in range(4)]
+        c0, c1, c2, c3 = criteria_list
+        preferences = [Preference(c0, c1, equivalent=False), Preference(c2, c3, equivalent=True)]
+        rng = np.random.default_rng(8)
+        data = {f"c{i}": np.round(rng.random(60), 1) for i in range(4)}
+        with contextlib.redirect_stdout(io.StringIO()):
+            expected = DecisionModel(criteria_list, data, preferences, backend="numpy").t_ordering()
+            model = DecisionModel(criteria_list, data, preferences, backend="python")
+            np.testing.assert_array_equal(model.t_ordering(), expected)
+            Z, W = model.normalized_matrix[model.pareto_index[:2]]
+            self.assertEqual(model._check_t_dominance(Z, W),
+                             bool(core.t_dominated_mask(model._group_sums(Z), model._group_sums(W)[None, :],
+                                                        model.importance_closure)[0]))
+
+    def test_unknown_backend(self):
+        with self.assertRaises(ValueError):
+            backends.set_backend("fortran")
+        self.assertIn("numpy", backends.available_backends())
+
+    @unittest.skipIf(backends.numba_available(), "numba установлен")
+    def test_numba_unavailable(self):
+        self.assertNotIn("numba", backends.available_backends())
+        with self.assertRaises(ValueError):
+            backends.get_backend("numba")
+        self.assertEqual(backends.get_backend().name, "numpy")
+
+if __name__ == "__main__":
+    unittest.main()
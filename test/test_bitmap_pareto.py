@@ -0,0 +1,54 @@
+import contextlib
+import io
+import unittest
+import numpy as np
+from t_ordering import Criterion, DecisionModel
+from t_ordering import core
+from t_ordering.bitmap import bitmap_pareto_front_mask, bitmap_dominator_counts, level_codes
+
+class TestBitmapPareto(unittest.TestCase):
+    def setUp(self):
+        rng = np.random.default_rng(0)
+        # Порядковые критерии с 3–7 уровнями и строки с почти постоянной суммой (большое множество Парето)
+        levels = np.array([3, 5, 7, 4, 6])
+        codes = rng.integers(0, levels, (4000, len(levels)))
+        self.ordinal = codes / (levels - 1)
+        self.anticorrelated = self.ordinal[np.abs(self.ordinal.sum(axis=1) - self.ordinal.sum(axis=1).mean()) < 0.3]
+        self.mixed = np.hstack([self.ordinal, rng.random((4000, 2))])
+
+    def test_matches_pairwise_front(self):
+        for matrix in (self.ordinal, self.anticorrelated, self.mixed):
+            np.testing.assert_array_equal(bitmap_pareto_front_mask(matrix), core.pareto_front_mask(matrix))
+        # Малое число интервалов для абсолютных критериев требует уточнения по исходным значениям
+        np.testing.assert_array_equal(
+            bitmap_pareto_front_mask(self.mixed, max_levels=4, elite_size=1), core.pareto_front_mask(self.mixed)
+        )
+
+    def test_level_codes_preserve_order(self):
+        codes, exact = level_codes(self.mixed, max_levels=8)
+        self.assertEqual(exact.tolist(), [True] * 5 + [False] * 2)
+        for k in range(self.mixed.shape[1]):
+            order = np.argsort(self.mixed[:, k], kind="stable")
+            self.assertTrue(np.all(np.diff(codes[order, k]) >= 0))
+
+    def test_dominator_counts(self):
+        matrix = np.round(np.random.default_rng(1).random((300, 3)), 1)
+        expected = [np.sum(np.all(matrix >= row, axis=1) & np.any(matrix > row, axis=1)) for row in matrix]
+        np.testing.assert_array_equal(bitmap_dominator_counts(matrix), expected)
+
+    def test_decision_model_method(self):
+        criteria_list = [
+            Criterion(name=f"c{i}", absolute=False, maximize=bool(i % 2), valid_values=["a", "b", "c", "d"])
+            for i in range(4)
+        ]
+        rng = np.random.default_rng(2)
+        data = {f"c{i}": rng.choice(["a", "b", "c", "d"], 1000) for i in range(4)}
+        with contextlib.redirect_stdout(io.StringIO()):
+            bitmap = DecisionModel(criteria_list, data, []).find_pareto_front(method="bitmap")
+            sfs = DecisionModel(criteria_list, data, []).find_pareto_front(method="sfs")
+            with self.assertRaises(ValueError):
+                DecisionModel(criteria_list, data, []).find_pareto_front(method="quick")
+        np.testing.assert_array_equal(bitmap, sfs)
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
@@ -0,0 +1,160 @@
+import io
+import json
+import multiprocessing
+import os
+import resource
+import tempfile
+import unittest
+from contextlib import redirect_stdout
+from unittest import mock
+from t_ordering import cli
+
+PROBLEM = {
+    "criteria": [
+        {"name": f"criterion{i+1}", "absolute": True, "maximize": True, "min_value": 0, "max_value": 1}
+        for i in range(6)
+    ],
+    "preferences": [
+        {"criterion1": "criterion2", "criterion2": "criterion3", "equivalent": True},
+        {"criterion1": "criterion4", "criterion2": "criterion5", "equivalent": True},
+        {"criterion1": "criterion5", "criterion2": "criterion6", "equivalent": True},
+        {"criterion1": "criterion1", "criterion2": "criterion3", "equivalent": False},
+    ],
+    "index": "Alternative",
+    "alternatives": {
+        "Alternative": ["Alternative A", "Alternative B", "Alternative C", "Alternative D"],
+        "criterion1": [0.4, 0.2, 0.2, 0.2],
+        "criterion2": [0.6, 0.8, 0.7, 0.7],
+        "criterion3": [0.4, 0.4, 0.5, 0.4],
+        "criterion4": [0.2, 0.3, 0.3, 0.3],
+        "criterion5": [0.1, 0.2, 0.2, 0.2],
+        "criterion6": [0.7, 0.5, 0.5, 0.4],
+    },
+}
+
+_solve_batch = cli.solve_batch
+
+
+def crashing_solve_batch(task):
+    # Рабочий процесс завершается аварийно на пачке с задачей p2
+    if any(str(item).endswith("p2.json") for item in task[1]):
+        os._exit(1)
+    return _solve_batch(task)
+
+
+class TestCli(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+        for name in ("p1", "p2", "p3"):
+            with open(os.path.join(self.tmp.name, f"{name}.json"), "w", encoding="utf-8") as f:
+                json.dump(PROBLEM, f)
+        # Задача с ошибкой: значение вне допустимого диапазона
+        broken = json.loads(json.dumps(PROBLEM))
+        broken["alternatives"]["criterion1"][0] = 5
+        with open(os.path.join(self.tmp.name, "p4.json"), "w", encoding="utf-8") as f:
+            json.dump(broken, f)
+
+    def run_cli(self, argv):
+        output_path = os.path.join(self.tmp.name, "out.jsonl")
+        code = cli.main(argv + ["-o", output_path])
+        with open(output_path, encoding="utf-8") as f:
+            return code, [json.loads(line) for line in f]
+
+    def test_solve_problem(self):
+        result = cli.solve_problem(dict(PROBLEM, id="p"))
+        self.assertEqual(result["id"], "p")
+        self.assertEqual(result["pareto_front"], ["Alternative A", "Alternative B", "Alternative C"])
+        self.assertEqual(result["pareto_t"], ["Alternative A"])
+
+    def test_directory_serial_and_parallel(self):
+        code_serial, serial = self.run_cli([self.tmp.name, "-j", "1"])
+        code_parallel, parallel = self.run_cli([self.tmp.name, "-j", "2", "--batch-size", "1"])
+        # Результаты совпадают и идут в порядке файлов
+        self.assertEqual(serial, parallel)
+        self.assertEqual([r["id"] for r in serial], ["p1", "p2", "p3", "p4"])
+        self.assertEqual(serial[0]["pareto_t"], ["Alternative A"])
+        # Ошибка в одной задаче не мешает остальным, но отражается в коде возврата
+        self.assertIn("error", serial[3])
+        self.assertEqual(code_serial, 1)
+        self.assertEqual(code_parallel, 1)
+
+    def test_stdin_jsonl(self):
+        lines = json.dumps(PROBLEM) + "\n\n" + json.dumps(dict(PROBLEM, id="named")) + "\n"
+        stdin, stdout = io.StringIO(lines), io.StringIO()
+        original_stdin = cli.sys.stdin
+        cli.sys.stdin = stdin
+        try:
+            with redirect_stdout(stdout):
+                code = cli.main(["-j", "1"])
+        finally:
+            cli.sys.stdin = original_stdin
+        results = [json.loads(line) for line in stdout.getvalue().splitlines()]
+        self.assertEqual(code, 0)
+        self.assertEqual([r["id"] for r in results], ["stdin:1", "named"])
+
+    def run_stdin(self, lines, argv):
+        stdin, stdout = io.StringIO(lines), io.StringIO()
+        original_stdin = cli.sys.stdin
+        cli.sys.stdin = stdin
+        try:
+            with redirect_stdout(stdout):
+                code = cli.main(argv)
+        finally:
+            cli.sys.stdin = original_stdin
+        return code, [json.loads(line) for line in stdout.getvalue().splitlines()]
+
+    def test_non_object_lines(self):
+        lines = json.dumps(PROBLEM) + "\n[1, 2]\n{bad\n" + json.dumps(dict(PROBLEM, id="last")) + "\n"
+        code, results = self.run_stdin(lines, ["-j", "1"])
+        self.assertEqual(code, 1)
+        self.assertEqual([r["id"] for r in results], ["stdin:1", "stdin:2", "stdin:3", "last"])
+        self.assertIn("JSON-объектом", results[1]["error"])
+        self.assertIn("pareto_t", results[3])
+
+        # Строки файла JSONL обрабатываются так же, файл JSON со списком дает ошибку файла
+        directory = tempfile.mkdtemp(dir=self.tmp.name)
+        with open(os.path.join(directory, "batch.jsonl"), "w", encoding="utf-8") as f:
+            f.write(lines)
+        with open(os.path.join(directory, "list.json"), "w", encoding="utf-8") as f:
+            f.write("[1, 2]")
+        _, results = self.run_cli([directory, "-j", "1"])
+        self.assertEqual([r["id"] for r in results], ["batch:1", "batch:2", "batch:3", "last", os.path.join(directory, "list.json")])
+        self.assertIn("pareto_t", results[3])
+
+    def test_malformed_alternative_records(self):
+        for records in ([["P"]], [1, 2]):
+            malformed = dict(PROBLEM, id="malformed", alternatives=records)
+            lines = "\n".join(json.dumps(problem) for problem in (PROBLEM, malformed, dict(PROBLEM, id="last"))) + "\n"
+            for jobs in ("1", "2"):
+                code, results = self.run_stdin(lines, ["-j", jobs, "--batch-size", "1"])
+                self.assertEqual(code, 1)
+                self.assertEqual([r["id"] for r in results], ["stdin:1", "malformed", "last"])
+                self.assertIn("JSON-объектом", results[1]["error"])
+                self.assertEqual(results[0]["pareto_t"], ["Alternative A"])
+                self.assertEqual(results[2]["pareto_t"], ["Alternative A"])
+
+    def test_memory_error_is_reported_per_problem(self):
+        with mock.patch.object(cli, "build_model", side_effect=MemoryError("out of memory")):
+            result = cli.solve_problem(dict(PROBLEM, id="p"))
+        self.assertEqual(result["id"], "p")
+        self.assertIn("MemoryError", result["error"])
+
+    @unittest.skipUnless(multiprocessing.get_start_method() == "fork", "требуется запуск процессов через fork")
+    def test_crashed_worker_does_not_abort_batch(self):
+        with mock.patch.object(cli, "solve_batch", crashing_solve_batch):
+            code, results = self.run_cli([self.tmp.name, "-j", "2", "--batch-size", "1"])
+        self.assertEqual(code, 1)
+        self.assertEqual([os.path.basename(str(r["id"])) for r in results], ["p1", "p2.json", "p3", "p4"])
+        self.assertIn("BrokenProcessPool", results[1]["error"])
+        self.assertEqual(results[0]["pareto_t"], ["Alternative A"])
+        self.assertEqual(results[2]["pareto_t"], ["Alternative A"])
+
+    def test_serial_memory_limit_is_restored(self):
+        before = resource.getrlimit(resource.RLIMIT_AS)
+        results = list(cli.run_tasks([("files", [os.path.join(self.tmp.name, "p1.json")], None)], 1, 4096))
+        self.assertEqual(results[0]["pareto_t"], ["Alternative A"])
+        self.assertEqual(resource.getrlimit(resource.RLIMIT_AS), before)
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
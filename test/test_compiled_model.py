@@ -0,0 +1,68 @@
+import contextlib
+import io
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+import numpy as np
+from t_ordering import Criterion, Preference, DecisionModel, CompiledModel
+
+class TestCompiledModel(unittest.TestCase):
+    def setUp(self):
+        self.criteria_list = [
+            Criterion(name=f"c{i}", absolute=True, maximize=True, min_value=0, max_value=1) for i in range(4)
+        ]
+        c0, c1, c2, c3 = self.criteria_list
+        self.preferences = [Preference(c0, c1, equivalent=False), Preference(c2, c3, equivalent=True)]
+        rng = np.random.default_rng(4)
+        self.data = {"id": np.arange(500), **{f"c{i}": np.round(rng.random(500), 1) for i in range(4)}}
+        self.output = contextlib.redirect_stdout(io.StringIO())
+        self.output.__enter__()
+        self.model = DecisionModel(self.criteria_list, self.data, self.preferences, index="id")
+        self.compiled = self.model.freeze()
+
+    def tearDown(self):
+        self.output.__exit__(None, None, None)
+
+    def test_results_match_model(self):
+        self.assertIsInstance(self.compiled, CompiledModel)
+        np.testing.assert_array_equal(self.compiled.pareto_front(), self.model.pareto_front)
+        np.testing.assert_array_equal(self.compiled.t_ordering(), self.model.t_ordering())
+        np.testing.assert_array_equal(self.compiled.top_k(5, among="pareto"), self.model.top_k(5, among="pareto"))
+        values = {f"c{i}": 0.5 for i in range(4)}
+        self.assertEqual(self.compiled.is_dominated(values), self.model.is_dominated(values))
+        np.testing.assert_array_equal(self.compiled.dominators(values), self.model.dominators(values))
+
+    def test_query_preferences_match_fresh_model(self):
+        c0, c1, c2, c3 = self.criteria_list
+        preferences = [Preference(c3, c0, equivalent=False), Preference(c0, c1, equivalent=True)]
+        expected = DecisionModel(self.criteria_list, self.data, preferences, index="id").t_ordering()
+        np.testing.assert_array_equal(self.compiled.t_ordering(preferences), expected)
+        # Запрос с другими предпочтениями не меняет результат снимка
+        np.testing.assert_array_equal(self.compiled.t_ordering(), self.model.t_ordering())
+        with self.assertRaises(ValueError):
+            self.compiled.t_ordering([Preference(c0, c1, equivalent=False), Preference(c1, c0, equivalent=False)])
+
+    def test_snapshot_is_immutable(self):
+        with self.assertRaises(AttributeError):
+            self.compiled.pareto_index = np.arange(3)
+        with self.assertRaises(ValueError):
+            self.compiled.normalized_matrix[0, 0] = 0.0
+        before = self.compiled.t_ordering()
+        c0, c1, c2, c3 = self.criteria_list
+        self.model.preferences = [Preference(c1, c0, equivalent=False)]
+        self.model.t_ordering()
+        np.testing.assert_array_equal(self.compiled.t_ordering(), before)
+
+    def test_concurrent_queries(self):
+        c0, c1, c2, c3 = self.criteria_list
+        variants = [None, [Preference(c3, c0, equivalent=False)], [Preference(c1, c2, equivalent=True)]]
+        expected = [self.compiled.t_ordering(preferences) for preferences in variants]
+        expected_top = self.compiled.top_k(10)
+        tasks = [i % len(variants) for i in range(60)]
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            results = list(executor.map(lambda i: (i, self.compiled.t_ordering(variants[i]), self.compiled.top_k(10)), tasks))
+        for i, result, top in results:
+            np.testing.assert_array_equal(result, expected[i])
+            np.testing.assert_array_equal(top, expected_top)
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,61 @@
+import contextlib
+import io
+import unittest
+import numpy as np
+from t_ordering import Criterion, DecisionModel, DominanceIndex
+from t_ordering import core
+
+def brute_dominators(matrix, row):
+    return np.flatnonzero(np.all(matrix >= row, axis=1) & np.any(matrix > row, axis=1))
+
+def brute_dominated(matrix, row):
+    return np.flatnonzero(np.all(row >= matrix, axis=1) & np.any(row > matrix, axis=1))
+
+class TestDominanceIndex(unittest.TestCase):
+    def setUp(self):
+        rng = np.random.default_rng(0)
+        # Округление дает совпадающие строки и точки на границах узлов
+        self.matrix = np.round(rng.random((3000, 4)), 1)
+        self.queries = np.vstack([np.round(rng.random((100, 4)), 1), self.matrix[:50]])
+        self.index = DominanceIndex(self.matrix, leaf_size=16)
+
+    def test_matches_brute_force(self):
+        for row in self.queries:
+            expected = brute_dominators(self.matrix, row)
+            np.testing.assert_array_equal(self.index.dominators(row), expected)
+            self.assertEqual(self.index.count_dominators(row), len(expected))
+            self.assertEqual(self.index.is_dominated(row), len(expected) > 0)
+            expected = brute_dominated(self.matrix, row)
+            np.testing.assert_array_equal(self.index.dominated(row), expected)
+            self.assertEqual(self.index.count_dominated(row), len(expected))
+
+    def test_front_members_are_not_dominated(self):
+        front = core.pareto_front_mask(self.matrix)
+        flags = np.array([self.index.is_dominated(row) for row in self.matrix])
+        np.testing.assert_array_equal(~flags, front)
+
+    def test_query_box(self):
+        lower, upper = np.array([0.2, 0.0, 0.5, -np.inf]), np.array([0.6, 0.3, 0.9, np.inf])
+        expected = np.flatnonzero(np.all(self.matrix >= lower, axis=1) & np.all(self.matrix <= upper, axis=1))
+        np.testing.assert_array_equal(self.index.query_box(lower, upper), expected)
+
+    def test_model_rebuilds_after_normalization(self):
+        criteria_list = [
+            Criterion(name="Price", absolute=True, maximize=False, min_value=0, max_value=100),
+            Criterion(name="Quality", absolute=False, maximize=True, valid_values=["low", "mid", "high"]),
+        ]
+        data = {"Offer": ["a", "b", "c"], "Price": [10, 50, 20], "Quality": ["mid", "high", "low"]}
+        with contextlib.redirect_stdout(io.StringIO()):
+            model = DecisionModel(criteria_list, data, [], index="Offer")
+        self.assertFalse(model.is_dominated({"Price": 5, "Quality": "high"}))
+        self.assertEqual(list(model.dominators({"Price": 30, "Quality": "low"})), ["a", "c"])
+        index = model.dominance_index
+        self.assertIs(model.dominance_index, index)
+
+        model.columns["Price"] = np.array([40, 50, 20])
+        model.normalize_data()
+        self.assertIsNot(model.dominance_index, index)
+        self.assertEqual(list(model.dominators({"Price": 30, "Quality": "low"})), ["c"])
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
@@ -0,0 +1,103 @@
+import contextlib
+import io
+import unittest
+from unittest import mock
+import numpy as np
+from t_ordering import Criterion, Preference, DecisionModel, DominanceRelation
+from t_ordering import core
+
+class TestDominanceRelation(unittest.TestCase):
+    def setUp(self):
+        self.criteria_list = [
+            Criterion(name=f"c{i}", absolute=True, maximize=True, min_value=0, max_value=1) for i in range(4)
+        ]
+        c0, c1, c2, c3 = self.criteria_list
+        self.preferences = [Preference(c0, c1, equivalent=False), Preference(c1, c2, equivalent=False),
+                            Preference(c2, c3, equivalent=True)]
+        rng = np.random.default_rng(9)
+        self.data = {f"c{i}": np.round(rng.random(300), 1) for i in range(4)}
+        self.output = contextlib.redirect_stdout(io.StringIO())
+        self.output.__enter__()
+        self.model = DecisionModel(self.criteria_list, self.data, self.preferences)
+        self.model.t_ordering(record_relation=True)
+        self.relation = self.model.t_dominance_relation
+
+    def tearDown(self):
+        self.output.__exit__(None, None, None)
+
+    def expected_dense(self):
+        sums = self.model.front_sums
+        closure = self.model.importance_closure
+        return np.array([core.t_dominated_mask(row, sums, closure) for row in sums])
+
+    def test_matches_pairwise_kernel(self):
+        dense = self.expected_dense()
+        self.assertGreater(dense.sum(), 0)
+        np.testing.assert_array_equal(self.relation.to_dense(), dense)
+        np.testing.assert_array_equal(self.relation.positions, self.model.pareto_index)
+        np.testing.assert_array_equal(self.relation.dominator_counts(), dense.sum(axis=0))
+        np.testing.assert_array_equal(self.relation.dominated_counts(), dense.sum(axis=1))
+        self.assertEqual(self.relation.num_edges, dense.sum())
+        for i in range(0, len(dense), 7):
+            np.testing.assert_array_equal(self.relation.dominated(i), np.flatnonzero(dense[i]))
+            np.testing.assert_array_equal(self.relation.dominators(i), np.flatnonzero(dense[:, i]))
+        # Альтернативы после t-упорядочения не t-доминируются другими альтернативами
+        survivors = np.searchsorted(self.model.pareto_index, self.model.pareto_t_index)
+        self.assertFalse(self.relation.dominator_counts()[survivors].any())
+
+    def test_packed_rows_with_duplicate_sums(self):
+        rng = np.random.default_rng(4)
+        sums = np.round(rng.random((40, 3)), 1)
+        # Повторяющиеся строки и несколько блоков упаковки
+        sums = np.vstack([sums, sums[:25], sums[:5]])[rng.permutation(70)]
+        closure = np.array([[False, True, True], [False, False, True], [False, False, False]])
+        dense = np.array([core.t_dominated_mask(row, sums, closure) for row in sums])
+        self.assertGreater(dense.sum(), 0)
+        with mock.patch.object(core, "_BLOCK_ELEMENTS", 700):
+            relation = DominanceRelation.from_sums(sums, closure)
+        expected = DominanceRelation.from_dense(dense)
+        self.assertEqual(relation.words.dtype, np.uint64)
+        np.testing.assert_array_equal(relation.words, expected.words)
+
+    def test_edges(self):
+        dense = self.relation.to_dense()
+        indptr, indices = self.relation.edges()
+        for i in range(len(dense)):
+            np.testing.assert_array_equal(indices[indptr[i]:indptr[i + 1]], np.flatnonzero(dense[i]))
+
+    def test_transitive_reduction(self):
+        # Цепочка 0 > 1 > 2 > 3 с транзитивными парами и отдельная пара 4 > 5
+        dense = np.zeros((70, 70), dtype=bool)
+        for i in range(4):
+            dense[i, i + 1:4] = True
+        dense[4, 5] = True
+        dense[0, 69] = dense[3, 69] = True
+        relation = DominanceRelation.from_dense(dense)
+        reduced = relation.transitive_reduction().to_dense()
+        expected = np.zeros_like(dense)
+        expected[0, 1] = expected[1, 2] = expected[2, 3] = expected[4, 5] = expected[3, 69] = True
+        np.testing.assert_array_equal(reduced, expected)
+        np.testing.assert_array_equal(DominanceRelation.from_dense(expected).transitive_closure().to_dense(),
+                                      relation.transitive_closure().to_dense())
+
+    def test_zero_copy_export(self):
+        import pyarrow as pa
+
+        array = self.relation.to_arrow()
+        self.assertIsInstance(array, pa.FixedSizeListArray)
+        self.assertEqual(len(array), len(self.relation))
+        buffer = array.values.buffers()[1]
+        self.assertEqual(buffer.address, self.relation.words.ctypes.data)
+
+    def test_relation_is_lazy_and_cached(self):
+        model = DecisionModel(self.criteria_list, self.data, self.preferences)
+        model.t_ordering()
+        self.assertFalse(model._stage_is_current("t_relation"))
+        relation = model.t_dominance_relation
+        self.assertIs(model.t_dominance_relation, relation)
+        c0, c1, c2, c3 = self.criteria_list
+        model.preferences = [Preference(c3, c0, equivalent=False)]
+        self.assertIsNot(model.t_dominance_relation, relation)
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,48 @@
+import unittest
+import numpy as np
+from t_ordering import Criterion, Preference, DecisionModel
+from t_ordering import core
+
+class TestDuplicateCompression(unittest.TestCase):
+    def setUp(self):
+        rng = np.random.default_rng(2)
+        # Порядковые критерии с тремя уровнями и округленные цены дают много совпадающих строк
+        self.data = {
+            "Price": rng.integers(1, 5, 600) * 100.0,
+            "Quality": rng.choice(["low", "medium", "high"], 600).astype(object),
+            "Speed": rng.choice(["slow", "fast"], 600).astype(object),
+            "Weight": rng.integers(0, 3, 600) * 1.0,
+        }
+        self.criteria_list = [
+            Criterion(name="Price", absolute=True, maximize=False, min_value=100, max_value=500),
+            Criterion(name="Quality", absolute=False, maximize=True, valid_values=["low", "medium", "high"]),
+            Criterion(name="Speed", absolute=False, maximize=True, valid_values=["slow", "fast"]),
+            Criterion(name="Weight", absolute=True, maximize=False, min_value=0, max_value=2),
+        ]
+        self.preferences_list = [
+            Preference(criterion1=self.criteria_list[1], criterion2=self.criteria_list[0], equivalent=False),
+            Preference(criterion1=self.criteria_list[2], criterion2=self.criteria_list[3], equivalent=True),
+        ]
+
+    def test_row_classes(self):
+        matrix = np.array([[1.0, 0.0], [0.5, 0.5], [1.0, 0.0], [0.5, 0.5], [0.0, 1.0]])
+        representatives, classes = core.row_classes(matrix)
+        np.testing.assert_array_equal(representatives, [0, 1, 4])
+        np.testing.assert_array_equal(classes, [0, 1, 0, 1, 2])
+
+    def test_results_match_uncompressed(self):
+        decision_model = DecisionModel(self.criteria_list, self.data, self.preferences_list)
+        decision_model.t_ordering()
+        matrix = decision_model.normalized_matrix
+
+        expected_front = np.flatnonzero(core.pareto_front_mask(matrix))
+        np.testing.assert_array_equal(decision_model.pareto_index, expected_front)
+
+        sums = core.group_sums(matrix[expected_front], decision_model.group_of, len(decision_model.groups))
+        expected_t = expected_front[core.t_ordering_mask(sums, decision_model.importance_closure)]
+        np.testing.assert_array_equal(decision_model.pareto_t_index, expected_t)
+
+        np.testing.assert_array_equal(decision_model.sort_fronts(), core.nondominated_ranks(matrix))
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
@@ -0,0 +1,53 @@
+import unittest
+import numpy as np
+from t_ordering import Criterion, DecisionModel
+from t_ordering import core
+
+class TestEpsilonPareto(unittest.TestCase):
+    def setUp(self):
+        rng = np.random.default_rng(3)
+        # Точки вблизи симплекса: почти все альтернативы попадают в точное множество Парето
+        points = rng.random((2000, 10))
+        self.matrix = points / points.sum(axis=1, keepdims=True)
+
+    def test_epsilon_guarantee(self):
+        epsilon = 0.1
+        mask = core.epsilon_pareto_mask(self.matrix, epsilon)
+        kept = self.matrix[mask]
+        # Оставленные альтернативы входят в точное множество Парето
+        self.assertTrue(np.all(core.pareto_front_mask(self.matrix)[mask]))
+        # Каждая альтернатива уступает одной из оставленных не более чем на epsilon
+        covered = np.all(kept[:, None, :] > self.matrix[None, :, :] - epsilon, axis=2).any(axis=0)
+        self.assertTrue(covered.all())
+        self.assertLess(mask.sum(), core.pareto_front_mask(self.matrix).sum())
+
+    def test_small_epsilon_is_exact(self):
+        # При малом epsilon разные альтернативы попадают в разные ячейки,
+        # а из совпадающих остается первая
+        matrix = np.round(self.matrix[:300, :3], 2)
+        representatives, _ = core.row_classes(matrix)
+        first_occurrence = np.zeros(len(matrix), dtype=bool)
+        first_occurrence[representatives] = True
+        np.testing.assert_array_equal(
+            core.epsilon_pareto_mask(matrix, 1e-9), core.pareto_front_mask(matrix) & first_occurrence
+        )
+
+    def test_invalid_epsilon(self):
+        with self.assertRaises(ValueError):
+            core.epsilon_pareto_mask(self.matrix, 0)
+
+    def test_decision_model_epsilon(self):
+        criteria_list = [
+            Criterion(name=f"c{i}", absolute=True, maximize=True, min_value=0, max_value=1) for i in range(10)
+        ]
+        decision_model = DecisionModel(criteria_list, {f"c{i}": self.matrix[:, i] for i in range(10)}, [])
+        decision_model.find_pareto_front(epsilon=0.1)
+        self.assertEqual(decision_model.pareto_epsilon, 0.1)
+        np.testing.assert_array_equal(
+            decision_model.pareto_index, np.flatnonzero(core.epsilon_pareto_mask(self.matrix, 0.1))
+        )
+        # t-упорядочение работает на приближенном множестве
+        self.assertLessEqual(len(decision_model.t_ordering()), len(decision_model.pareto_index))
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
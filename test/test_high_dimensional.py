@@ -0,0 +1,113 @@
+import contextlib
+import io
+import unittest
+import numpy as np
+from t_ordering import Criterion, Preference, DecisionModel
+from t_ordering import backends, core
+
+class TestHighDimensional(unittest.TestCase):
+    def setUp(self):
+        # Сгенерированные критерии: пары эквивалентных признаков и цепочка строгих предпочтений
+        self.num_criteria = 400
+        self.criteria_list = [
+            Criterion(name=f"f{i}", absolute=True, maximize=bool(i % 2), min_value=0, max_value=1)
+            for i in range(self.num_criteria)
+        ]
+        self.preferences = [Preference(self.criteria_list[i], self.criteria_list[i + 1], equivalent=True)
+                            for i in range(0, self.num_criteria - 1, 2)]
+        self.preferences += [Preference(self.criteria_list[i], self.criteria_list[i + 2], equivalent=False)
+                             for i in range(0, self.num_criteria - 3, 4)]
+        rng = np.random.default_rng(2)
+        self.data = {f"f{i}": np.round(rng.random(40), 1) for i in range(self.num_criteria)}
+        self.output = contextlib.redirect_stdout(io.StringIO())
+        self.output.__enter__()
+        self.model = DecisionModel(self.criteria_list, self.data, self.preferences)
+
+    def tearDown(self):
+        self.output.__exit__(None, None, None)
+
+    def test_groups_and_sums_match_per_group_computation(self):
+        self.assertEqual(len(self.model.groups), self.num_criteria // 2)
+        matrix = self.model.normalized_matrix
+        expected = np.column_stack([
+            matrix[:, self.model.group_of == group].sum(axis=1) for group in range(len(self.model.groups))
+        ])
+        np.testing.assert_array_equal(core.group_sums(matrix, self.model.group_of, len(self.model.groups)),
+                                      np.round(expected, 8))
+
+    def test_closure_matches_warshall(self):
+        rng = np.random.default_rng(3)
+        for _ in range(50):
+            num_groups = int(rng.integers(1, 30))
+            pairs = [tuple(rng.integers(0, num_groups, 2).tolist()) for _ in range(int(rng.integers(0, 60)))]
+            group_of = np.arange(num_groups)
+            expected = np.zeros((num_groups, num_groups), dtype=bool)
+            for more_important, less_important in pairs:
+                if more_important != less_important:
+                    expected[less_important, more_important] = True
+            for k in range(num_groups):
+                expected |= expected[:, k:k + 1] & expected[k:k + 1, :]
+            np.testing.assert_array_equal(core.importance_closure(group_of, num_groups, pairs), expected)
+
+    def test_t_ordering_matches_name_based_path(self):
+        result = self.model.t_ordering()
+        front = self.model.normalized_matrix[self.model.pareto_index]
+        names = list(self.model.criteria)
+        pairs = [(pref.criterion1.name, pref.criterion2.name, pref.equivalent) for pref in self.preferences]
+        groups, group_of = core.equivalent_groups(names, pairs)
+        closure = core.importance_closure(
+            group_of, len(groups), [(names.index(a), names.index(b)) for a, b, equivalent in pairs if not equivalent]
+        )
+        keep = core.t_ordering_mask(core.group_sums(front, group_of, len(groups)), closure)
+        np.testing.assert_array_equal(result, self.model.labels[self.model.pareto_index[keep]])
+
+    def test_batched_validation_reports_column(self):
+        data = dict(self.data)
+        data["f123"] = data["f123"] + 2
+        with self.assertRaisesRegex(ValueError, "f123"):
+            DecisionModel(self.criteria_list, data, self.preferences)
+
+    def test_summarized_output(self):
+        self.model.t_ordering()
+        text = str(self.model)
+        self.assertIn(f"(всего {self.num_criteria})", text)
+        self.assertLess(len(text.splitlines()), 300)
+        self.assertNotIn("f399", text)
+
+    def test_chain_transfer_matches_loop_kernel(self):
+        # Цепочки строгих предпочтений в обоих направлениях номеров групп
+        rng = np.random.default_rng(5)
+        loop = backends.get_backend("python")
+        for trial in range(200):
+            num_groups = int(rng.integers(2, 12))
+            closure = np.tri(num_groups, k=-1, dtype=bool)
+            if trial % 2:
+                closure = closure.T.copy()
+            order = core.transfer_order(closure)
+            w_sums = np.round(rng.random((40, num_groups)) * 2, 1)
+            for z_sums in (np.round(rng.random(num_groups) * 2, 1), np.round(rng.random((40, num_groups)) * 2, 1)):
+                np.testing.assert_array_equal(core.t_dominated_mask(z_sums, w_sums, closure, order),
+                                              loop.t_dominated_mask(z_sums, w_sums, closure, order))
+
+    def test_chain_of_thousands_of_criteria(self):
+        num_criteria = 3000
+        criteria_list = [Criterion(name=f"c{i}", absolute=True, maximize=True, min_value=0, max_value=1)
+                         for i in range(num_criteria)]
+        rng = np.random.default_rng(6)
+        data = {f"c{i}": np.round(rng.random(60), 2) for i in range(num_criteria)}
+        for step in (1, -1):
+            # Цепочка c0 > c1 > ... и обратная ей
+            pairs = [(criteria_list[i], criteria_list[i + 1]) for i in range(num_criteria - 1)]
+            preferences = [Preference(*pair[::step], equivalent=False) for pair in pairs]
+            model = DecisionModel(criteria_list, data, preferences)
+            self.assertEqual(core._chain_direction(model.importance_closure), step)
+            model.t_ordering()
+            # Оставшиеся альтернативы не t-доминируют друг над другом
+            survivors = np.searchsorted(model.pareto_index, model.pareto_t_index)
+            sums = model.front_sums[survivors]
+            for i in range(len(sums)):
+                dominated = core.t_dominated_mask(sums[i], sums, model.importance_closure)
+                self.assertFalse(dominated[np.arange(len(sums)) != i].any())
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,84 @@
+import contextlib
+import io
+import unittest
+from unittest import mock
+import numpy as np
+from t_ordering import Criterion, Preference, DecisionModel
+from t_ordering import core
+
+class TestIncrementalRenormalization(unittest.TestCase):
+    def setUp(self):
+        self.criteria_list = [
+            Criterion(name="price", absolute=True, maximize=False, min_value=0, max_value=100),
+            Criterion(name="speed", absolute=True, maximize=True, min_value=0, max_value=10),
+            Criterion(name="quality", absolute=False, maximize=True, valid_values=["low", "medium", "high"]),
+        ]
+        price, speed, quality = self.criteria_list
+        self.preferences = [Preference(price, speed, equivalent=False), Preference(speed, quality, equivalent=True)]
+        rng = np.random.default_rng(1)
+        self.data = {
+            "price": rng.integers(0, 100, 300).astype(float),
+            "speed": rng.integers(0, 10, 300).astype(float),
+            "quality": rng.choice(np.array(["low", "medium", "high"], dtype=object), 300),
+        }
+        self.output = contextlib.redirect_stdout(io.StringIO())
+        self.output.__enter__()
+        self.model = DecisionModel(self.criteria_list, self.data, self.preferences)
+        self.model.t_ordering()
+
+    def tearDown(self):
+        self.output.__exit__(None, None, None)
+
+    def count_calls(self, name):
+        return mock.patch.object(core, name, wraps=getattr(core, name))
+
+    def fresh_result(self, criterion):
+        criteria_list = [criterion if c.name == criterion.name else c for c in self.criteria_list]
+        return DecisionModel(criteria_list, self.data, self.preferences)
+
+    def test_bound_change_keeps_pareto_front(self):
+        pareto_index = self.model.pareto_index
+        criterion = Criterion(name="price", absolute=True, maximize=False, min_value=0, max_value=250)
+        with self.count_calls("pareto_front_mask") as pareto, self.count_calls("normalize_matrix") as normalize, \
+                self.count_calls("equivalent_group_of") as groups:
+            self.model.update_criterion(criterion)
+            result = self.model.t_ordering()
+        # Пересчитан только столбец цены; множество Парето и группы не пересчитывались
+        self.assertEqual((pareto.call_count, normalize.call_count, groups.call_count), (0, 0, 0))
+        self.assertIs(self.model.pareto_index, pareto_index)
+        self.assertIs(self.model.criteria["price"], criterion)
+
+        fresh = self.fresh_result(criterion)
+        np.testing.assert_allclose(self.model.normalized_matrix, fresh.normalized_matrix)
+        np.testing.assert_array_equal(result, fresh.t_ordering())
+
+    def test_extended_valid_values_keep_pareto_front(self):
+        pareto_index = self.model.pareto_index
+        criterion = Criterion(name="quality", absolute=False, maximize=True,
+                              valid_values=["poor", "low", "medium", "high", "premium"])
+        with self.count_calls("pareto_front_mask") as pareto:
+            self.model.update_criterion(criterion)
+            result = self.model.t_ordering()
+        self.assertEqual(pareto.call_count, 0)
+        self.assertIs(self.model.pareto_index, pareto_index)
+        np.testing.assert_array_equal(result, self.fresh_result(criterion).t_ordering())
+
+    def test_direction_change_recomputes_pareto_front(self):
+        criterion = Criterion(name="speed", absolute=True, maximize=False, min_value=0, max_value=10)
+        with self.count_calls("pareto_front_mask") as pareto:
+            self.model.update_criterion(criterion)
+            result = self.model.t_ordering()
+        self.assertEqual(pareto.call_count, 1)
+        fresh = self.fresh_result(criterion)
+        np.testing.assert_array_equal(self.model.pareto_index, fresh.pareto_index)
+        np.testing.assert_array_equal(result, fresh.t_ordering())
+
+    def test_invalid_update_is_rejected(self):
+        with self.assertRaises(ValueError):
+            self.model.update_criterion(Criterion(name="weight", absolute=True, maximize=True, min_value=0, max_value=1))
+        with self.assertRaises(ValueError):
+            self.model.update_criterion(Criterion(name="price", absolute=True, maximize=False, min_value=0, max_value=50))
+        self.assertEqual(self.model.criteria["price"].max_value, 100)
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,78 @@
+import contextlib
+import io
+import unittest
+from unittest import mock
+import numpy as np
+from t_ordering import Criterion, Preference, DecisionModel
+from t_ordering import core
+
+class TestLazyStages(unittest.TestCase):
+    def setUp(self):
+        self.criteria_list = [
+            Criterion(name=f"c{i}", absolute=True, maximize=True, min_value=0, max_value=1) for i in range(3)
+        ]
+        c0, c1, c2 = self.criteria_list
+        self.preferences = [Preference(c0, c1, equivalent=False)]
+        rng = np.random.default_rng(0)
+        self.data = {f"c{i}": np.round(rng.random(200), 1) for i in range(3)}
+        self.output = contextlib.redirect_stdout(io.StringIO())
+        self.output.__enter__()
+        self.model = DecisionModel(self.criteria_list, self.data, self.preferences)
+
+    def tearDown(self):
+        self.output.__exit__(None, None, None)
+
+    def count_calls(self, name):
+        return mock.patch.object(core, name, wraps=getattr(core, name))
+
+    def test_stages_run_on_first_access(self):
+        with self.count_calls("normalize_matrix") as normalize:
+            model = DecisionModel(self.criteria_list, self.data, self.preferences)
+            self.assertEqual(normalize.call_count, 0)
+            np.testing.assert_array_equal(model.pareto_index, np.flatnonzero(core.pareto_front_mask(model.normalized_matrix)))
+            self.assertEqual(normalize.call_count, 1)
+
+    def test_repeated_t_ordering_is_cached(self):
+        first = self.model.t_ordering()
+        with self.count_calls("t_ordering_mask") as t_mask, self.count_calls("pareto_front_mask") as pareto, \
+                self.count_calls("equivalent_group_of") as groups:
+            np.testing.assert_array_equal(self.model.t_ordering(), first)
+            self.model.compile()
+        self.assertEqual((t_mask.call_count, pareto.call_count, groups.call_count), (0, 0, 0))
+
+    def test_preferences_change_keeps_pareto_front(self):
+        self.model.t_ordering()
+        pareto_index = self.model.pareto_index
+        c0, c1, c2 = self.criteria_list
+        with self.count_calls("pareto_front_mask") as pareto, self.count_calls("equivalent_group_of") as groups:
+            self.model.preferences = [Preference(c0, c1, equivalent=False), Preference(c1, c2, equivalent=False)]
+            result = self.model.t_ordering()
+        self.assertEqual((pareto.call_count, groups.call_count), (0, 1))
+        self.assertIs(self.model.pareto_index, pareto_index)
+
+        expected = DecisionModel(self.criteria_list, self.data, self.model.preferences).t_ordering()
+        np.testing.assert_array_equal(result, expected)
+
+    def test_data_change_keeps_groups(self):
+        self.model.t_ordering()
+        closure = self.model.importance_closure
+        data = {name: values[::-1].copy() for name, values in self.data.items()}
+        with self.count_calls("equivalent_group_of") as groups:
+            self.model.update(alternatives=data)
+            result = self.model.t_ordering()
+        self.assertEqual(groups.call_count, 0)
+        self.assertIs(self.model.importance_closure, closure)
+        np.testing.assert_array_equal(result, DecisionModel(self.criteria_list, data, self.preferences).t_ordering())
+
+    def test_invalid_update_keeps_model(self):
+        pareto_t = self.model.t_ordering()
+        c0, c1, _ = self.criteria_list
+        with self.assertRaises(ValueError):
+            self.model.preferences = [Preference(c0, c1, equivalent=False), Preference(c1, c0, equivalent=False)]
+        self.assertEqual(len(self.model.preferences), 1)
+        with self.count_calls("t_ordering_mask") as t_mask:
+            np.testing.assert_array_equal(self.model.t_ordering(), pareto_t)
+        self.assertEqual(t_mask.call_count, 0)
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
@@ -0,0 +1,77 @@
+import os
+import tempfile
+import unittest
+from unittest import mock
+import numpy as np
+import pandas as pd
+from t_ordering import Criterion, Preference, DecisionModel
+from t_ordering.storage import save_arrays
+
+class TestModelStorage(unittest.TestCase):
+    def setUp(self):
+        # Данные из примера test_cycle_detection без цикла в предпочтениях
+        self.price_criterion = Criterion(name="Price", absolute=True, maximize=False, min_value=100, max_value=1000)
+        self.quality_criterion = Criterion(
+            name="Quality", absolute=False, maximize=True, valid_values=["low", "medium", "high"]
+        )
+        self.criterion_1 = Criterion(name="criterion1", absolute=True, maximize=True, min_value=0, max_value=10000)
+        self.criteria_list = [self.price_criterion, self.quality_criterion, self.criterion_1]
+
+        self.alternatives_df = pd.DataFrame(
+            {
+                "Alternative": ["Alternative A", "Alternative B", "Alternative C", "Alternative D"],
+                "Price": [500.0, 800.0, 300.0, 900.0],
+                "Quality": ["medium", "high", "low", "low"],
+                "criterion1": [100.0, 200.0, 300.0, 50.0],
+            }
+        ).set_index("Alternative")
+        self.preferences_list = [
+            Preference(criterion1=self.quality_criterion, criterion2=self.price_criterion, equivalent=False),
+            Preference(criterion1=self.price_criterion, criterion2=self.criterion_1, equivalent=True),
+        ]
+
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+        self.path = os.path.join(self.tmp.name, "model.npz")
+
+    def test_save_load_round_trip(self):
+        decision_model = DecisionModel(self.criteria_list, self.alternatives_df, self.preferences_list)
+        expected = decision_model.t_ordering()
+        decision_model.save(self.path)
+
+        loaded = DecisionModel.load(self.path)
+        # Загруженная модель уже скомпилирована: повторная нормализация невозможна и не нужна
+        with self.assertRaises(ValueError):
+            loaded.normalize_data()
+        np.testing.assert_array_equal(loaded.normalized_matrix, decision_model.normalized_matrix)
+        np.testing.assert_array_equal(loaded.pareto_index, decision_model.pareto_index)
+        self.assertEqual(loaded.groups, decision_model.groups)
+        self.assertEqual(loaded.group_importance_graph, decision_model.group_importance_graph)
+        pd.testing.assert_frame_equal(loaded.pareto_t, expected)
+        pd.testing.assert_frame_equal(loaded.t_ordering(), expected)
+
+    def test_saved_t_ordering_is_not_recomputed(self):
+        decision_model = DecisionModel(self.criteria_list, self.alternatives_df, self.preferences_list)
+        decision_model.t_ordering()
+        decision_model.save(self.path)
+        loaded = DecisionModel.load(self.path)
+        with mock.patch("t_ordering.core.t_ordering_mask") as t_ordering_mask:
+            np.testing.assert_array_equal(loaded.pareto_t_index, decision_model.pareto_t_index)
+            loaded.t_ordering()
+        t_ordering_mask.assert_not_called()
+
+    def test_load_without_mmap(self):
+        decision_model = DecisionModel(self.criteria_list, self.alternatives_df, self.preferences_list)
+        decision_model.save(self.path)
+        loaded = DecisionModel.load(self.path, mmap=False)
+        # t-упорядочение не было выполнено до сохранения и выполняется при первом обращении
+        np.testing.assert_array_equal(loaded.pareto_t_index, decision_model.pareto_t_index)
+        pd.testing.assert_frame_equal(loaded.t_ordering(), decision_model.t_ordering())
+
+    def test_unsupported_version(self):
+        save_arrays(self.path, {"normalized_matrix": np.zeros((1, 1))}, {"format": "t_ordering.DecisionModel", "version": 0})
+        with self.assertRaises(ValueError):
+            DecisionModel.load(self.path)
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
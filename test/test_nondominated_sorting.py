@@ -0,0 +1,42 @@
+import unittest
+import numpy as np
+from t_ordering import Criterion, DecisionModel
+from t_ordering import core
+
+class TestNondominatedSorting(unittest.TestCase):
+    def setUp(self):
+        rng = np.random.default_rng(1)
+        self.matrix = np.round(rng.random((400, 3)), 1)
+
+    def peel_ranks(self, matrix):
+        # Эталон: последовательное удаление фронтов Парето
+        ranks = np.zeros(len(matrix), dtype=np.int32)
+        rank = 1
+        while (ranks == 0).any():
+            remaining = np.flatnonzero(ranks == 0)
+            ranks[remaining[core.pareto_front_mask(matrix[remaining])]] = rank
+            rank += 1
+        return ranks
+
+    def test_methods_agree(self):
+        expected = self.peel_ranks(self.matrix)
+        np.testing.assert_array_equal(core.nondominated_ranks(self.matrix, "deb"), expected)
+        np.testing.assert_array_equal(core.nondominated_ranks(self.matrix, "ens"), expected)
+
+    def test_unknown_method(self):
+        with self.assertRaises(ValueError):
+            core.nondominated_ranks(self.matrix, "bubble")
+
+    def test_decision_model_front_ranks(self):
+        criteria_list = [
+            Criterion(name=f"c{i}", absolute=True, maximize=True, min_value=0, max_value=1) for i in range(3)
+        ]
+        decision_model = DecisionModel(criteria_list, {f"c{i}": self.matrix[:, i] for i in range(3)}, [])
+        ranks = decision_model.sort_fronts()
+        self.assertIs(ranks, decision_model.front_ranks)
+        self.assertEqual(ranks.dtype, np.int32)
+        np.testing.assert_array_equal(decision_model.pareto_index, np.flatnonzero(ranks == 1))
+        np.testing.assert_array_equal(decision_model.pareto_index, np.flatnonzero(core.pareto_front_mask(self.matrix)))
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
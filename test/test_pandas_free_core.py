@@ -0,0 +1,61 @@
+import subprocess
+import sys
+import unittest
+import numpy as np
+import pandas as pd
+from t_ordering import Criterion, Preference, DecisionModel
+
+class TestPandasFreeCore(unittest.TestCase):
+    def setUp(self):
+        # Данные из примера test_example_test_case_2
+        self.criteria_list = [
+            Criterion(name=f"criterion{i+1}", absolute=True, maximize=True, min_value=0, max_value=1)
+            for i in range(6)
+        ]
+        self.data = {
+            "Alternative": ["Alternative A", "Alternative B", "Alternative C", "Alternative D"],
+            "criterion1": [0.4, 0.2, 0.2, 0.2],
+            "criterion2": [0.6, 0.8, 0.7, 0.7],
+            "criterion3": [0.4, 0.4, 0.5, 0.4],
+            "criterion4": [0.2, 0.3, 0.3, 0.3],
+            "criterion5": [0.1, 0.2, 0.2, 0.2],
+            "criterion6": [0.7, 0.5, 0.5, 0.4],
+        }
+        self.preferences_list = [
+            Preference(criterion1=self.criteria_list[1], criterion2=self.criteria_list[2], equivalent=True),
+            Preference(criterion1=self.criteria_list[3], criterion2=self.criteria_list[4], equivalent=True),
+            Preference(criterion1=self.criteria_list[4], criterion2=self.criteria_list[5], equivalent=True),
+            Preference(criterion1=self.criteria_list[0], criterion2=self.criteria_list[2], equivalent=False),
+        ]
+
+    def test_dict_input_returns_arrays(self):
+        decision_model = DecisionModel(self.criteria_list, self.data, self.preferences_list, index="Alternative")
+        self.assertIsInstance(decision_model.normalized_alternatives, np.ndarray)
+        np.testing.assert_array_equal(
+            decision_model.find_pareto_front(), ["Alternative A", "Alternative B", "Alternative C"]
+        )
+        np.testing.assert_array_equal(decision_model.t_ordering(), ["Alternative A"])
+
+    def test_dict_and_frame_inputs_agree(self):
+        alternatives_df = pd.DataFrame(self.data).set_index("Alternative")
+        frame_model = DecisionModel(self.criteria_list, alternatives_df, self.preferences_list)
+        dict_model = DecisionModel(self.criteria_list, self.data, self.preferences_list, index="Alternative")
+        frame_model.t_ordering()
+        dict_model.t_ordering()
+        np.testing.assert_array_equal(frame_model.pareto_t.index, dict_model.pareto_t)
+        np.testing.assert_array_equal(frame_model.normalized_alternatives.values, dict_model.normalized_alternatives)
+
+    def test_import_does_not_load_pandas(self):
+        # Импорт пакета и решение задачи на словаре не должны загружать pandas
+        code = (
+            "import sys\n"
+            "from t_ordering import Criterion, DecisionModel\n"
+            "criterion = Criterion(name='c', absolute=True, maximize=True, min_value=0, max_value=1)\n"
+            "model = DecisionModel([criterion], {'c': [0.1, 0.5]}, [])\n"
+            "model.t_ordering()\n"
+            "assert 'pandas' not in sys.modules\n"
+        )
+        subprocess.run([sys.executable, "-c", code], check=True, capture_output=True)
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
@@ -0,0 +1,30 @@
+import unittest
+import numpy as np
+from t_ordering import Criterion, DecisionModel
+from t_ordering import core
+from t_ordering.parallel import parallel_pareto_front_mask
+
+class TestParallelPareto(unittest.TestCase):
+    def setUp(self):
+        rng = np.random.default_rng(0)
+        # Округление дает много совпадающих и доминируемых строк
+        self.matrix = np.round(rng.random((3000, 4)), 1)
+
+    def test_matches_serial_front(self):
+        expected = core.pareto_front_mask(self.matrix)
+        np.testing.assert_array_equal(parallel_pareto_front_mask(self.matrix, workers=2, partitions=5), expected)
+        np.testing.assert_array_equal(
+            parallel_pareto_front_mask(self.matrix, workers=2, partitions=5, tree_merge=True), expected
+        )
+
+    def test_decision_model_workers(self):
+        criteria_list = [
+            Criterion(name=f"c{i}", absolute=True, maximize=bool(i % 2), min_value=0, max_value=1) for i in range(4)
+        ]
+        data = {f"c{i}": self.matrix[:, i] for i in range(4)}
+        serial = DecisionModel(criteria_list, data, [])
+        parallel = DecisionModel(criteria_list, data, [])
+        np.testing.assert_array_equal(parallel.find_pareto_front(workers=2), serial.find_pareto_front())
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
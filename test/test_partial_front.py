@@ -0,0 +1,93 @@
+import contextlib
+import io
+import itertools
+import os
+import tempfile
+import unittest
+from concurrent.futures import ProcessPoolExecutor
+import numpy as np
+from t_ordering import Criterion, Preference, DecisionModel, PartialFront
+
+def make_criteria():
+    return [
+        Criterion(name=f"c{i}", absolute=True, maximize=bool(i % 2), min_value=0, max_value=1) for i in range(4)
+    ]
+
+def local_front(data, row_ids):
+    # Выполняется в отдельном процессе, как независимое задание над одной частью данных
+    return PartialFront.from_alternatives(make_criteria(), data, index=row_ids).to_bytes()
+
+class TestPartialFront(unittest.TestCase):
+    def setUp(self):
+        rng = np.random.default_rng(0)
+        self.matrix = np.round(rng.random((2000, 4)), 1)
+        self.data = {f"c{i}": self.matrix[:, i] for i in range(4)}
+        self.bounds = np.linspace(0, len(self.matrix), 5).astype(int)
+        with contextlib.redirect_stdout(io.StringIO()):
+            self.model = DecisionModel(make_criteria(), self.data, [])
+            self.model.find_pareto_front()
+
+    def partitions(self):
+        for start, stop in zip(self.bounds[:-1], self.bounds[1:]):
+            yield {name: values[start:stop] for name, values in self.data.items()}, np.arange(start, stop)
+
+    def test_merge_in_any_order(self):
+        with ProcessPoolExecutor(max_workers=2) as executor:
+            payloads = list(executor.map(local_front, *zip(*self.partitions())))
+        parts = [PartialFront.from_bytes(payload) for payload in payloads]
+        expected = self.model.labels[self.model.pareto_index]
+
+        for permutation in itertools.permutations(parts):
+            merged = PartialFront.merge_all(permutation)
+            np.testing.assert_array_equal(merged.row_ids, expected)
+        # Ассоциативность: разная группировка дает одинаковый результат
+        left = (parts[0] | parts[1]) | (parts[2] | parts[3])
+        right = parts[0] | (parts[1] | (parts[2] | parts[3]))
+        np.testing.assert_array_equal(left.row_ids, right.row_ids)
+        np.testing.assert_array_equal(left.values, right.values)
+        # Повторное объединение с уже учтенной частью ничего не меняет
+        np.testing.assert_array_equal((left | parts[2]).row_ids, left.row_ids)
+
+    def test_t_ordering_matches_model(self):
+        criteria_list = make_criteria()
+        criteria = {criterion.name: criterion for criterion in criteria_list}
+        preferences = [
+            Preference(criteria["c0"], criteria["c1"], equivalent=False),
+            Preference(criteria["c2"], criteria["c3"], equivalent=True),
+        ]
+        merged = PartialFront.merge_all(
+            PartialFront.from_alternatives(criteria_list, data, index=row_ids) for data, row_ids in self.partitions()
+        )
+        with contextlib.redirect_stdout(io.StringIO()):
+            model = DecisionModel(criteria_list, self.data, preferences)
+            model.find_pareto_front()
+            expected = model.t_ordering()
+        np.testing.assert_array_equal(merged.t_ordering(preferences), expected)
+
+    def test_save_and_load(self):
+        part = PartialFront.from_model(self.model)
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "part.npz")
+            part.save(path)
+            loaded = PartialFront.load(path)
+            np.testing.assert_array_equal(loaded.values, part.values)
+            np.testing.assert_array_equal(loaded.row_ids, part.row_ids)
+            self.assertEqual(loaded.fingerprint, part.fingerprint)
+            del loaded
+
+    def test_string_row_ids(self):
+        data = {"c0": [0.2, 0.8], "c1": [0.5, 0.5], "c2": [0.1, 0.1], "c3": [0.3, 0.3]}
+        part = PartialFront.from_alternatives(make_criteria(), data, index=np.array(["b", "a"], dtype=object))
+        restored = PartialFront.from_bytes(part.to_bytes())
+        self.assertEqual(list(restored.row_ids), list(part.row_ids))
+
+    def test_different_criteria_rejected(self):
+        part = PartialFront.from_model(self.model)
+        other_criteria = make_criteria()
+        other_criteria[0] = Criterion(name="c0", absolute=True, maximize=False, min_value=0, max_value=10)
+        other = PartialFront(other_criteria, part.values, part.row_ids)
+        with self.assertRaises(ValueError):
+            part.merge(other)
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
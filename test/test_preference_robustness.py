@@ -0,0 +1,86 @@
+import contextlib
+import io
+import unittest
+import numpy as np
+from t_ordering import Criterion, Preference, DecisionModel
+from t_ordering import robustness
+
+class TestPreferenceRobustness(unittest.TestCase):
+    def setUp(self):
+        self.criteria_list = [
+            Criterion(name=f"c{i}", absolute=True, maximize=True, min_value=0, max_value=1) for i in range(4)
+        ]
+        c0, c1, c2, c3 = self.criteria_list
+        self.preferences = [
+            Preference(c0, c1, equivalent=False),
+            Preference(c1, c2, equivalent=True),
+            Preference(c2, c3, equivalent=False),
+        ]
+        rng = np.random.default_rng(0)
+        self.data = {f"c{i}": np.round(rng.random(400), 1) for i in range(4)}
+        with contextlib.redirect_stdout(io.StringIO()):
+            self.model = DecisionModel(self.criteria_list, self.data, self.preferences)
+
+    def brute_force(self, variants):
+        # Отдельная модель на каждый вариант предпочтений
+        counts = {}
+        valid = 0
+        for variant in variants:
+            preferences = []
+            for pref, kind in zip(self.preferences, variant):
+                if kind == robustness.KEEP:
+                    preferences.append(pref)
+                elif kind == robustness.FLIP:
+                    preferences.append(Preference(pref.criterion1, pref.criterion2, equivalent=not pref.equivalent))
+            try:
+                with contextlib.redirect_stdout(io.StringIO()):
+                    survivors = DecisionModel(self.criteria_list, self.data, preferences).t_ordering()
+            except ValueError:
+                continue
+            valid += 1
+            for label in survivors:
+                counts[label] = counts.get(label, 0) + 1
+        return {label: counts.get(label, 0) / valid for label in self.model.labels[self.model.pareto_index]}
+
+    def test_enumerated_variants_match_separate_models(self):
+        variants = robustness.enumerate_variants(len(self.preferences), max_changes=2)
+        self.assertEqual(len(variants), 1 + 3 * 2 + 3 * 4)
+        with contextlib.redirect_stdout(io.StringIO()):
+            report = self.model.preference_robustness(max_changes=2)
+        self.assertEqual(report.num_variants + report.num_invalid, len(variants))
+        expected = self.brute_force(variants)
+        for label, share in report.as_dict().items():
+            self.assertAlmostEqual(share, expected[label])
+        np.testing.assert_array_equal(report.labels[report.baseline], self.model.t_ordering())
+
+    def test_parallel_sampling(self):
+        with contextlib.redirect_stdout(io.StringIO()):
+            serial = self.model.preference_robustness(samples=200, seed=1)
+            parallel = self.model.preference_robustness(samples=200, seed=1, workers=2)
+        np.testing.assert_array_equal(serial.survival, parallel.survival)
+        self.assertEqual(serial.num_variants + serial.num_invalid, 200)
+        self.assertTrue(np.all((serial.survival >= 0) & (serial.survival <= 1)))
+
+    def test_same_closure_is_evaluated_once(self):
+        # Предпочтение c0 > c2 следует из двух других, его удаление не меняет замыкания
+        pairs = [("c0", "c1", False), ("c1", "c2", False), ("c0", "c2", False)]
+        variants = robustness.enumerate_variants(len(pairs), changes=(robustness.DROP,))
+        front = self.model.normalized_matrix[self.model.pareto_index]
+        report = robustness.preference_robustness(front, self.model.pareto_index, list(self.model.criteria),
+                                                  pairs, variants)
+        self.assertEqual((report.num_variants, report.num_unique), (4, 3))
+
+    def test_cycles_are_counted_as_invalid(self):
+        # Замена второго предпочтения эквивалентностью дает цикл c0 > c1 = c0
+        pairs = [("c0", "c1", False), ("c0", "c1", False)]
+        variants = [(robustness.KEEP, robustness.FLIP), (robustness.KEEP, robustness.KEEP)]
+        front = self.model.normalized_matrix[self.model.pareto_index]
+        report = robustness.preference_robustness(front, self.model.pareto_index, list(self.model.criteria),
+                                                  pairs, variants)
+        self.assertEqual((report.num_variants, report.num_invalid), (1, 1))
+        with self.assertRaises(ValueError):
+            robustness.preference_robustness(front, self.model.pareto_index, list(self.model.criteria),
+                                             [("c0", "c1", False), ("c1", "c0", True)], variants)
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
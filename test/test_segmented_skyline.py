@@ -0,0 +1,65 @@
+import contextlib
+import io
+import unittest
+import numpy as np
+import pandas as pd
+from t_ordering import Criterion, Preference, DecisionModel
+from t_ordering import segments
+
+class TestSegmentedSkyline(unittest.TestCase):
+    def setUp(self):
+        self.criteria_list = [
+            Criterion(name="price", absolute=True, maximize=False, min_value=0, max_value=100),
+            Criterion(name="rating", absolute=True, maximize=True, min_value=0, max_value=5),
+            Criterion(name="quality", absolute=False, maximize=True, valid_values=["low", "medium", "high"]),
+        ]
+        price, rating, quality = self.criteria_list
+        self.preferences = [Preference(price, rating, equivalent=False), Preference(rating, quality, equivalent=True)]
+        rng = np.random.default_rng(6)
+        n = 600
+        self.frame = pd.DataFrame({
+            "price": rng.integers(0, 100, n),
+            "rating": rng.integers(0, 6, n),
+            "quality": rng.choice(["low", "medium", "high"], n),
+            # Много маленьких сегментов и один большой
+            "region": np.where(rng.random(n) < 0.5, "big", rng.integers(0, 60, n).astype(str)),
+        }, index=[f"item{i}" for i in range(n)])
+        self.output = contextlib.redirect_stdout(io.StringIO())
+        self.output.__enter__()
+        self.model = DecisionModel(self.criteria_list, self.frame, self.preferences)
+
+    def tearDown(self):
+        self.output.__exit__(None, None, None)
+
+    def test_matches_model_per_segment(self):
+        result = self.model.t_ordering(segment_by="region")
+        self.assertEqual(len(result), self.frame["region"].nunique())
+        for region, part in self.frame.groupby("region"):
+            rows = np.flatnonzero((self.frame["region"] == region).to_numpy())
+            expected = DecisionModel(self.criteria_list, part, self.preferences)
+            expected.t_ordering()
+            np.testing.assert_array_equal(rows[expected.pareto_index], result.pareto(region))
+            np.testing.assert_array_equal(rows[expected.pareto_t_index], result.pareto_t(region))
+        self.assertEqual(set(result.as_dict()), set(self.frame["region"]))
+
+    def test_model_results_are_unchanged(self):
+        expected = self.model.t_ordering()
+        self.model.t_ordering(segment_by=self.frame["region"].to_numpy())
+        pd.testing.assert_frame_equal(self.model.pareto_t, expected)
+
+    def test_single_segment_equals_whole_catalog(self):
+        result = self.model.t_ordering(segment_by=np.zeros(len(self.frame), dtype=int))
+        self.model.t_ordering()
+        np.testing.assert_array_equal(result.pareto(0), self.model.pareto_index)
+        np.testing.assert_array_equal(result.pareto_t(0), self.model.pareto_t_index)
+
+    def test_segment_codes(self):
+        keys, codes = segments.segment_codes(np.array(["b", None, "a", "b"], dtype=object))
+        self.assertEqual(keys[codes].tolist(), ["b", None, "a", "b"])
+        with self.assertRaises(ValueError):
+            self.model.t_ordering(segment_by="missing")
+        with self.assertRaises(ValueError):
+            self.model.t_ordering(segment_by=[1, 2])
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,102 @@
+import contextlib
+import io
+import itertools
+import unittest
+import numpy as np
+from t_ordering import Criterion, Preference, DecisionModel, Skycube
+from t_ordering import core
+
+class TestSkycube(unittest.TestCase):
+    def setUp(self):
+        self.criteria_list = [
+            Criterion(name=f"c{i}", absolute=True, maximize=True, min_value=0, max_value=1) for i in range(5)
+        ]
+        c0, c1, c2, c3, c4 = self.criteria_list
+        self.preferences = [Preference(c0, c1, equivalent=False), Preference(c1, c2, equivalent=False),
+                            Preference(c3, c4, equivalent=True)]
+        rng = np.random.default_rng(11)
+        # Округление дает совпадающие значения, при которых множества Парето подпространств не вложены
+        self.data = {"id": np.arange(2000), **{f"c{i}": np.round(rng.random(2000), 1) for i in range(5)}}
+        self.output = contextlib.redirect_stdout(io.StringIO())
+        self.output.__enter__()
+        self.model = DecisionModel(self.criteria_list, self.data, self.preferences, index="id")
+
+    def tearDown(self):
+        self.output.__exit__(None, None, None)
+
+    def reduced_model(self, names):
+        criteria = [criterion for criterion in self.criteria_list if criterion.name in names]
+        preferences = [pref for pref in self.preferences
+                       if pref.criterion1.name in names and pref.criterion2.name in names]
+        columns = {"id": self.data["id"], **{name: self.data[name] for name in names}}
+        return DecisionModel(criteria, columns, preferences, index="id")
+
+    def test_all_subspaces_match_reduced_models(self):
+        skycube = self.model.skycube()
+        self.assertIsInstance(skycube, Skycube)
+        names = [criterion.name for criterion in self.criteria_list]
+        # Дважды: первый раз подпространства вычисляются, второй — читаются из куба
+        for _ in range(2):
+            for size in range(len(names), 0, -1):
+                for subset in itertools.combinations(names, size):
+                    reduced = self.reduced_model(subset)
+                    np.testing.assert_array_equal(skycube.pareto_index(subset), reduced.pareto_index)
+                    np.testing.assert_array_equal(skycube.t_ordering(subset), reduced.t_ordering())
+        self.assertEqual(skycube.misses, 2 ** len(names) - 2)
+        # Каждый запрос t_ordering после pareto_index — попадание
+        self.assertEqual(skycube.hits, 3 * (2 ** len(names) - 2))
+
+    def test_subspace_uses_materialized_superspace(self):
+        skycube = self.model.skycube()
+        skycube.materialize([["c0", "c1", "c2"]])
+        self.assertEqual(skycube.materialized, [("c0", "c1", "c2")])
+        candidates = skycube._candidates(skycube._key(["c0", "c2"]))
+        self.assertLess(len(candidates), len(skycube._root.candidates))
+        # Множество Парето подпространства содержится в расширенном множестве надпространства
+        self.assertTrue(np.isin(skycube.pareto_index(["c2", "c0"]), candidates).all())
+
+    def test_query_preferences(self):
+        skycube = self.model.skycube()
+        c0, c1, c2, c3, c4 = self.criteria_list
+        preferences = [Preference(c2, c0, equivalent=True)]
+        expected = DecisionModel([c0, c2], {"id": self.data["id"], "c0": self.data["c0"], "c2": self.data["c2"]},
+                                 preferences, index="id").t_ordering()
+        np.testing.assert_array_equal(skycube.t_ordering([c0, c2], preferences), expected)
+        with self.assertRaises(ValueError):
+            skycube.t_ordering([c0, c2], [Preference(c0, c1, equivalent=False)])
+        with self.assertRaises(ValueError):
+            skycube.pareto_index(["c9"])
+        with self.assertRaises(ValueError):
+            skycube.pareto_index([])
+
+    def test_memory_budget_and_popularity(self):
+        skycube = self.model.skycube(materialize_after=2)
+        skycube.pareto_index(["c0", "c1"])
+        self.assertEqual(len(skycube), 0)
+        skycube.pareto_index(["c0", "c1"])
+        self.assertEqual(skycube.materialized, [("c0", "c1")])
+
+        # Бюджет вмещает одно подпространство: остается более популярное
+        sizes = [self.model.skycube().materialize([subset]).memory_bytes
+                 for subset in (["c0", "c1"], ["c2", "c3"], ["c0", "c4"])]
+        skycube.max_bytes = max(sizes)
+        self.assertLess(skycube.max_bytes, min(sizes) * 2)
+        for _ in range(3):
+            skycube.pareto_index(["c2", "c3"])
+        self.assertEqual(skycube.materialized, [("c2", "c3")])
+        for _ in range(2):
+            skycube.pareto_index(["c0", "c4"])
+        self.assertEqual(skycube.materialized, [("c2", "c3")])
+        self.assertLessEqual(skycube.memory_bytes, skycube.max_bytes)
+        # Результаты не зависят от материализации
+        np.testing.assert_array_equal(skycube.pareto_index(["c0", "c4"]), self.reduced_model(["c0", "c4"]).pareto_index)
+
+    def test_extended_pareto_mask(self):
+        rng = np.random.default_rng(3)
+        matrix = np.round(rng.random((400, 3)), 1)
+        expected = np.array([not (matrix > row).all(axis=1).any() for row in matrix])
+        np.testing.assert_array_equal(core.extended_pareto_mask(matrix, block_size=64), expected)
+        self.assertTrue(expected[core.pareto_front_mask(matrix)].all())
+
+if __name__ == "__main__":
+    unittest.main()
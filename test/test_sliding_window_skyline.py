@@ -0,0 +1,72 @@
+import io
+import unittest
+from contextlib import redirect_stdout
+import numpy as np
+from t_ordering import Criterion, Preference, DecisionModel, SlidingWindowSkyline
+
+class TestSlidingWindowSkyline(unittest.TestCase):
+    def setUp(self):
+        self.criteria_list = [
+            Criterion(name="Price", absolute=True, maximize=False, min_value=0, max_value=10),
+            Criterion(name="Quality", absolute=False, maximize=True, valid_values=["low", "medium", "high"]),
+            Criterion(name="Rating", absolute=True, maximize=True, min_value=0, max_value=10),
+        ]
+        self.preferences_list = [
+            Preference(criterion1=self.criteria_list[1], criterion2=self.criteria_list[0], equivalent=False),
+        ]
+        rng = np.random.default_rng(4)
+        self.events = [
+            (
+                f"offer{i}",
+                {
+                    "Price": int(rng.integers(0, 11)),
+                    "Quality": str(rng.choice(["low", "medium", "high"])),
+                    "Rating": int(rng.integers(0, 11)),
+                },
+                float(i),
+                float(rng.integers(1, 30)),
+            )
+            for i in range(300)
+        ]
+
+    def window_model(self, window):
+        data = {name: [values[name] for _, values, _, _ in window] for name in ("Price", "Quality", "Rating")}
+        data["Price"] = np.asarray(data["Price"], dtype=float)
+        data["Rating"] = np.asarray(data["Rating"], dtype=float)
+        data["Quality"] = np.asarray(data["Quality"], dtype=object)
+        with redirect_stdout(io.StringIO()):
+            decision_model = DecisionModel(
+                self.criteria_list, data, self.preferences_list, index=[label for label, _, _, _ in window]
+            )
+            decision_model.t_ordering()
+        return decision_model
+
+    def test_matches_recomputed_window(self):
+        skyline = SlidingWindowSkyline(self.criteria_list, self.preferences_list)
+        for step, (label, values, timestamp, ttl) in enumerate(self.events):
+            skyline.insert(label, values, timestamp, ttl=ttl)
+            window = [event for event in self.events[:step + 1] if event[2] + event[3] > timestamp]
+            decision_model = self.window_model(window)
+            self.assertEqual(skyline.pareto_front, list(decision_model.pareto_front))
+            self.assertEqual(skyline.t_ordering(), list(decision_model.pareto_t))
+        # Хранятся только кандидаты, а не все окно
+        self.assertLess(len(skyline), len(window))
+
+    def test_expire_promotes_candidates(self):
+        skyline = SlidingWindowSkyline(self.criteria_list, ttl=10)
+        skyline.insert("best", {"Price": 1, "Quality": "high", "Rating": 9}, timestamp=0, ttl=5)
+        skyline.insert("good", {"Price": 2, "Quality": "high", "Rating": 8}, timestamp=1)
+        skyline.insert("worse", {"Price": 3, "Quality": "medium", "Rating": 7}, timestamp=2, ttl=3)
+        # "worse" доминирует "good", который действует дольше, поэтому "worse" отброшен
+        self.assertEqual(len(skyline), 2)
+        self.assertEqual(skyline.pareto_front, ["best"])
+        skyline.expire(5)
+        self.assertEqual(skyline.pareto_front, ["good"])
+
+    def test_missing_ttl(self):
+        skyline = SlidingWindowSkyline(self.criteria_list)
+        with self.assertRaises(ValueError):
+            skyline.insert("offer", {"Price": 1, "Quality": "high", "Rating": 9}, timestamp=0)
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
@@ -0,0 +1,86 @@
+import contextlib
+import io
+import unittest
+import numpy as np
+from t_ordering import Criterion, Preference, DecisionModel
+from t_ordering import core
+
+class TestWeightedRanking(unittest.TestCase):
+    def setUp(self):
+        self.criteria_list = [
+            Criterion(name=f"c{i}", absolute=True, maximize=True, min_value=0, max_value=1) for i in range(4)
+        ]
+        c0, c1, c2, c3 = self.criteria_list
+        self.preferences = [
+            Preference(c0, c1, equivalent=False),
+            Preference(c1, c2, equivalent=True),
+            Preference(c2, c3, equivalent=False),
+        ]
+        rng = np.random.default_rng(0)
+        self.data = {f"c{i}": np.round(rng.random(3000), 2) for i in range(4)}
+        with contextlib.redirect_stdout(io.StringIO()):
+            self.model = DecisionModel(self.criteria_list, self.data, self.preferences)
+            self.model.compile()
+
+    def test_top_k_matches_full_sort(self):
+        scores = np.round(np.random.default_rng(1).random(10000), 2)  # много равных значений
+        for k in (0, 1, 10, 500, 10000, 20000):
+            np.testing.assert_array_equal(core.top_k(scores, k), np.argsort(-scores, kind="stable")[:k])
+
+    def test_preference_weights(self):
+        weights = self.model.criterion_weights()
+        self.assertAlmostEqual(weights.sum(), 1.0)
+        self.assertEqual(weights[1], weights[2])
+        self.assertGreater(weights[0], weights[1])
+        self.assertGreater(weights[1], weights[3])
+
+    def test_scores_respect_t_dominance(self):
+        matrix = self.model.normalized_matrix[:300]
+        sums = core.group_sums(matrix, self.model.group_of, len(self.model.groups))
+        scores = core.weighted_scores(matrix, self.model.criterion_weights())
+        for i in range(len(matrix)):
+            dominated = core.t_dominated_mask(sums[i], sums, self.model.importance_closure)
+            self.assertTrue(np.all(scores[i] > scores[dominated] - 1e-12))
+
+    def test_explicit_weights(self):
+        criteria_list = [
+            Criterion(name=c.name, absolute=True, maximize=True, min_value=0, max_value=1, weight=i + 1)
+            for i, c in enumerate(self.criteria_list)
+        ]
+        with contextlib.redirect_stdout(io.StringIO()):
+            model = DecisionModel(criteria_list, self.data, [])
+        np.testing.assert_allclose(model.criterion_weights(), np.arange(1, 5) / 10)
+        expected = np.argsort(-(model.normalized_matrix @ (np.arange(1, 5) / 10)), kind="stable")[:5]
+        np.testing.assert_array_equal(model.top_k(5), model.labels[expected])
+        np.testing.assert_allclose(model.criterion_weights({"c0": 1}), [1, 0, 0, 0])
+        self.assertEqual(Criterion.from_dict(criteria_list[2].to_dict()).weight, 3)
+
+        criteria_list[0].weight = None
+        with self.assertRaises(ValueError):
+            model.criterion_weights()
+        with self.assertRaises(ValueError):
+            model.criterion_weights({"unknown": 1})
+
+    def test_top_k_among_front(self):
+        top = self.model.top_k(3, among="pareto")
+        self.assertTrue(set(top) <= set(self.model.labels[self.model.pareto_index]))
+        with self.assertRaises(ValueError):
+            self.model.top_k(3, among="everything")
+
+    def test_score_presort(self):
+        matrix = self.model.normalized_matrix
+        scores = core.weighted_scores(matrix, self.model.criterion_weights())
+        np.testing.assert_array_equal(core.pareto_front_mask(matrix, key=scores), core.pareto_front_mask(matrix))
+        with contextlib.redirect_stdout(io.StringIO()):
+            front = self.model.find_pareto_front(method="sfs", presort="score")
+        np.testing.assert_array_equal(front, self.model.labels[np.flatnonzero(core.pareto_front_mask(matrix))])
+
+        sums = core.group_sums(matrix[self.model.pareto_index], self.model.group_of, len(self.model.groups))
+        front_scores = core.weighted_scores(matrix[self.model.pareto_index], self.model.criterion_weights())
+        np.testing.assert_array_equal(
+            core.t_ordering_mask(sums, self.model.importance_closure, core.score_order(front_scores)),
+            core.t_ordering_mask(sums, self.model.importance_closure),
+        )
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)